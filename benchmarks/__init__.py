@@ -0,0 +1,5 @@
+"""
+Micro-benchmarks for the gamepp patterns.
+
+Each module is runnable on its own, e.g. ``python -m benchmarks.object_pool``.
+"""
@@ -0,0 +1,342 @@
+"""
+Benchmark suite for the data_locality particle system implementations.
+
+Compares ParticleSystem (sparse and dense), ParticleSystemAoS,
+VectorizedParticleSystem (array and NumPy backends), ParallelParticleSystem
+and a particle schema stored in a SoAStore on:
+
+* update throughput: mean wall time of one update() over all live particles;
+* memory footprint: bytes allocated to build and fill the system, as seen by
+  tracemalloc (NumPy and array.array buffers are included, shared memory
+  blocks are not);
+* add/remove cost: mean time of one remove_particle() and one add_particle()
+  while churning a sample of random particles in a full system.
+
+Results are printed as a table and can be written as JSON with --json, and
+compared against an earlier JSON run with --baseline to catch regressions
+(the exit status is 1 if any metric got worse by more than --tolerance).
+
+Run with: python -m benchmarks.data_locality --sizes 1000 10000 100000 1000000
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from typing import Callable, Dict, List, Optional
+
+from gamepp.patterns.data_locality import (
+    ParallelParticleSystem,
+    ParticleAoS,
+    ParticleSystem,
+    ParticleSystemAoS,
+    SoAStore,
+    VectorizedParticleSystem,
+    np,
+)
+
+# Metrics compared against a baseline; lower is better for all of them.
+METRICS = ("update_ms", "memory_bytes", "add_us", "remove_us")
+
+
+class SoAStoreParticles:
+    """
+    Particles kept in a SoAStore, driven through the particle system API
+    used by this benchmark. Updates integrate the live column views.
+    """
+
+    def __init__(self, max_particles: int, use_numpy: bool | None = None):
+        self.store = SoAStore(
+            {"pos_x": "d", "pos_y": "d", "vel_x": "d", "vel_y": "d"},
+            max_particles,
+            use_numpy=use_numpy,
+        )
+
+    def add_particle(self, pos_x, pos_y, vel_x, vel_y):
+        return self.store.add(pos_x=pos_x, pos_y=pos_y, vel_x=vel_x, vel_y=vel_y)
+
+    def add_particles(self, pos_x, pos_y, vel_x, vel_y):
+        return len(self.store.add_many(pos_x=pos_x, pos_y=pos_y, vel_x=vel_x, vel_y=vel_y))
+
+    def remove_particle(self, particle_id):
+        self.store.remove(particle_id)
+
+    def update(self, dt):
+        store = self.store
+        for pos_name, vel_name in (("pos_x", "vel_x"), ("pos_y", "vel_y")):
+            pos, vel = store.column(pos_name), store.column(vel_name)
+            if store.use_numpy:
+                pos += vel * dt
+            else:
+                pos[:] = array("d", [p + v * dt for p, v in zip(pos, vel)])
+
+    def get_active_particles_data(self):
+        return [{"id": int(handle)} for handle in self.store.ids()]
+
+
+def make_backends() -> List[tuple[str, Callable[[int], object]]]:
+    backends: List[tuple[str, Callable[[int], object]]] = [
+        ("ParticleSystem", ParticleSystem),
+        ("ParticleSystem[dense]", lambda n: ParticleSystem(n, dense=True)),
+        ("ParticleSystemAoS", ParticleSystemAoS),
+        (
+            "Vectorized[array]",
+            lambda n: VectorizedParticleSystem(n, use_numpy=False),
+        ),
+        (
+            "Vectorized[array,dense]",
+            lambda n: VectorizedParticleSystem(n, use_numpy=False, dense=True),
+        ),
+        ("SoAStore[array]", lambda n: SoAStoreParticles(n, use_numpy=False)),
+    ]
+    if np is not None:
+        backends.append(
+            ("Vectorized[numpy]", lambda n: VectorizedParticleSystem(n, use_numpy=True))
+        )
+        backends.append(
+            (
+                "Vectorized[numpy,dense]",
+                lambda n: VectorizedParticleSystem(n, use_numpy=True, dense=True),
+            )
+        )
+        backends.append(("SoAStore[numpy]", lambda n: SoAStoreParticles(n, use_numpy=True)))
+        # Below min_parallel_particles slots the update runs in this process.
+        backends.append(("Parallel", ParallelParticleSystem))
+        backends.append(
+            ("Parallel[dense]", lambda n: ParallelParticleSystem(n, dense=True))
+        )
+    return backends
+
+
+def close(system) -> None:
+    """Stops the worker processes of systems that have them."""
+    if hasattr(system, "close"):
+        system.close()
+
+
+def random_particle(rng: random.Random) -> tuple[float, float, float, float]:
+    return (
+        rng.uniform(-100, 100),
+        rng.uniform(-100, 100),
+        rng.uniform(-5, 5),
+        rng.uniform(-5, 5),
+    )
+
+
+def fill(system, count: int, seed: int = 0) -> None:
+    """
+    Adds `count` random particles. ParticleSystemAoS scans for a free slot on
+    every add, so it is filled slot by slot directly to keep setup linear.
+    """
+    rng = random.Random(seed)
+    particles = [random_particle(rng) for _ in range(count)]
+    if isinstance(system, ParticleSystemAoS):
+        for i, particle in enumerate(particles):
+            system.particles[i] = ParticleAoS(*particle)
+        system.num_active_particles += count
+    else:
+        system.add_particles(*(list(column) for column in zip(*particles)))
+
+
+def measure_memory(factory: Callable[[int], object], size: int, live: int) -> int:
+    """Returns the bytes still allocated after building and filling a system."""
+    tracemalloc.start()
+    try:
+        system = factory(size)
+        fill(system, live)
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    close(system)
+    del system
+    return allocated
+
+
+def time_updates(system, steps: int, dt: float = 1 / 60) -> float:
+    """Returns the mean wall time of one update, in seconds."""
+    system.update(dt)  # Warm up
+    start = time.perf_counter()
+    for _ in range(steps):
+        system.update(dt)
+    return (time.perf_counter() - start) / steps
+
+
+def time_churn(system, live: int, samples: int, seed: int = 1) -> tuple[float, float]:
+    """
+    Removes `samples` random live particles one at a time, then adds as many
+    back. Returns the mean (remove, add) wall time of one call, in seconds.
+    """
+    rng = random.Random(seed)
+    if isinstance(system, ParticleSystemAoS):
+        ids = list(range(live))
+    else:
+        ids = [particle["id"] for particle in system.get_active_particles_data()]
+    victims = rng.sample(ids, min(samples, len(ids)))
+    particles = [random_particle(rng) for _ in victims]
+
+    start = time.perf_counter()
+    for particle_id in victims:
+        system.remove_particle(particle_id)
+    remove_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for particle in particles:
+        system.add_particle(*particle)
+    add_time = time.perf_counter() - start
+    return remove_time / len(victims), add_time / len(victims)
+
+
+def run_benchmark(
+    name: str,
+    factory: Callable[[int], object],
+    size: int,
+    live: int,
+    steps: int,
+    churn: int,
+) -> Dict[str, object]:
+    memory = measure_memory(factory, size, live)
+    system = factory(size)
+    fill(system, live)
+    try:
+        per_update = time_updates(system, steps)
+        remove_time, add_time = time_churn(system, live, churn)
+    finally:
+        close(system)
+    return {
+        "backend": name,
+        "particles": size,
+        "live": live,
+        "update_ms": per_update * 1000,
+        "mparticles_per_s": live / per_update / 1e6,
+        "memory_bytes": memory,
+        "bytes_per_particle": memory / size,
+        "add_us": add_time * 1e6,
+        "remove_us": remove_time * 1e6,
+    }
+
+
+def environment() -> Dict[str, Optional[str]]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "numpy": np.__version__ if np is not None else None,
+    }
+
+
+def find_regressions(
+    results: List[Dict[str, object]],
+    baseline: List[Dict[str, object]],
+    tolerance: float,
+) -> List[str]:
+    """
+    Returns a description of every metric that is more than `tolerance`
+    (a fraction, e.g. 0.2 for 20%) worse than in the baseline run.
+    """
+    previous = {(row["backend"], row["particles"]): row for row in baseline}
+    regressions = []
+    for row in results:
+        old = previous.get((row["backend"], row["particles"]))
+        if old is None:
+            continue
+        for metric in METRICS:
+            if metric in old and old[metric] > 0:
+                ratio = row[metric] / old[metric]
+                if ratio > 1 + tolerance:
+                    regressions.append(
+                        f"{row['backend']} @ {row['particles']}: {metric} "
+                        f"{old[metric]:.4g} -> {row[metric]:.4g} ({ratio:.2f}x)"
+                    )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--steps", type=int, default=20)
+    parser.add_argument(
+        "--active-fraction",
+        type=float,
+        default=1.0,
+        help="Fraction of capacity holding live particles.",
+    )
+    parser.add_argument(
+        "--churn",
+        type=int,
+        default=1000,
+        help="Number of particles removed and re-added to time add/remove.",
+    )
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        help="Only run backends whose name contains one of these strings.",
+    )
+    parser.add_argument(
+        "--json", metavar="PATH", help="Write the results as JSON ('-' for stdout)."
+    )
+    parser.add_argument(
+        "--baseline", metavar="PATH", help="JSON results of an earlier run to compare with."
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown or growth against --baseline, as a fraction.",
+    )
+    args = parser.parse_args(argv)
+
+    backends = make_backends()
+    if args.backends:
+        backends = [
+            (name, factory)
+            for name, factory in backends
+            if any(wanted in name for wanted in args.backends)
+        ]
+
+    # The table goes to stderr when the JSON goes to stdout.
+    out = sys.stderr if args.json == "-" else sys.stdout
+    print(
+        f"{'backend':<24} {'particles':>10} {'ms/update':>10} {'Mparticles/s':>13} "
+        f"{'bytes/particle':>15} {'add us':>8} {'remove us':>10}",
+        file=out,
+    )
+    results = []
+    for size in args.sizes:
+        live = max(1, int(size * args.active_fraction))
+        for name, factory in backends:
+            row = run_benchmark(name, factory, size, live, args.steps, args.churn)
+            results.append(row)
+            print(
+                f"{name:<24} {size:>10} {row['update_ms']:>10.3f} "
+                f"{row['mparticles_per_s']:>13.2f} {row['bytes_per_particle']:>15.1f} "
+                f"{row['add_us']:>8.2f} {row['remove_us']:>10.2f}",
+                file=out,
+            )
+
+    if args.json:
+        document = json.dumps(
+            {"environment": environment(), "results": results}, indent=2
+        )
+        if args.json == "-":
+            print(document)
+        else:
+            with open(args.json, "w", encoding="utf-8") as f:
+                f.write(document + "\n")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=out)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
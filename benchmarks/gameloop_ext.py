@@ -0,0 +1,155 @@
+"""
+Callback overhead benchmark for the gameloop_ext C extension.
+
+Compares three ways of driving Python handlers from the C loop:
+
+* default: the GIL is released while the loop runs and re-acquired around
+  every single callback;
+* hold_gil: the GIL is taken once per frame and held for all of its
+  callbacks (GameLoop(hold_gil=True));
+* hold_gil+batch: as hold_gil, with the update handler registered with
+  batch=True so it is called once per frame as update(dt, n_steps).
+
+Two measurements are taken for each mode:
+
+* step: mean cost of one headless fixed update through loop.step(), i.e.
+  process_input + update with trivial handlers (batch mode still calls the
+  handler once per step here, as step() runs one update per frame);
+* start: updates per second of a real-time start() run whose fixed time step
+  is far shorter than the loop can keep up with, so every frame runs the
+  max_updates_per_frame cap of catch-up updates.
+
+Modes the imported build does not support are skipped, so an older build can
+be measured for comparison by putting it first on PYTHONPATH.
+
+Run with: PYTHONPATH=<build dir> python -m benchmarks.gameloop_ext
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, List, Optional
+
+try:
+    import gameloop_ext
+except ImportError:
+    gameloop_ext = None
+
+MODES = (
+    ("default", {}, False),
+    ("hold_gil", {"hold_gil": True}, False),
+    ("hold_gil+batch", {"hold_gil": True}, True),
+)
+
+
+def make_loop(
+    fixed_time_step: float,
+    kwargs: Dict[str, object],
+    batch: bool,
+    max_updates_per_frame: Optional[int] = None,
+):
+    """Returns a loop with trivial counting handlers, or None if unsupported."""
+    try:
+        loop = gameloop_ext.GameLoop(
+            fixed_time_step=fixed_time_step,
+            max_updates_per_frame=max_updates_per_frame,
+            **kwargs,
+        )
+    except TypeError:
+        return None, None
+    counter = {"updates": 0, "frames": 0}
+
+    def process_input():
+        pass
+
+    if batch:
+        def update(dt, n_steps):
+            counter["updates"] += n_steps
+
+        try:
+            loop.set_update_handler(update, batch=True)
+        except TypeError:
+            return None, None
+    else:
+        def update(dt):
+            counter["updates"] += 1
+
+        loop.set_update_handler(update)
+    loop.set_process_input_handler(process_input)
+    return loop, counter
+
+
+def time_step(kwargs: Dict[str, object], batch: bool, updates: int) -> Optional[float]:
+    """Returns the mean wall time of one headless update, in seconds."""
+    loop, _ = make_loop(1 / 60, kwargs, batch)
+    if loop is None:
+        return None
+    loop.step(100)  # Warm up
+    start = time.perf_counter()
+    loop.step(updates)
+    return (time.perf_counter() - start) / updates
+
+
+def time_start(
+    kwargs: Dict[str, object],
+    batch: bool,
+    duration: float,
+    fixed_time_step: float,
+    max_updates_per_frame: int,
+) -> Optional[Dict[str, float]]:
+    """Runs start() for `duration` seconds; returns update and frame rates."""
+    loop, counter = make_loop(fixed_time_step, kwargs, batch, max_updates_per_frame)
+    if loop is None:
+        return None
+    deadline = time.perf_counter() + duration
+
+    def render(alpha):
+        counter["frames"] += 1
+        if time.perf_counter() >= deadline:
+            loop.stop()
+
+    loop.set_render_handler(render)
+    start = time.perf_counter()
+    loop.start()
+    elapsed = time.perf_counter() - start
+    return {
+        "updates_per_s": counter["updates"] / elapsed,
+        "frames_per_s": counter["frames"] / elapsed,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--updates", type=int, default=200000)
+    parser.add_argument("--duration", type=float, default=1.0)
+    parser.add_argument(
+        "--fixed-time-step",
+        type=float,
+        default=1e-8,
+        help="Fixed time step of the start() run, in seconds.",
+    )
+    parser.add_argument("--max-updates-per-frame", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    if gameloop_ext is None:
+        print("gameloop_ext is not built or not on PYTHONPATH; see setup_gameloop_ext.py.")
+        return 1
+
+    print(f"{'mode':<16} {'ns/step':>10} {'start updates/s':>16} {'frames/s':>10}")
+    for name, kwargs, batch in MODES:
+        per_step = time_step(kwargs, batch, args.updates)
+        rates = time_start(
+            kwargs, batch, args.duration, args.fixed_time_step, args.max_updates_per_frame
+        )
+        if per_step is None or rates is None:
+            print(f"{name:<16} {'unsupported by this build':>38}")
+            continue
+        print(
+            f"{name:<16} {per_step * 1e9:>10.0f} {rates['updates_per_s']:>16.0f} "
+            f"{rates['frames_per_s']:>10.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
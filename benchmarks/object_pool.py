@@ -0,0 +1,110 @@
+"""
+Stress benchmark for ObjectPool vs. ConcurrentObjectPool.
+
+The plain ObjectPool is not thread-safe, so it is measured behind a single
+global lock, which is how it would have to be shared between threads.
+
+Run with: python -m benchmarks.object_pool --threads 1 2 4 8
+"""
+
+import argparse
+import threading
+import time
+from typing import Callable, List, Optional
+
+from gamepp.patterns.object_pool import (
+    ConcurrentObjectPool,
+    ObjectPool,
+    PooledObject,
+)
+
+
+class Message(PooledObject):
+    def __init__(self) -> None:
+        super().__init__()
+        self.payload: Optional[bytes] = None
+
+    def reset(self) -> None:
+        super().reset()
+        self.payload = None
+
+
+class LockedObjectPool:
+    """An ObjectPool shared between threads behind one lock."""
+
+    def __init__(self, pool_size: int) -> None:
+        self._pool = ObjectPool(Message, pool_size)
+        self._lock = threading.Lock()
+
+    def acquire_object(self) -> Optional[Message]:
+        with self._lock:
+            return self._pool.acquire_object()
+
+    def release_object(self, obj: Message) -> None:
+        with self._lock:
+            self._pool.release_object(obj)
+
+
+def run_stress(pool, num_threads: int, iterations: int, hold: int) -> float:
+    """
+    Runs `num_threads` workers that each acquire `hold` objects and release
+    them again, `iterations` times. Returns the elapsed wall time in seconds.
+    """
+    barrier = threading.Barrier(num_threads + 1)
+
+    def worker() -> None:
+        held: List[Message] = []
+        barrier.wait()
+        for _ in range(iterations):
+            for _ in range(hold):
+                obj = pool.acquire_object()
+                if obj is not None:
+                    held.append(obj)
+            for obj in held:
+                pool.release_object(obj)
+            held.clear()
+        if hasattr(pool, "flush_local_cache"):
+            pool.flush_local_cache()
+
+    threads = [threading.Thread(target=worker) for _ in range(num_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--hold", type=int, default=4)
+    parser.add_argument("--magazine-size", type=int, default=16)
+    args = parser.parse_args(argv)
+
+    factories: List[tuple[str, Callable[[int], object]]] = [
+        ("ObjectPool+Lock", LockedObjectPool),
+        (
+            "ConcurrentObjectPool",
+            lambda size: ConcurrentObjectPool(
+                Message, size, magazine_size=args.magazine_size
+            ),
+        ),
+    ]
+
+    print(f"{'pool':<22} {'threads':>7} {'seconds':>9} {'ops/sec':>12}")
+    for num_threads in args.threads:
+        # Enough objects for every thread to hold `hold` plus a full magazine.
+        pool_size = num_threads * (args.hold + 2 * args.magazine_size)
+        ops = num_threads * args.iterations * args.hold * 2
+        for name, factory in factories:
+            elapsed = run_stress(
+                factory(pool_size), num_threads, args.iterations, args.hold
+            )
+            print(f"{name:<22} {num_threads:>7} {elapsed:>9.3f} {ops / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
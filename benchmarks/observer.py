@@ -0,0 +1,99 @@
+"""
+Notification and churn cost of Subject, LinkedSubject and CopyOnWriteSubject.
+
+For each number of observers, measures:
+
+* notify: mean wall time of one notify() to all observers, as in a frame
+  that sends thousands of notifications;
+* attach/detach: mean wall time of detaching and re-attaching one random
+  observer, which is what a copy-on-write snapshot makes more expensive.
+
+Run with: python -m benchmarks.observer --observers 1 10 100 1000
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable, List, Optional
+
+from gamepp.patterns.observer import (
+    CopyOnWriteSubject,
+    LinkedSubject,
+    ObserverMixin,
+    Subject,
+)
+
+SUBJECTS: List[tuple[str, Callable[[], Subject]]] = [
+    ("Subject", Subject),
+    ("LinkedSubject", LinkedSubject),
+    ("CopyOnWriteSubject", CopyOnWriteSubject),
+]
+
+
+class Counter(ObserverMixin):
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+
+    def on_notify(self, subject: Any, event_data: Any = None) -> None:
+        self.count += 1
+
+
+def time_notify(subject: Subject, notifications: int) -> float:
+    """Returns the mean wall time of one notify(), in seconds."""
+    subject.notify()  # Warm up
+    start = time.perf_counter()
+    for _ in range(notifications):
+        subject.notify(None)
+    return (time.perf_counter() - start) / notifications
+
+
+def time_churn(
+    subject: Subject, observers: List[Counter], samples: int, notify: bool, seed: int = 0
+) -> float:
+    """
+    Returns the mean wall time of detaching and re-attaching one random
+    observer, followed by one notify() if `notify` is set, in seconds.
+    """
+    rng = random.Random(seed)
+    victims = [rng.choice(observers) for _ in range(samples)]
+    start = time.perf_counter()
+    for observer in victims:
+        subject.detach(observer)
+        subject.attach(observer)
+        if notify:
+            subject.notify(None)
+    return (time.perf_counter() - start) / samples
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--observers", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--notifications", type=int, default=20000)
+    parser.add_argument("--churn", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'subject':<20} {'observers':>10} {'notify us':>10} {'ns/observer':>12} "
+        f"{'churn us':>9} {'churn+notify us':>16}"
+    )
+    for count in args.observers:
+        # Keep the total number of on_notify calls roughly constant.
+        notifications = max(100, args.notifications // count)
+        for name, factory in SUBJECTS:
+            subject = factory()
+            observers = [Counter() for _ in range(count)]
+            for observer in observers:
+                subject.attach(observer)
+            per_notify = time_notify(subject, notifications)
+            churn = time_churn(subject, observers, args.churn, notify=False)
+            churn_notify = time_churn(subject, observers, args.churn // 10, notify=True)
+            print(
+                f"{name:<20} {count:>10} {per_notify * 1e6:>10.2f} "
+                f"{per_notify / count * 1e9:>12.1f} {churn * 1e6:>9.2f} "
+                f"{churn_notify * 1e6:>16.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
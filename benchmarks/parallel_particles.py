@@ -0,0 +1,68 @@
+"""
+Scaling of ParallelParticleSystem.update across worker processes.
+
+Measures the update time of a large particle system integrated by 1, 2, 4
+and 8 worker processes over shared memory, against the single-process
+VectorizedParticleSystem. Speedups are bounded by the number of physical
+cores and by memory bandwidth.
+
+Run with: python -m benchmarks.parallel_particles --particles 1000000
+"""
+
+import argparse
+import time
+from typing import List, Optional
+
+from gamepp.patterns.data_locality import (
+    ParallelParticleSystem,
+    VectorizedParticleSystem,
+    np,
+)
+
+
+def fill(system, count: int) -> None:
+    rng = np.random.default_rng(0)
+    system.add_particles(
+        rng.uniform(-100, 100, count),
+        rng.uniform(-100, 100, count),
+        rng.uniform(-5, 5, count),
+        rng.uniform(-5, 5, count),
+    )
+
+
+def time_updates(system, steps: int, dt: float = 1 / 60) -> float:
+    """Returns the mean wall time of one update, in seconds."""
+    system.update(dt)  # Warm up
+    start = time.perf_counter()
+    for _ in range(steps):
+        system.update(dt)
+    return (time.perf_counter() - start) / steps
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--particles", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--steps", type=int, default=50)
+    args = parser.parse_args(argv)
+    if np is None:
+        parser.error("NumPy is required for this benchmark.")
+
+    baseline_system = VectorizedParticleSystem(args.particles, dense=True)
+    fill(baseline_system, args.particles)
+    baseline = time_updates(baseline_system, args.steps)
+    print(f"{'backend':<26} {'ms/update':>10} {'speedup':>8}")
+    print(f"{'Vectorized (1 process)':<26} {baseline * 1000:>10.3f} {1.0:>8.2f}")
+
+    for num_workers in args.workers:
+        with ParallelParticleSystem(
+            args.particles, num_workers=num_workers, dense=True, min_parallel_particles=0
+        ) as system:
+            fill(system, args.particles)
+            per_update = time_updates(system, args.steps)
+        name = f"Parallel ({num_workers} workers)"
+        print(f"{name:<26} {per_update * 1000:>10.3f} {baseline / per_update:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
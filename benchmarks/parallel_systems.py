@@ -0,0 +1,132 @@
+"""
+Frame time of CPU-heavy systems under SystemScheduler.
+
+Runs --systems independent systems, each writing its own component, plus
+one system that reads them all, for --frames frames. Compared modes:
+
+* serial: SystemScheduler(max_workers=1), registration order on one thread;
+* threads:N: the default ThreadPoolExecutor with N workers;
+* processes:N: a ProcessPoolExecutor with N workers, results written back
+  by `apply` callbacks.
+
+Two workloads are available. "numpy" multiplies matrices, which releases
+the GIL, so threads can overlap. "python" is a pure-Python loop, which only
+processes can run in parallel. Each mode's world state is checked against
+the serial run. Speedups are bounded by the number of cores.
+
+Run with: python -m benchmarks.parallel_systems --workload python --workers 2 4
+"""
+
+import argparse
+import functools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from gamepp.patterns.data_locality import np
+from gamepp.patterns.update_method import SystemScheduler
+
+
+def python_work(iterations: int, dt: float) -> float:
+    total = 0.0
+    for i in range(iterations):
+        total += (i * dt) % 7.0
+    return total
+
+
+def numpy_work(size: int, seed: int, dt: float) -> float:
+    matrix = np.random.default_rng(seed).random((size, size)) * dt
+    return float((matrix @ matrix).sum())
+
+
+def build(
+    scheduler: SystemScheduler, work: List[Callable[[float], float]], world: Dict[str, float]
+) -> None:
+    """Registers one system per work item and a summary system reading them all."""
+    components = []
+    for index, update in enumerate(work):
+        component = f"component{index}"
+        components.append(component)
+        scheduler.add_system(
+            update,
+            writes=[component],
+            name=component,
+            apply=functools.partial(world.__setitem__, component),
+        )
+
+    def summarize(dt: float) -> float:
+        return sum(world[component] for component in components)
+
+    scheduler.add_system(
+        summarize,
+        reads=components,
+        writes=["summary"],
+        apply=functools.partial(world.__setitem__, "summary"),
+        local=True,  # Reads the world, which worker processes cannot see
+    )
+
+
+def time_frames(
+    mode: str, work: List[Callable[[float], float]], frames: int
+) -> tuple[float, Dict[str, float]]:
+    """Returns the mean frame time in seconds and the final world state."""
+    kind, _, workers = mode.partition(":")
+    executor = ProcessPoolExecutor(int(workers)) if kind == "processes" else None
+    max_workers = 1 if kind == "serial" else int(workers)
+    world: Dict[str, float] = {}
+    try:
+        with SystemScheduler(executor, max_workers=max_workers) as scheduler:
+            build(scheduler, work, world)
+            scheduler.update_all(1 / 60)  # Warm up the pool
+            start = time.perf_counter()
+            for _ in range(frames):
+                scheduler.update_all(1 / 60)
+            elapsed = (time.perf_counter() - start) / frames
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return elapsed, world
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workload", choices=("numpy", "python"), default="numpy")
+    parser.add_argument("--systems", type=int, default=4)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4])
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument(
+        "--size",
+        type=int,
+        help="Matrix size (numpy) or loop iterations (python) per system.",
+    )
+    args = parser.parse_args(argv)
+    if args.workload == "numpy" and np is None:
+        parser.error("NumPy is required for the numpy workload.")
+
+    if args.workload == "numpy":
+        size = args.size or 300
+        work = [functools.partial(numpy_work, size, seed) for seed in range(args.systems)]
+    else:
+        size = args.size or 200_000
+        work = [functools.partial(python_work, size + seed) for seed in range(args.systems)]
+
+    modes = ["serial"]
+    for workers in args.workers:
+        modes += [f"threads:{workers}", f"processes:{workers}"]
+
+    print(f"{args.workload} workload, {args.systems} systems, {os.cpu_count()} CPUs")
+    print(f"{'mode':<14} {'ms/frame':>10} {'speedup':>8} {'matches serial':>15}")
+    baseline = reference = None
+    for mode in modes:
+        per_frame, world = time_frames(mode, work, args.frames)
+        if baseline is None:
+            baseline, reference = per_frame, world
+        print(
+            f"{mode:<14} {per_frame * 1000:>10.2f} {baseline / per_frame:>8.2f} "
+            f"{str(world == reference):>15}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+from array import typecodes as array_typecodes
+from typing import Any
+
+# Character typecodes hold text rather than numbers and have no NumPy dtype.
+_TEXT_TYPECODES = ("u", "w")
+
+
+def check_typecode(typecode: Any, name: str) -> str:
+    """
+    Validates the `array` typecode declared for the column `name` of a
+    Structure of Arrays store.
+
+    Returns:
+        The typecode.
+
+    Raises:
+        ValueError: If typecode is not a single numeric `array` typecode.
+    """
+    if (
+        not isinstance(typecode, str)
+        or len(typecode) != 1
+        or typecode not in array_typecodes
+        or typecode in _TEXT_TYPECODES
+    ):
+        raise ValueError(f"Unsupported typecode {typecode!r} for {name!r}.")
+    return typecode
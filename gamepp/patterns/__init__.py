@@ -10,7 +10,7 @@ from .bytecode import Instruction, VirtualMachine
 from .service_locator import ServiceLocator, NullService, get_service, register_service
 from .command import Command
 from .component import Component, Entity as GameObject
-from .data_locality import ParticleSystem
+from .data_locality import ParticleSystem, SoAStore
 from .dirty_flag import GameObject as DirtyFlagGameObject
 from .event_queue import EventQueue, Event
 from .flyweight import Flyweight, FlyweightFactory
@@ -31,7 +31,7 @@ from .type_object import TypeObject, TypedObject
 __all__ = [
     "Command",
     "Component", "GameObject",
-    "ParticleSystem",
+    "ParticleSystem", "SoAStore",
     "DirtyFlagGameObject",
     "EventQueue", "Event",
     "Flyweight", "FlyweightFactory",
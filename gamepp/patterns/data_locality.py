@@ -19,80 +19,271 @@ as opposed to "Array of Structures" (AoS).
   Memory for x: [x1,x2,x3] (contiguous)
   Processing all 'x' components means sequential memory access, which is cache-friendly.
 
-This example demonstrates a ParticleSystem using SoA.
+This example demonstrates a ParticleSystem using SoA, optionally kept
+densely packed so that work is proportional to the live particles. Particles
+can be given a lifetime and spawned in bulk by a ParticleEmitter; expired
+particles are removed in one pass per update. For very large systems,
+`ParallelParticleSystem` keeps the columns in shared memory and splits the
+integration across a pool of worker processes. Forces and constraints beyond
+plain integration are configured as a ParticlePipeline of stages.
+
+`SoAStore` generalizes the dense particle layout to any schema of named,
+typed columns, for other hot data such as projectiles, decals or status effects.
+
+In pure Python the per-element loop dominates whatever the memory layout, so
+`VectorizedParticleSystem` keeps the same SoA columns in typed buffers and
+integrates them with whole-array operations: NumPy when it is installed,
+otherwise `array('d')` columns rebuilt in a single pass per axis.
 """
 
+import heapq
+import math
+import multiprocessing
+import os
+import random
+import weakref
+from array import array
+from multiprocessing import shared_memory
+from typing import Iterator
+
+from gamepp.common.typecodes import check_typecode
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the array-based fallback is used instead
+    np = None
+
 
 class ParticleSystem:
     """
     Manages particles using a Structure of Arrays (SoA) approach
     to improve data locality when updating particles.
+
+    By default a particle's ID is its slot index, and removed particles leave
+    holes that updates skip over. With `dense=True` active particles are kept
+    packed in indices [0, num_active_particles): removing a particle moves the
+    last one into its slot, and a handle table maps the stable particle IDs
+    returned by `add_particle` to their current index. Adding, removing and
+    updating then cost time proportional to the live particles only.
+
+    Particles may be given a lifetime in seconds. Every update ages all live
+    particles and removes those that have expired in a single sweep, and
+    runs any attached ParticleEmitters first.
     """
 
-    def __init__(self, max_particles: int):
+    def __init__(self, max_particles: int, dense: bool = False):
         if not isinstance(max_particles, int) or max_particles <= 0:
             raise ValueError("max_particles must be a positive integer.")
 
         self.max_particles: int = max_particles
         self.num_active_particles: int = 0
+        self.dense: bool = dense
 
         # Store components in separate arrays (SoA)
-        self.positions_x: list[float] = [0.0] * max_particles
-        self.positions_y: list[float] = [0.0] * max_particles
-        self.velocities_x: list[float] = [0.0] * max_particles
-        self.velocities_y: list[float] = [0.0] * max_particles
-        self.active: list[bool] = [False] * max_particles
+        self.positions_x = self._new_column("positions_x")
+        self.positions_y = self._new_column("positions_y")
+        self.velocities_x = self._new_column("velocities_x")
+        self.velocities_y = self._new_column("velocities_y")
+        self.ages = self._new_column("ages")
+        self.lifetimes = self._new_column("lifetimes")
+        self.active = self._new_mask()
+
+        # Free particle IDs. In sparse mode a min-heap, so the lowest free
+        # slot is reused first and live particles stay near the front; in
+        # dense mode a stack, reversed so that ID 0 is used first.
+        self._free_ids: list[int] = (
+            list(range(max_particles - 1, -1, -1)) if dense else list(range(max_particles))
+        )
+        if dense:
+            # Handle table: stable ID -> dense index (-1 if free), and back.
+            self._id_to_index = self._new_index_column(-1)
+            self._index_to_id = self._new_index_column(0)
+
+        # Aging and expiry are skipped until a particle with a finite
+        # lifetime is added.
+        self._has_lifetimes: bool = False
+        self._emitters: list["ParticleEmitter"] = []
+        self._pipeline: "ParticlePipeline | None" = None
+
+    def _new_column(self, name: str) -> list[float]:
+        """Allocates the zeroed component array `name` of max_particles elements."""
+        return [0.0] * self.max_particles
+
+    def _new_mask(self) -> list[bool]:
+        """Allocates the all-inactive mask of max_particles elements."""
+        return [False] * self.max_particles
+
+    def _new_index_column(self, fill: int) -> list[int]:
+        """Allocates one handle table column of max_particles elements."""
+        return [fill] * self.max_particles
+
+    @property
+    def _columns(self) -> tuple:
+        """All per-particle component arrays, moved together on swap-remove."""
+        return (
+            self.positions_x,
+            self.positions_y,
+            self.velocities_x,
+            self.velocities_y,
+            self.ages,
+            self.lifetimes,
+        )
+
+    def _index_of(self, particle_id: int) -> int:
+        """Returns the storage index of an active particle ID, or -1."""
+        if not 0 <= particle_id < self.max_particles:
+            return -1
+        if self.dense:
+            return self._id_to_index[particle_id]
+        return particle_id if self.active[particle_id] else -1
 
     def add_particle(
-        self, pos_x: float, pos_y: float, vel_x: float, vel_y: float
+        self,
+        pos_x: float,
+        pos_y: float,
+        vel_x: float,
+        vel_y: float,
+        lifetime: float = math.inf,
     ) -> int | None:
         """
-        Adds a particle to the system.
-        Tries to reuse an inactive slot first.
-        Returns the particle ID (index) if successful, None otherwise.
+        Adds a particle to the system, optionally expiring after `lifetime` seconds.
+        Reuses the lowest free ID in sparse mode and the most recently freed
+        ID in dense mode.
+        Returns the particle ID if successful, None otherwise.
         """
-        for i in range(self.max_particles):
-            if not self.active[i]:
-                self._initialize_particle(i, pos_x, pos_y, vel_x, vel_y)
-                return i
+        if not self._free_ids:
+            # print("Particle system full. Cannot add new particle.") # Optional: logging
+            return None
 
-        # If no inactive slot is found and system is full
-        # print("Particle system full. Cannot add new particle.") # Optional: logging
-        return None
+        if self.dense:
+            particle_id = self._free_ids.pop()
+            idx = self.num_active_particles
+            self._id_to_index[particle_id] = idx
+            self._index_to_id[idx] = particle_id
+        else:
+            particle_id = heapq.heappop(self._free_ids)
+            idx = particle_id
+        self._initialize_particle(idx, pos_x, pos_y, vel_x, vel_y, lifetime)
+        return particle_id
 
     def _initialize_particle(
-        self, idx: int, pos_x: float, pos_y: float, vel_x: float, vel_y: float
+        self,
+        idx: int,
+        pos_x: float,
+        pos_y: float,
+        vel_x: float,
+        vel_y: float,
+        lifetime: float = math.inf,
     ):
         """Helper to set particle data and mark as active."""
         self.positions_x[idx] = pos_x
         self.positions_y[idx] = pos_y
         self.velocities_x[idx] = vel_x
         self.velocities_y[idx] = vel_y
+        self.ages[idx] = 0.0
+        self.lifetimes[idx] = lifetime
+        if lifetime != math.inf:
+            self._has_lifetimes = True
         self.active[idx] = True
         self.num_active_particles += 1
 
+    def add_particles(self, pos_x, pos_y, vel_x, vel_y, lifetime=math.inf) -> int:
+        """
+        Adds many particles at once. Each argument is a sequence with one
+        value per particle, except `lifetime`, which may also be a single
+        value shared by all of them.
+        Returns the number of particles added, which is less than requested
+        if the system runs out of capacity.
+        """
+        count = min(len(pos_x), len(self._free_ids))
+        lifetimes = (
+            lifetime if hasattr(lifetime, "__len__") else [lifetime] * count
+        )
+        for i in range(count):
+            self.add_particle(pos_x[i], pos_y[i], vel_x[i], vel_y[i], lifetimes[i])
+        return count
+
+    def add_emitter(self, emitter: "ParticleEmitter") -> None:
+        """Attaches an emitter that spawns particles at the start of each update."""
+        if emitter not in self._emitters:
+            self._emitters.append(emitter)
+
+    def remove_emitter(self, emitter: "ParticleEmitter") -> None:
+        """Detaches an emitter."""
+        if emitter in self._emitters:
+            self._emitters.remove(emitter)
+
+    def set_pipeline(self, pipeline: "ParticlePipeline | None") -> None:
+        """
+        Replaces plain integration with a pipeline of force, integration and
+        constraint stages. Pass None to go back to plain integration.
+        ParallelParticleSystem runs the pipeline in its worker processes.
+        """
+        self._pipeline = pipeline
+
     def remove_particle(self, particle_id: int):
         """
         Marks a particle as inactive.
-        The data remains in the arrays but will be ignored by updates
-        and can be overwritten by a new particle.
+        In sparse mode the data remains in the arrays but will be ignored by
+        updates and can be overwritten by a new particle. In dense mode the
+        last active particle is moved into the freed index.
         """
-        if 0 <= particle_id < self.max_particles and self.active[particle_id]:
-            self.active[particle_id] = False
-            self.num_active_particles -= 1
-        else:
+        idx = self._index_of(particle_id)
+        if idx < 0:
             # Optional: raise error or log
             # print(f"Particle with id {particle_id} not found or already inactive.")
-            pass
+            return
+
+        if self.dense:
+            last = self.num_active_particles - 1
+            if idx != last:
+                for column in self._columns:
+                    column[idx] = column[last]
+                moved_id = self._index_to_id[last]
+                self._index_to_id[idx] = moved_id
+                self._id_to_index[moved_id] = idx
+            self._id_to_index[particle_id] = -1
+            self._free_ids.append(particle_id)
+            idx = last
+        else:
+            heapq.heappush(self._free_ids, particle_id)
+
+        self.active[idx] = False
+        self.num_active_particles -= 1
 
     def update(self, dt: float):
         """
-        Update all active particles.
+        Update all active particles: run emitters, integrate velocities (through
+        the pipeline, if one is set), then age the particles and remove the
+        expired ones.
         Processing each component array contiguously demonstrates data locality.
         """
+        for emitter in self._emitters:
+            emitter.emit(self, dt)
         if self.num_active_particles == 0:
             return
 
+        self._move(dt)
+        if self._has_lifetimes:
+            self._expire(dt)
+
+    def _move(self, dt: float):
+        """Runs the pipeline if one is set, otherwise plain integration."""
+        if self._pipeline is not None:
+            self._pipeline.apply(self, dt)
+        else:
+            self._integrate(dt)
+
+    def _integrate(self, dt: float):
+        """Moves every active particle by its velocity."""
+        if self.dense:
+            # Active particles are packed at the front, so no mask checks.
+            for i in range(self.num_active_particles):
+                self.positions_x[i] += self.velocities_x[i] * dt
+            for i in range(self.num_active_particles):
+                self.positions_y[i] += self.velocities_y[i] * dt
+            return
+
         # Update X positions
         # This loop accesses positions_x[i] and velocities_x[i]
         # If active[i] is true, these accesses are mostly sequential for active particles.
@@ -108,37 +299,963 @@ class ParticleSystem:
                 continue
             self.positions_y[i] += self.velocities_y[i] * dt
 
+    def _expire(self, dt: float):
+        """Ages every active particle and removes those past their lifetime."""
+        expired = []
+        if self.dense:
+            for i in range(self.num_active_particles):
+                self.ages[i] += dt
+                if self.ages[i] >= self.lifetimes[i]:
+                    expired.append(int(self._index_to_id[i]))
+        else:
+            for i in range(self.max_particles):
+                if not self.active[i]:
+                    continue
+                self.ages[i] += dt
+                if self.ages[i] >= self.lifetimes[i]:
+                    expired.append(i)
+        for particle_id in expired:
+            self.remove_particle(particle_id)
+
+    def _particle_data_at(self, idx: int) -> dict:
+        """Builds the data dictionary for the particle stored at `idx`."""
+        return {
+            "pos_x": self.positions_x[idx],
+            "pos_y": self.positions_y[idx],
+            "vel_x": self.velocities_x[idx],
+            "vel_y": self.velocities_y[idx],
+        }
+
     def get_particle_data(self, particle_id: int) -> dict | None:
         """
         Retrieves the data for a specific active particle.
         Returns a dictionary with particle data or None if inactive/invalid.
         """
-        if 0 <= particle_id < self.max_particles and self.active[particle_id]:
-            return {
-                "pos_x": self.positions_x[particle_id],
-                "pos_y": self.positions_y[particle_id],
-                "vel_x": self.velocities_x[particle_id],
-                "vel_y": self.velocities_y[particle_id],
-            }
-        return None
+        idx = self._index_of(particle_id)
+        if idx < 0:
+            return None
+        return self._particle_data_at(idx)
 
     def get_active_particles_data(self) -> list[dict]:
         """
         Retrieves data for all active particles.
         """
-        particles_data = []
-        for i in range(self.max_particles):
-            if self.active[i]:
-                particles_data.append(
-                    {
-                        "id": i,
-                        "pos_x": self.positions_x[i],
-                        "pos_y": self.positions_y[i],
-                        "vel_x": self.velocities_x[i],
-                        "vel_y": self.velocities_y[i],
-                    }
+        if self.dense:
+            return [
+                {"id": int(self._index_to_id[i]), **self._particle_data_at(i)}
+                for i in range(self.num_active_particles)
+            ]
+        return [
+            {"id": i, **self._particle_data_at(i)}
+            for i in range(self.max_particles)
+            if self.active[i]
+        ]
+
+
+class VectorizedParticleSystem(ParticleSystem):
+    """
+    Manages particles using SoA columns stored in typed buffers, updated with
+    whole-array operations instead of a per-particle Python loop.
+
+    The public API mirrors ParticleSystem, including the dense mode. In sparse
+    mode removed particles have their velocity zeroed, which lets `update`
+    integrate every slot unconditionally without checking the active mask;
+    in dense mode only the packed prefix of live particles is integrated.
+
+    With NumPy, `add_particles` and the expiry pass are whole-array operations
+    too: expired particles are compacted out of the dense prefix (or masked
+    out in sparse mode) in one sweep, without a Python call per particle.
+    """
+
+    def __init__(
+        self, max_particles: int, use_numpy: bool | None = None, dense: bool = False
+    ):
+        """
+        Args:
+            max_particles: Capacity of the system.
+            use_numpy: Store columns as NumPy arrays. Defaults to True when
+                NumPy is installed; False selects the `array('d')` fallback.
+            dense: Keep active particles packed, see ParticleSystem.
+        """
+        if use_numpy is None:
+            use_numpy = np is not None
+        elif use_numpy and np is None:
+            raise ImportError("NumPy is required for use_numpy=True.")
+        self.use_numpy: bool = use_numpy
+
+        super().__init__(max_particles, dense=dense)
+        if use_numpy:
+            self._scratch = np.empty(max_particles, dtype=np.float64)
+
+    def _new_column(self, name: str):
+        """Allocates a zeroed float64 column of max_particles elements."""
+        if self.use_numpy:
+            return np.zeros(self.max_particles, dtype=np.float64)
+        return array("d", bytes(8 * self.max_particles))
+
+    def _new_mask(self):
+        """Allocates the all-inactive mask of max_particles elements."""
+        if self.use_numpy:
+            return np.zeros(self.max_particles, dtype=np.bool_)
+        return bytearray(self.max_particles)
+
+    def _new_index_column(self, fill: int):
+        """Allocates one handle table column of max_particles elements."""
+        if self.use_numpy:
+            return np.full(self.max_particles, fill, dtype=np.intp)
+        return array("q", [fill]) * self.max_particles
+
+    def add_particles(self, pos_x, pos_y, vel_x, vel_y, lifetime=math.inf) -> int:
+        """
+        Adds many particles at once, see ParticleSystem.add_particles.
+        With NumPy the new particles are written with one slice assignment
+        per column.
+        """
+        if not self.use_numpy:
+            return super().add_particles(pos_x, pos_y, vel_x, vel_y, lifetime)
+
+        count = min(len(pos_x), len(self._free_ids))
+        if count == 0:
+            return 0
+        # Take IDs in the same order repeated add_particle calls would.
+        if self.dense:
+            ids = np.array(self._free_ids[-count:][::-1], dtype=np.intp)
+            del self._free_ids[-count:]
+        else:
+            free_ids = self._free_ids
+            ids = np.array(
+                [heapq.heappop(free_ids) for _ in range(count)], dtype=np.intp
+            )
+
+        if self.dense:
+            start = self.num_active_particles
+            idx = slice(start, start + count)
+            self._index_to_id[idx] = ids
+            self._id_to_index[ids] = np.arange(start, start + count)
+        else:
+            idx = ids
+
+        self.positions_x[idx] = np.asarray(pos_x)[:count]
+        self.positions_y[idx] = np.asarray(pos_y)[:count]
+        self.velocities_x[idx] = np.asarray(vel_x)[:count]
+        self.velocities_y[idx] = np.asarray(vel_y)[:count]
+        self.ages[idx] = 0.0
+        lifetimes = np.broadcast_to(np.asarray(lifetime, dtype=np.float64), (len(pos_x),))
+        self.lifetimes[idx] = lifetimes[:count]
+        if not np.isinf(lifetimes[:count]).all():
+            self._has_lifetimes = True
+        self.active[idx] = True
+        self.num_active_particles += count
+        return count
+
+    def remove_particle(self, particle_id: int):
+        """
+        Removes a particle. In sparse mode its velocity is zeroed so that
+        whole-array updates leave its slot unchanged.
+        """
+        if not self.dense and self._index_of(particle_id) >= 0:
+            self.velocities_x[particle_id] = 0.0
+            self.velocities_y[particle_id] = 0.0
+        super().remove_particle(particle_id)
+
+    def _integrate(self, dt: float):
+        """
+        Integrates velocity into position as one operation per axis, over the
+        live prefix in dense mode or over every slot in sparse mode.
+        """
+        n = self.num_active_particles if self.dense else self.max_particles
+
+        if self.use_numpy:
+            scratch = self._scratch[:n]
+            np.multiply(self.velocities_x[:n], dt, out=scratch)
+            self.positions_x[:n] += scratch
+            np.multiply(self.velocities_y[:n], dt, out=scratch)
+            self.positions_y[:n] += scratch
+        else:
+            # Slice assignment rebuilds each column in place in one pass.
+            self.positions_x[:n] = array(
+                "d", [p + v * dt for p, v in zip(self.positions_x[:n], self.velocities_x[:n])]
+            )
+            self.positions_y[:n] = array(
+                "d", [p + v * dt for p, v in zip(self.positions_y[:n], self.velocities_y[:n])]
+            )
+
+    def _expire(self, dt: float):
+        """
+        Ages particles and removes the expired ones in one sweep. The
+        array fallback uses the per-particle loop of ParticleSystem.
+        """
+        if not self.use_numpy:
+            super()._expire(dt)
+            return
+
+        if self.dense:
+            n = self.num_active_particles
+            self.ages[:n] += dt
+            dead = self.ages[:n] >= self.lifetimes[:n]
+            if not dead.any():
+                return
+            keep = ~dead
+            kept = int(np.count_nonzero(keep))
+            dead_ids = self._index_to_id[:n][dead]
+            kept_ids = self._index_to_id[:n][keep]
+            # Stable compaction: survivors keep their relative order.
+            for column in self._columns:
+                column[:kept] = column[:n][keep]
+            self._index_to_id[:kept] = kept_ids
+            self._id_to_index[kept_ids] = np.arange(kept)
+            self._id_to_index[dead_ids] = -1
+            self.active[kept:n] = False
+            self._free_ids.extend(dead_ids.tolist())
+            self.num_active_particles = kept
+        else:
+            self.ages += dt
+            dead_ids = np.flatnonzero(self.active & (self.ages >= self.lifetimes))
+            if len(dead_ids) == 0:
+                return
+            self.active[dead_ids] = False
+            self.velocities_x[dead_ids] = 0.0
+            self.velocities_y[dead_ids] = 0.0
+            self._free_ids.extend(dead_ids.tolist())
+            heapq.heapify(self._free_ids)
+            self.num_active_particles -= len(dead_ids)
+
+    def get_buffer_views(self) -> dict[str, memoryview]:
+        """
+        Zero-copy access to the particle state for renderers and serializers.
+
+        Returns memoryviews over the underlying float64 columns ("pos_x",
+        "pos_y", "vel_x", "vel_y", "age", "lifetime") and the "active" mask.
+        In dense mode the views cover only the live prefix
+        [0, num_active_particles) and an "id" view gives the stable ID of each
+        entry; in sparse mode they cover every slot and the slot index is the
+        ID. The views alias live data, so they see later updates, but their
+        length is fixed when they are created: request fresh views each frame.
+        """
+        n = self.num_active_particles if self.dense else self.max_particles
+        columns = {
+            "pos_x": self.positions_x,
+            "pos_y": self.positions_y,
+            "vel_x": self.velocities_x,
+            "vel_y": self.velocities_y,
+            "age": self.ages,
+            "lifetime": self.lifetimes,
+            "active": self.active,
+        }
+        if self.dense:
+            columns["id"] = self._index_to_id
+        return {name: memoryview(column)[:n] for name, column in columns.items()}
+
+    def _particle_data_at(self, idx: int) -> dict:
+        """Builds the data dictionary, converting buffer values to floats."""
+        return {
+            "pos_x": float(self.positions_x[idx]),
+            "pos_y": float(self.positions_y[idx]),
+            "vel_x": float(self.velocities_x[idx]),
+            "vel_y": float(self.velocities_y[idx]),
+        }
+
+
+# Order of the float64 columns in a ParallelParticleSystem's shared memory
+# block. Workers update the first four. The active mask follows them.
+_SHARED_COLUMNS = ("positions_x", "positions_y", "velocities_x", "velocities_y", "ages", "lifetimes")
+
+
+def _shared_views(buf, max_particles: int):
+    """Maps the float64 columns and the active mask of a shared memory block."""
+    columns = np.ndarray((len(_SHARED_COLUMNS), max_particles), dtype=np.float64, buffer=buf)
+    mask = np.ndarray(
+        (max_particles,), dtype=np.bool_, buffer=buf, offset=columns.nbytes
+    )
+    return columns, mask
+
+
+def _parallel_integrate_worker(
+    conn,
+    shm_name: str,
+    max_particles: int,
+    dense: bool,
+    worker_index: int,
+    num_workers: int,
+):
+    """
+    Worker process loop for ParallelParticleSystem.
+
+    Attaches to the shared columns, then for every (dt, n, pipeline) message
+    updates its share of the index range [0, n), through the pipeline if it
+    is not None, and replies, until it receives None.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        columns, active = _shared_views(shm.buf, max_particles)
+        pos_x, pos_y, vel_x, vel_y = columns[0], columns[1], columns[2], columns[3]
+        scratch = np.empty(-(-max_particles // num_workers), dtype=np.float64)
+        while True:
+            message = conn.recv()
+            if message is None:
+                break
+            dt, n, pipeline = message
+            chunk = -(-n // num_workers)
+            start = worker_index * chunk
+            end = min(n, start + chunk)
+            if start < end and pipeline is not None:
+                pipeline._apply_arrays(
+                    pos_x[start:end],
+                    pos_y[start:end],
+                    vel_x[start:end],
+                    vel_y[start:end],
+                    True if dense else active[start:end],
+                    dt,
                 )
-        return particles_data
+            elif start < end:
+                tmp = scratch[: end - start]
+                np.multiply(vel_x[start:end], dt, out=tmp)
+                pos_x[start:end] += tmp
+                np.multiply(vel_y[start:end], dt, out=tmp)
+                pos_y[start:end] += tmp
+            conn.send(True)
+        del columns, active, pos_x, pos_y, vel_x, vel_y
+    finally:
+        shm.close()
+        conn.close()
+
+
+def _shutdown_parallel_workers(connections, processes, shm) -> None:
+    """Stops the workers and releases the shared memory block."""
+    for conn in connections:
+        try:
+            conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+    for process in processes:
+        process.join(timeout=5)
+        if process.is_alive():
+            process.terminate()
+    for conn in connections:
+        conn.close()
+    try:
+        shm.close()
+    except BufferError:
+        pass  # Views are still exported; the mapping goes away with them.
+    shm.unlink()
+
+
+class ParallelParticleSystem(VectorizedParticleSystem):
+    """
+    A VectorizedParticleSystem whose integration runs on several processes.
+
+    All columns live in one `multiprocessing.shared_memory` block. A
+    persistent pool of worker processes attaches to it at startup; each
+    update sends every worker the step size, the number of slots to
+    integrate and the pipeline (see `set_pipeline`), each worker updates its
+    contiguous index range, and the update waits for all of them to answer
+    before continuing (a barrier per step). Pipelines are sent with every
+    step, so changes to their stages take effect on the next update.
+    Everything else (adding, removing, expiry, emitters) runs in the calling
+    process on the same shared arrays.
+
+    Message passing costs tens of microseconds per step, so systems with
+    fewer than `min_parallel_particles` slots to integrate are updated in
+    the calling process instead. Requires NumPy. Call `close()` (or use the
+    system as a context manager) to stop the workers and free the memory.
+    """
+
+    def __init__(
+        self,
+        max_particles: int,
+        num_workers: int | None = None,
+        dense: bool = False,
+        min_parallel_particles: int = 50_000,
+    ):
+        """
+        Args:
+            max_particles: Capacity of the system.
+            num_workers: Number of worker processes, defaults to the CPU count.
+            dense: Keep active particles packed, see ParticleSystem.
+            min_parallel_particles: Below this many slots the update runs
+                in the calling process.
+        """
+        if np is None:
+            raise ImportError("NumPy is required for ParallelParticleSystem.")
+        if not isinstance(max_particles, int) or max_particles <= 0:
+            raise ValueError("max_particles must be a positive integer.")
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+        if not isinstance(num_workers, int) or num_workers <= 0:
+            raise ValueError("num_workers must be a positive integer.")
+
+        self.num_workers: int = num_workers
+        self.min_parallel_particles: int = min_parallel_particles
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=(8 * len(_SHARED_COLUMNS) + 1) * max_particles
+        )
+        self._shared, self._shared_mask = _shared_views(self._shm.buf, max_particles)
+        self._shared.fill(0.0)
+        self._shared_mask.fill(False)
+        super().__init__(max_particles, use_numpy=True, dense=dense)
+
+        context = multiprocessing.get_context()
+        self._connections = []
+        self._processes = []
+        for worker_index in range(num_workers):
+            parent_conn, child_conn = context.Pipe()
+            process = context.Process(
+                target=_parallel_integrate_worker,
+                args=(
+                    child_conn,
+                    self._shm.name,
+                    max_particles,
+                    dense,
+                    worker_index,
+                    num_workers,
+                ),
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._connections.append(parent_conn)
+            self._processes.append(process)
+        self._finalizer = weakref.finalize(
+            self, _shutdown_parallel_workers, self._connections, self._processes, self._shm
+        )
+
+    def _new_column(self, name: str):
+        """Hands out the float64 row of the shared memory block for `name`."""
+        return self._shared[_SHARED_COLUMNS.index(name)]
+
+    def _new_mask(self):
+        """Hands out the active mask stored after the shared columns."""
+        return self._shared_mask
+
+    def _move(self, dt: float):
+        """
+        Splits the integration, or the pipeline if one is set, across the
+        worker processes and waits for all of them to finish.
+        """
+        if not self._finalizer.alive:
+            raise RuntimeError("ParallelParticleSystem has been closed.")
+        n = self.num_active_particles if self.dense else self.max_particles
+        if n < self.min_parallel_particles:
+            super()._move(dt)
+            return
+        message = (dt, n, self._pipeline)
+        for conn in self._connections:
+            conn.send(message)
+        for conn in self._connections:
+            conn.recv()
+
+    def close(self) -> None:
+        """Stops the worker processes and releases the shared memory."""
+        if not self._finalizer.alive:
+            return
+        for name in _SHARED_COLUMNS:
+            setattr(self, name, None)
+        self.active = None
+        self._shared = self._shared_mask = None
+        self._finalizer()
+
+    def __enter__(self) -> "ParallelParticleSystem":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ParticleEmitter:
+    """
+    Spawns particles into a ParticleSystem at a steady rate.
+
+    Each call to `emit` works out how many particles are due for the elapsed
+    time (carrying fractions over to the next call) and adds them with a
+    single `add_particles` call. Velocities are the base velocity plus a
+    uniform random offset of up to `velocity_spread` on each axis.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        pos_x: float,
+        pos_y: float,
+        vel_x: float = 0.0,
+        vel_y: float = 0.0,
+        velocity_spread: float = 0.0,
+        lifetime: float = 1.0,
+        seed: int | None = None,
+    ):
+        """
+        Args:
+            rate: Particles spawned per second.
+            pos_x, pos_y: Spawn position.
+            vel_x, vel_y: Base velocity of spawned particles.
+            velocity_spread: Maximum random velocity offset per axis.
+            lifetime: Lifetime of spawned particles, in seconds.
+            seed: Seed for the velocity randomization.
+        """
+        if rate < 0:
+            raise ValueError("rate must not be negative.")
+        self.rate = rate
+        self.pos_x = pos_x
+        self.pos_y = pos_y
+        self.vel_x = vel_x
+        self.vel_y = vel_y
+        self.velocity_spread = velocity_spread
+        self.lifetime = lifetime
+        self._pending: float = 0.0
+        self._random = random.Random(seed)
+        self._np_random = np.random.default_rng(seed) if np is not None else None
+
+    def emit(self, system: ParticleSystem, dt: float) -> int:
+        """
+        Spawns the particles due after `dt` seconds into `system`.
+        Returns the number of particles actually added.
+        """
+        self._pending += self.rate * dt
+        count = int(self._pending)
+        if count <= 0:
+            return 0
+        self._pending -= count
+
+        spread = self.velocity_spread
+        if getattr(system, "use_numpy", False):
+            rng = self._np_random
+            pos_x = np.full(count, self.pos_x)
+            pos_y = np.full(count, self.pos_y)
+            vel_x = self.vel_x + rng.uniform(-spread, spread, count)
+            vel_y = self.vel_y + rng.uniform(-spread, spread, count)
+        else:
+            uniform = self._random.uniform
+            pos_x = [self.pos_x] * count
+            pos_y = [self.pos_y] * count
+            vel_x = [self.vel_x + uniform(-spread, spread) for _ in range(count)]
+            vel_y = [self.vel_y + uniform(-spread, spread) for _ in range(count)]
+        return system.add_particles(pos_x, pos_y, vel_x, vel_y, self.lifetime)
+
+
+class GravityForce:
+    """Constant acceleration applied to every particle."""
+
+    phase = 0
+
+    def __init__(self, accel_x: float = 0.0, accel_y: float = -9.81):
+        self.accel_x = accel_x
+        self.accel_y = accel_y
+
+
+class DragForce:
+    """Linear drag: velocities decay by exp(-coefficient * dt) each step."""
+
+    phase = 0
+
+    def __init__(self, coefficient: float):
+        if coefficient < 0:
+            raise ValueError("coefficient must not be negative.")
+        self.coefficient = coefficient
+
+
+class AttractorForce:
+    """
+    Inverse-square attraction towards a point (repulsion if `strength` is
+    negative). `softening` keeps the force finite near the point.
+    """
+
+    phase = 0
+
+    def __init__(self, x: float, y: float, strength: float, softening: float = 1.0):
+        if softening <= 0:
+            raise ValueError("softening must be positive.")
+        self.x = x
+        self.y = y
+        self.strength = strength
+        self.softening = softening
+
+
+class BoundsConstraint:
+    """
+    Keeps particles inside an axis-aligned box. Particles that leave it are
+    clamped to the edge and bounce, keeping `restitution` of their speed.
+    """
+
+    phase = 2
+
+    def __init__(
+        self,
+        min_x: float,
+        min_y: float,
+        max_x: float,
+        max_y: float,
+        restitution: float = 1.0,
+    ):
+        if min_x > max_x or min_y > max_y:
+            raise ValueError("Bounds minimum must not exceed maximum.")
+        self.min_x = min_x
+        self.min_y = min_y
+        self.max_x = max_x
+        self.max_y = max_y
+        self.restitution = restitution
+
+
+class ParticlePipeline:
+    """
+    A fixed sequence of particle update stages, configured once.
+
+    Stages are run by phase: forces (GravityForce, DragForce,
+    AttractorForce) update velocities, then positions are integrated, then
+    constraints (BoundsConstraint) are resolved. When the pipeline is built,
+    all gravity stages are summed into one acceleration and all drag stages
+    into one decay factor, so that each step costs a minimal number of passes:
+    whole-array operations on NumPy-backed systems, or a single fused
+    per-particle loop otherwise.
+    """
+
+    def __init__(self, stages: list):
+        for stage in stages:
+            if not isinstance(stage, (GravityForce, DragForce, AttractorForce, BoundsConstraint)):
+                raise TypeError(f"Unsupported pipeline stage: {stage!r}")
+        self.stages = sorted(stages, key=lambda stage: stage.phase)
+
+        self._accel_x = sum(s.accel_x for s in stages if isinstance(s, GravityForce))
+        self._accel_y = sum(s.accel_y for s in stages if isinstance(s, GravityForce))
+        self._drag = sum(s.coefficient for s in stages if isinstance(s, DragForce))
+        self._attractors = [s for s in stages if isinstance(s, AttractorForce)]
+        self._bounds = [s for s in stages if isinstance(s, BoundsConstraint)]
+
+    def apply(self, system: ParticleSystem, dt: float):
+        """Runs every stage over the active particles of `system` for one step."""
+        n = system.num_active_particles if system.dense else system.max_particles
+        if getattr(system, "use_numpy", False):
+            self._apply_numpy(system, dt, n)
+        else:
+            self._apply_python(system, dt, n)
+
+    def _apply_numpy(self, system: ParticleSystem, dt: float, n: int):
+        # Inactive slots of sparse systems must keep a zero velocity.
+        self._apply_arrays(
+            system.positions_x[:n],
+            system.positions_y[:n],
+            system.velocities_x[:n],
+            system.velocities_y[:n],
+            True if system.dense else system.active[:n],
+            dt,
+        )
+
+    def _apply_arrays(self, px, py, vx, vy, where, dt: float):
+        """
+        Runs every stage in place over NumPy column slices. `where` masks the
+        slots whose velocities forces may change. Every stage is per-particle,
+        so disjoint slices can be updated independently.
+        """
+        if self._drag:
+            decay = math.exp(-self._drag * dt)
+            vx *= decay
+            vy *= decay
+        if self._accel_x:
+            np.add(vx, self._accel_x * dt, out=vx, where=where)
+        if self._accel_y:
+            np.add(vy, self._accel_y * dt, out=vy, where=where)
+        for attractor in self._attractors:
+            dx = attractor.x - px
+            dy = attractor.y - py
+            r2 = dx * dx + dy * dy + attractor.softening**2
+            scale = (attractor.strength * dt) / (r2 * np.sqrt(r2))
+            np.add(vx, dx * scale, out=vx, where=where)
+            np.add(vy, dy * scale, out=vy, where=where)
+
+        px += vx * dt
+        py += vy * dt
+
+        for bounds in self._bounds:
+            for pos, vel, low, high in (
+                (px, vx, bounds.min_x, bounds.max_x),
+                (py, vy, bounds.min_y, bounds.max_y),
+            ):
+                outside = (pos < low) | (pos > high)
+                if outside.any():
+                    vel[outside] *= -bounds.restitution
+                    np.clip(pos, low, high, out=pos)
+
+    def _apply_python(self, system: ParticleSystem, dt: float, n: int):
+        px = system.positions_x
+        py = system.positions_y
+        vx = system.velocities_x
+        vy = system.velocities_y
+        if system.dense:
+            indices = range(n)
+        else:
+            active = system.active
+            indices = [i for i in range(n) if active[i]]
+
+        decay = math.exp(-self._drag * dt)
+        dvx = self._accel_x * dt
+        dvy = self._accel_y * dt
+        attractors = [
+            (a.x, a.y, a.strength * dt, a.softening**2) for a in self._attractors
+        ]
+        bounds = [
+            (b.min_x, b.min_y, b.max_x, b.max_y, -b.restitution) for b in self._bounds
+        ]
+
+        # One fused pass: every stage for a particle before moving to the next.
+        for i in indices:
+            x, y = px[i], py[i]
+            u = vx[i] * decay + dvx
+            v = vy[i] * decay + dvy
+            for ax, ay, strength_dt, soft2 in attractors:
+                dx = ax - x
+                dy = ay - y
+                r2 = dx * dx + dy * dy + soft2
+                scale = strength_dt / (r2 * math.sqrt(r2))
+                u += dx * scale
+                v += dy * scale
+            x += u * dt
+            y += v * dt
+            for min_x, min_y, max_x, max_y, bounce in bounds:
+                if x < min_x or x > max_x:
+                    x = min_x if x < min_x else max_x
+                    u *= bounce
+                if y < min_y or y > max_y:
+                    y = min_y if y < min_y else max_y
+                    v *= bounce
+            px[i], py[i], vx[i], vy[i] = x, y, u, v
+
+
+class SoAStore:
+    """
+    A dense Structure of Arrays container for any schema of typed columns.
+
+    The schema maps column names to `array` typecodes, e.g.
+    {"x": "d", "y": "d", "damage": "f", "owner": "i"}. Records are packed in
+    indices [0, len(store)) exactly like a dense ParticleSystem: `add` returns
+    a stable handle, `remove` moves the last record into the hole, and a
+    handle table maps handles to their current index. Columns are NumPy arrays
+    when NumPy is available and `array.array` otherwise; `column()` returns a
+    zero-copy view of the live records for bulk processing.
+    """
+
+    def __init__(
+        self, schema: dict[str, str], capacity: int, use_numpy: bool | None = None
+    ):
+        """
+        Args:
+            schema: Mapping of column name to `array` typecode.
+            capacity: Maximum number of records.
+            use_numpy: Store columns as NumPy arrays. Defaults to True when
+                NumPy is installed.
+        """
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("capacity must be a positive integer.")
+        if not schema:
+            raise ValueError("schema must declare at least one column.")
+        if use_numpy is None:
+            use_numpy = np is not None
+        elif use_numpy and np is None:
+            raise ImportError("NumPy is required for use_numpy=True.")
+
+        self.capacity: int = capacity
+        self.use_numpy: bool = use_numpy
+        self._size: int = 0
+        self._columns: dict = {}
+        for name, typecode in schema.items():
+            check_typecode(typecode, name)
+            if use_numpy:
+                self._columns[name] = np.zeros(capacity, dtype=np.dtype(typecode))
+            else:
+                self._columns[name] = array(typecode, bytes(array(typecode).itemsize * capacity))
+
+        self._free_ids: list[int] = list(range(capacity - 1, -1, -1))
+        if use_numpy:
+            self._id_to_index = np.full(capacity, -1, dtype=np.intp)
+            self._index_to_id = np.zeros(capacity, dtype=np.intp)
+        else:
+            self._id_to_index = array("q", [-1]) * capacity
+            self._index_to_id = array("q", [0]) * capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, handle: int) -> bool:
+        return self.index_of(handle) >= 0
+
+    @property
+    def field_names(self) -> list[str]:
+        """The column names, in schema order."""
+        return list(self._columns)
+
+    def index_of(self, handle: int) -> int:
+        """Returns the current index of a live record, or -1."""
+        if not 0 <= handle < self.capacity:
+            return -1
+        return int(self._id_to_index[handle])
+
+    def _check_fields(self, names) -> None:
+        unknown = set(names) - self._columns.keys()
+        if unknown:
+            raise ValueError(f"Unknown column(s): {', '.join(sorted(unknown))}")
+
+    def add(self, **values) -> int | None:
+        """
+        Adds a record; columns not given are zero.
+        Returns its handle, or None if the store is full.
+        """
+        self._check_fields(values)
+        if not self._free_ids:
+            return None
+        handle = self._free_ids.pop()
+        idx = self._size
+        for name, column in self._columns.items():
+            column[idx] = values.get(name, 0)
+        self._id_to_index[handle] = idx
+        self._index_to_id[idx] = handle
+        self._size += 1
+        return handle
+
+    def add_many(self, **columns) -> list[int]:
+        """
+        Adds many records at once from equal-length sequences, one per
+        column; columns not given are zero. Records beyond the remaining
+        capacity are dropped.
+        Returns the handles of the added records.
+        """
+        self._check_fields(columns)
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("All columns passed to add_many must have the same length.")
+        count = min(lengths.pop() if lengths else 0, len(self._free_ids))
+        if count == 0:
+            return []
+
+        handles = self._free_ids[-count:][::-1]
+        del self._free_ids[-count:]
+        start, end = self._size, self._size + count
+        for name, column in self._columns.items():
+            values = columns.get(name)
+            if self.use_numpy:
+                column[start:end] = 0 if values is None else np.asarray(values)[:count]
+            elif values is None:
+                column[start:end] = array(column.typecode, bytes(column.itemsize * count))
+            else:
+                column[start:end] = array(column.typecode, values[:count])
+        if self.use_numpy:
+            ids = np.array(handles, dtype=np.intp)
+            self._index_to_id[start:end] = ids
+            self._id_to_index[ids] = np.arange(start, end)
+        else:
+            for offset, handle in enumerate(handles):
+                self._index_to_id[start + offset] = handle
+                self._id_to_index[handle] = start + offset
+        self._size = end
+        return handles
+
+    def remove(self, handle: int) -> bool:
+        """
+        Removes a record by moving the last record into its index.
+        Returns False if the handle is not live.
+        """
+        idx = self.index_of(handle)
+        if idx < 0:
+            return False
+        last = self._size - 1
+        if idx != last:
+            for column in self._columns.values():
+                column[idx] = column[last]
+            moved = int(self._index_to_id[last])
+            self._index_to_id[idx] = moved
+            self._id_to_index[moved] = idx
+        self._id_to_index[handle] = -1
+        self._free_ids.append(handle)
+        self._size = last
+        return True
+
+    def remove_where(self, mask) -> int:
+        """
+        Removes every record whose entry in `mask` (a boolean sequence
+        aligned with the live records, e.g. computed from column views) is
+        true, compacting the survivors in one sweep and keeping their order.
+        Returns the number of records removed.
+        """
+        n = self._size
+        if len(mask) != n:
+            raise ValueError("mask must have one entry per live record.")
+        if self.use_numpy:
+            dead = np.asarray(mask, dtype=np.bool_)
+            if not dead.any():
+                return 0
+            keep = ~dead
+            kept = int(np.count_nonzero(keep))
+            dead_ids = self._index_to_id[:n][dead]
+            kept_ids = self._index_to_id[:n][keep]
+            for column in self._columns.values():
+                column[:kept] = column[:n][keep]
+            self._index_to_id[:kept] = kept_ids
+            self._id_to_index[kept_ids] = np.arange(kept)
+            self._id_to_index[dead_ids] = -1
+            self._free_ids.extend(dead_ids.tolist())
+        else:
+            kept = 0
+            for idx in range(n):
+                handle = self._index_to_id[idx]
+                if mask[idx]:
+                    self._id_to_index[handle] = -1
+                    self._free_ids.append(handle)
+                    continue
+                if kept != idx:
+                    for column in self._columns.values():
+                        column[kept] = column[idx]
+                    self._index_to_id[kept] = handle
+                    self._id_to_index[handle] = kept
+                kept += 1
+        self._size = kept
+        return n - kept
+
+    def get(self, handle: int) -> dict | None:
+        """Returns a record as a dictionary, or None if the handle is not live."""
+        idx = self.index_of(handle)
+        if idx < 0:
+            return None
+        return {name: column[idx].item() if self.use_numpy else column[idx]
+                for name, column in self._columns.items()}
+
+    def set(self, handle: int, **values) -> None:
+        """
+        Updates columns of a live record.
+
+        Raises:
+            KeyError: If the handle is not live.
+        """
+        self._check_fields(values)
+        idx = self.index_of(handle)
+        if idx < 0:
+            raise KeyError(handle)
+        for name, value in values.items():
+            self._columns[name][idx] = value
+
+    def column(self, name: str):
+        """
+        Returns a zero-copy, writable view of a column over the live records:
+        a NumPy array view, or a memoryview of the `array` backend.
+        """
+        column = self._columns[name]
+        if self.use_numpy:
+            return column[: self._size]
+        return memoryview(column)[: self._size]
+
+    def ids(self):
+        """Returns a view of the handles of the live records, in index order."""
+        if self.use_numpy:
+            return self._index_to_id[: self._size]
+        return memoryview(self._index_to_id)[: self._size]
+
+    def chunks(self, chunk_size: int) -> Iterator[dict]:
+        """
+        Iterates over the live records in batches, yielding for each batch a
+        dictionary of column views (plus "id") covering at most
+        `chunk_size` records. Do not add or remove records while iterating.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive.")
+        views = {name: self.column(name) for name in self._columns}
+        views["id"] = self.ids()
+        for start in range(0, self._size, chunk_size):
+            yield {name: view[start : start + chunk_size] for name, view in views.items()}
 
 
 # For conceptual comparison: Array of Structures (AoS)
@@ -164,6 +1281,13 @@ class ParticleSystemAoS:
                 return i
         return None  # System full
 
+    def remove_particle(self, particle_id):
+        if 0 <= particle_id < len(self.particles) and self.particles[particle_id]:
+            self.particles[particle_id] = None
+            self.num_active_particles -= 1
+            return True
+        return False
+
     def update(self, dt):
         # When updating, e.g., all x positions, memory access is scattered
         # p.pos_x and p.vel_x are not necessarily contiguous for different particles.
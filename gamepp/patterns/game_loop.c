@@ -1,5 +1,7 @@
 #include "game_loop.h"
+#include <math.h>  // For fmod
 #include <stdio.h> // For printf, if needed for debugging or examples
+#include <stdlib.h> // For malloc, qsort
 
 #ifdef _WIN32
 #define WIN32_LEAN_AND_MEAN
@@ -9,6 +11,36 @@
 #include <unistd.h>  // For usleep (older POSIX, potentially)
 #endif
 
+// Accessors of the atomic running flag (see GameLoopRunFlag)
+#if defined(__STDC_VERSION__) && __STDC_VERSION__ >= 201112L && !defined(__STDC_NO_ATOMICS__)
+// Only before the loop is shared with other threads, i.e. in GameLoop_init
+static void run_flag_init(GameLoop* loop) {
+    atomic_init(&loop->is_running, false);
+}
+
+static bool run_flag_load(const GameLoop* loop) {
+    return atomic_load(&loop->is_running);
+}
+
+static bool run_flag_exchange(GameLoop* loop, bool value) {
+    return atomic_exchange(&loop->is_running, value);
+}
+#else
+#include <intrin.h>
+
+static void run_flag_init(GameLoop* loop) {
+    loop->is_running = 0;
+}
+
+static bool run_flag_load(const GameLoop* loop) {
+    return _InterlockedCompareExchange((volatile long*)&loop->is_running, 0, 0) != 0;
+}
+
+static bool run_flag_exchange(GameLoop* loop, bool value) {
+    return _InterlockedExchange(&loop->is_running, value ? 1 : 0) != 0;
+}
+#endif
+
 // Helper function to get current time in seconds (platform-specific)
 double get_current_time_seconds_os(GameLoop* loop) {
 #ifdef _WIN32
@@ -38,7 +70,7 @@ void platform_sleep_seconds_os(double seconds) {
 }
 
 void GameLoop_init(GameLoop* loop, double fixed_time_step) {
-    loop->is_running = false;
+    run_flag_init(loop);
     loop->last_time = 0.0;
     // Initialize handlers to NULL or no-op functions if preferred
     loop->process_input = NULL; 
@@ -50,6 +82,21 @@ void GameLoop_init(GameLoop* loop, double fixed_time_step) {
     loop->process_input_user_data_func = NULL;
     loop->update_user_data_func = NULL;
     loop->render_user_data_func = NULL;
+    loop->update_batch_user_data_func = NULL;
+    loop->frame_begin_func = NULL;
+    loop->frame_end_func = NULL;
+    loop->max_updates_per_frame = 0;
+    loop->max_lag = 0.0;
+    loop->catch_up_mode = GAMELOOP_CATCH_UP_DROP;
+    loop->min_time_scale = 0.1;
+    loop->time_scale = 1.0;
+    loop->dilation = 1.0;
+    loop->dropped_time = 0.0;
+    loop->dilated_time = 0.0;
+    loop->capped_frames = 0;
+    loop->sim_time = 0.0;
+    loop->update_count = 0;
+    loop->profiler = NULL;
 
 #ifdef _WIN32
     LARGE_INTEGER freq;
@@ -69,47 +116,151 @@ void GameLoop_init(GameLoop* loop, double fixed_time_step) {
     // no specific frequency initialization is typically needed in the loop struct itself.
 }
 
+// Per-frame recovery of the dilation factor once the loop keeps up.
+#define GAMELOOP_DILATION_RECOVERY 0.05
+
+static void GameLoop_call_process_input(GameLoop* loop) {
+    if (loop->process_input) {
+        // This branch is for the old way, if someone still uses it.
+        ((ProcessInputHandler)loop->process_input)();
+    } else if (loop->user_data && loop->process_input_user_data_func) {
+        loop->process_input_user_data_func(loop->user_data);
+    }
+}
+
+static void GameLoop_call_update(GameLoop* loop) {
+    if (loop->update) {
+        // This branch is for the old way.
+        ((UpdateHandler)loop->update)(loop->fixed_time_step);
+    } else if (loop->user_data && loop->update_user_data_func) {
+        loop->update_user_data_func(loop->fixed_time_step, loop->user_data);
+    } else if (loop->update_batch_user_data_func) {
+        loop->update_batch_user_data_func(loop->fixed_time_step, 1, loop->user_data);
+    }
+    loop->sim_time += loop->fixed_time_step;
+    loop->update_count++;
+}
+
+static void GameLoop_call_render(GameLoop* loop, double alpha) {
+    if (loop->render) {
+        // This branch is for the old way.
+        ((RenderHandler)loop->render)(alpha);
+    } else if (loop->user_data && loop->render_user_data_func) {
+        loop->render_user_data_func(alpha, loop->user_data);
+    }
+}
+
+int GameLoop_advance(GameLoop* loop, double elapsed_time) {
+    double step = loop->fixed_time_step;
+    int updates = 0;
+
+    loop->lag += elapsed_time * loop->time_scale * loop->dilation;
+    if (loop->max_lag > 0.0 && loop->lag > loop->max_lag) {
+        loop->dropped_time += loop->lag - loop->max_lag;
+        loop->lag = loop->max_lag;
+    }
+
+    if (loop->update_batch_user_data_func) {
+        // Take out all due steps first, then hand them over in one call.
+        while (loop->lag >= step) {
+            if (loop->max_updates_per_frame > 0 && updates >= loop->max_updates_per_frame) {
+                break;
+            }
+            loop->lag -= step;
+            updates++;
+        }
+        if (updates > 0) {
+            loop->update_batch_user_data_func(step, updates, loop->user_data);
+            loop->sim_time += updates * step;
+            loop->update_count += updates;
+        }
+    } else {
+        while (loop->lag >= step) {
+            if (loop->max_updates_per_frame > 0 && updates >= loop->max_updates_per_frame) {
+                break;
+            }
+            GameLoop_call_update(loop);
+            loop->lag -= step;
+            updates++;
+        }
+    }
+
+    if (loop->lag >= step) {
+        // Capped: give up the whole steps we could not simulate.
+        double backlog = loop->lag - fmod(loop->lag, step);
+        loop->lag -= backlog;
+        loop->capped_frames++;
+        if (loop->catch_up_mode == GAMELOOP_CATCH_UP_DILATE) {
+            double simulated = updates * step;
+            loop->dilated_time += backlog;
+            loop->dilation *= simulated / (simulated + backlog);
+            if (loop->dilation < loop->min_time_scale) {
+                loop->dilation = loop->min_time_scale;
+            }
+        } else {
+            loop->dropped_time += backlog;
+        }
+    } else if (loop->dilation < 1.0) {
+        loop->dilation += GAMELOOP_DILATION_RECOVERY;
+        if (loop->dilation > 1.0) {
+            loop->dilation = 1.0;
+        }
+    }
+    return updates;
+}
+
 void GameLoop_start(GameLoop* loop) {
-    if (loop->is_running) {
+    if (!GameLoop_mark_running(loop)) {
         return;
     }
+    GameLoop_run(loop);
+}
+
+bool GameLoop_mark_running(GameLoop* loop) {
+    return !run_flag_exchange(loop, true);
+}
 
-    loop->is_running = true;
+void GameLoop_run(GameLoop* loop) {
     loop->last_time = get_current_time_seconds_os(loop);
     loop->lag = 0.0; // Reset lag when starting
 
-    while (loop->is_running) {
+    while (run_flag_load(loop)) {
         double current_time = get_current_time_seconds_os(loop);
         double elapsed_time = current_time - loop->last_time;
         loop->last_time = current_time;
-        loop->lag += elapsed_time;
 
-        if (loop->process_input) {
-            // This branch is for the old way, if someone still uses it.
-            ((ProcessInputHandler)loop->process_input)();
-        } else if (loop->user_data && loop->process_input_user_data_func) {
-            loop->process_input_user_data_func(loop->user_data);
+        GameLoopProfiler* profiler = loop->profiler;
+        GameLoopFrameSample sample;
+        double phase_start = current_time;
+        double now;
+
+        if (loop->frame_begin_func) {
+            loop->frame_begin_func(loop->user_data);
+        }
+        GameLoop_call_process_input(loop);
+        if (profiler) {
+            now = get_current_time_seconds_os(loop);
+            sample.input_time = now - phase_start;
+            phase_start = now;
         }
 
         // Update game logic in fixed time steps
-        while (loop->lag >= loop->fixed_time_step) {
-            if (loop->update) {
-                // This branch is for the old way.
-                ((UpdateHandler)loop->update)(loop->fixed_time_step);
-            } else if (loop->user_data && loop->update_user_data_func) {
-                 loop->update_user_data_func(loop->fixed_time_step, loop->user_data);
-            }
-            loop->lag -= loop->fixed_time_step;
+        sample.updates = GameLoop_advance(loop, elapsed_time);
+        if (profiler) {
+            now = get_current_time_seconds_os(loop);
+            sample.update_time = now - phase_start;
+            phase_start = now;
         }
 
-        if (loop->render) {
-            // Alpha is useful for interpolating rendering between fixed updates
-            double alpha = loop->lag / loop->fixed_time_step;
-            // This branch is for the old way.
-            ((RenderHandler)loop->render)(alpha);
-        } else if (loop->user_data && loop->render_user_data_func) {
-            double alpha = loop->lag / loop->fixed_time_step;
-            loop->render_user_data_func(alpha, loop->user_data);
+        // Alpha is useful for interpolating rendering between fixed updates
+        GameLoop_call_render(loop, loop->lag / loop->fixed_time_step);
+        if (profiler) {
+            now = get_current_time_seconds_os(loop);
+            sample.render_time = now - phase_start;
+            phase_start = now;
+        }
+        if (loop->frame_end_func) {
+            loop->frame_end_func(loop->user_data);
         }
 
         // Optional: Add a small sleep to prevent hogging CPU
@@ -122,11 +273,74 @@ void GameLoop_start(GameLoop* loop) {
                 platform_sleep_seconds_os(sleep_time);
             }
         }
+
+        if (profiler) {
+            sample.sleep_time = get_current_time_seconds_os(loop) - phase_start;
+            GameLoopProfiler_record(profiler, &sample);
+        }
+    }
+}
+
+int GameLoop_step(GameLoop* loop, int n_updates, bool render) {
+    int updates = 0;
+    if (!GameLoop_mark_running(loop)) {
+        return 0;
+    }
+    while (updates < n_updates && run_flag_load(loop)) {
+        GameLoop_call_process_input(loop);
+        GameLoop_call_update(loop);
+        updates++;
+        if (render) {
+            GameLoop_call_render(loop, 0.0);
+        }
     }
+    run_flag_exchange(loop, false);
+    return updates;
+}
+
+int GameLoop_run_for(GameLoop* loop, double sim_seconds, bool render) {
+    double total;
+    int n_updates, updates;
+    if (run_flag_load(loop) || sim_seconds < 0.0) {
+        return 0;
+    }
+    total = loop->lag + sim_seconds;
+    // The epsilon absorbs rounding, e.g. 1.0s at 1/60 runs 60 updates.
+    n_updates = (int)(total / loop->fixed_time_step + 1e-9);
+    loop->lag = total - n_updates * loop->fixed_time_step;
+    if (loop->lag < 0.0) {
+        loop->lag = 0.0;
+    }
+    updates = GameLoop_step(loop, n_updates, render);
+    // Steps skipped because a handler stopped the loop stay in the lag.
+    loop->lag += (n_updates - updates) * loop->fixed_time_step;
+    return updates;
 }
 
 void GameLoop_stop(GameLoop* loop) {
-    loop->is_running = false;
+    run_flag_exchange(loop, false);
+}
+
+void GameLoop_set_max_updates_per_frame(GameLoop* loop, int max_updates) {
+    loop->max_updates_per_frame = max_updates > 0 ? max_updates : 0;
+}
+
+void GameLoop_set_max_lag(GameLoop* loop, double max_lag) {
+    loop->max_lag = max_lag > 0.0 ? max_lag : 0.0;
+}
+
+void GameLoop_set_catch_up_mode(GameLoop* loop, GameLoopCatchUpMode mode, double min_time_scale) {
+    loop->catch_up_mode = mode;
+    if (min_time_scale > 0.0 && min_time_scale <= 1.0) {
+        loop->min_time_scale = min_time_scale;
+    }
+    if (mode != GAMELOOP_CATCH_UP_DILATE) {
+        loop->dilation = 1.0;
+    }
+}
+
+void GameLoop_set_time_scale(GameLoop* loop, double time_scale) {
+    loop->time_scale = time_scale;
 }
 
 void GameLoop_set_process_input_handler(GameLoop* loop, ProcessInputHandler handler) {
@@ -137,6 +351,7 @@ void GameLoop_set_process_input_handler(GameLoop* loop, ProcessInputHandler hand
 void GameLoop_set_update_handler(GameLoop* loop, UpdateHandler handler) {
     loop->update = (void*)handler; // Cast to void* for storage
     loop->update_user_data_func = NULL; // Clear the other type of handler
+    loop->update_batch_user_data_func = NULL;
 }
 
 void GameLoop_set_render_handler(GameLoop* loop, RenderHandler handler) {
@@ -153,6 +368,18 @@ void GameLoop_set_process_input_handler_with_user_data(GameLoop* loop, ProcessIn
 void GameLoop_set_update_handler_with_user_data(GameLoop* loop, UpdateHandlerWithUserData handler) {
     loop->update_user_data_func = handler;
     loop->update = NULL; // Clear the other type of handler
+    loop->update_batch_user_data_func = NULL;
+}
+
+void GameLoop_set_update_batch_handler_with_user_data(GameLoop* loop, UpdateBatchHandlerWithUserData handler) {
+    loop->update_batch_user_data_func = handler;
+    loop->update = NULL; // Clear the per-step handlers
+    loop->update_user_data_func = NULL;
+}
+
+void GameLoop_set_frame_hooks_with_user_data(GameLoop* loop, FrameHookWithUserData begin, FrameHookWithUserData end) {
+    loop->frame_begin_func = begin;
+    loop->frame_end_func = end;
 }
 
 void GameLoop_set_render_handler_with_user_data(GameLoop* loop, RenderHandlerWithUserData handler) {
@@ -165,5 +392,103 @@ void GameLoop_set_user_data(GameLoop* loop, void* user_data) {
 }
 
 bool GameLoop_is_running(const GameLoop* loop) {
-    return loop->is_running;
+    return run_flag_load(loop);
+}
+
+void GameLoopProfiler_init(GameLoopProfiler* profiler, GameLoopFrameSample* samples, size_t capacity) {
+    profiler->samples = samples;
+    profiler->capacity = capacity;
+    profiler->count = 0;
+    profiler->export_handler = NULL;
+    profiler->export_user_data = NULL;
+}
+
+void GameLoopProfiler_set_export_handler(GameLoopProfiler* profiler, GameLoopProfilerExportHandler handler, void* user_data) {
+    profiler->export_handler = handler;
+    profiler->export_user_data = user_data;
+}
+
+void GameLoopProfiler_record(GameLoopProfiler* profiler, const GameLoopFrameSample* sample) {
+    if (profiler->capacity == 0) {
+        return;
+    }
+    profiler->samples[profiler->count % profiler->capacity] = *sample;
+    profiler->count++;
+    if (profiler->export_handler && profiler->count % profiler->capacity == 0) {
+        profiler->export_handler(profiler->samples, profiler->capacity, profiler->export_user_data);
+    }
+}
+
+void GameLoopProfiler_reset(GameLoopProfiler* profiler) {
+    profiler->count = 0;
+}
+
+size_t GameLoopProfiler_size(const GameLoopProfiler* profiler) {
+    return profiler->count < profiler->capacity ? profiler->count : profiler->capacity;
+}
+
+static double GameLoopProfiler_value(const GameLoopFrameSample* sample, GameLoopPhase phase) {
+    switch (phase) {
+        case GAMELOOP_PHASE_INPUT: return sample->input_time;
+        case GAMELOOP_PHASE_UPDATE: return sample->update_time;
+        case GAMELOOP_PHASE_RENDER: return sample->render_time;
+        case GAMELOOP_PHASE_SLEEP: return sample->sleep_time;
+        case GAMELOOP_PHASE_FRAME:
+            return sample->input_time + sample->update_time + sample->render_time + sample->sleep_time;
+        case GAMELOOP_PHASE_UPDATES: return (double)sample->updates;
+    }
+    return 0.0;
+}
+
+double GameLoopProfiler_mean(const GameLoopProfiler* profiler, GameLoopPhase phase) {
+    size_t n = GameLoopProfiler_size(profiler);
+    double total = 0.0;
+    for (size_t i = 0; i < n; i++) {
+        total += GameLoopProfiler_value(&profiler->samples[i], phase);
+    }
+    return n ? total / n : 0.0;
+}
+
+double GameLoopProfiler_max(const GameLoopProfiler* profiler, GameLoopPhase phase) {
+    size_t n = GameLoopProfiler_size(profiler);
+    double result = 0.0;
+    for (size_t i = 0; i < n; i++) {
+        double value = GameLoopProfiler_value(&profiler->samples[i], phase);
+        if (i == 0 || value > result) {
+            result = value;
+        }
+    }
+    return result;
+}
+
+static int compare_doubles(const void* a, const void* b) {
+    double x = *(const double*)a;
+    double y = *(const double*)b;
+    return (x > y) - (x < y);
+}
+
+double GameLoopProfiler_percentile(const GameLoopProfiler* profiler, GameLoopPhase phase, double percent) {
+    size_t n = GameLoopProfiler_size(profiler);
+    double* values;
+    double result;
+    size_t rank;
+    if (n == 0) {
+        return 0.0;
+    }
+    values = (double*)malloc(n * sizeof(double));
+    if (!values) {
+        return 0.0;
+    }
+    for (size_t i = 0; i < n; i++) {
+        values[i] = GameLoopProfiler_value(&profiler->samples[i], phase);
+    }
+    qsort(values, n, sizeof(double), compare_doubles);
+    rank = (size_t)ceil(percent / 100.0 * n);
+    result = values[rank > 0 ? (rank > n ? n - 1 : rank - 1) : 0];
+    free(values);
+    return result;
+}
+
+void GameLoop_set_profiler(GameLoop* loop, GameLoopProfiler* profiler) {
+    loop->profiler = profiler;
 }
@@ -2,6 +2,18 @@
 #define GAME_LOOP_H
 
 #include <stdbool.h> // For bool type
+#include <stddef.h>  // For size_t
+
+// The running flag is shared with threads that call GameLoop_stop, so it is
+// an atomic: C11 atomics, or interlocked intrinsics on MSVC without them.
+#if defined(__STDC_VERSION__) && __STDC_VERSION__ >= 201112L && !defined(__STDC_NO_ATOMICS__)
+#include <stdatomic.h>
+typedef atomic_bool GameLoopRunFlag;
+#elif defined(_MSC_VER)
+typedef volatile long GameLoopRunFlag; // Only accessed through _Interlocked* intrinsics
+#else
+#error "game_loop.h requires C11 atomics or MSVC interlocked intrinsics."
+#endif
 
 // Define function pointer types for handlers
 typedef void (*ProcessInputHandler)(void);
@@ -13,9 +25,52 @@ typedef void (*ProcessInputHandlerWithUserData)(void* user_data);
 typedef void (*UpdateHandlerWithUserData)(double dt, void* user_data);
 typedef void (*RenderHandlerWithUserData)(double alpha, void* user_data);
 
+// Runs n_steps fixed updates of dt seconds in one call
+typedef void (*UpdateBatchHandlerWithUserData)(double dt, int n_steps, void* user_data);
+// Called at the start and end of the work of each frame (before pacing)
+typedef void (*FrameHookWithUserData)(void* user_data);
+
+// What GameLoop_start does with whole steps left over when a frame hits
+// max_updates_per_frame (see GameLoop_set_catch_up_mode).
+typedef enum {
+    GAMELOOP_CATCH_UP_DROP = 0,   // Discard them and count them in dropped_time
+    GAMELOOP_CATCH_UP_DILATE = 1  // Discard them and slow down the game clock
+} GameLoopCatchUpMode;
+
+// Durations of the phases of one frame, in seconds (see GameLoopProfiler)
+typedef struct {
+    double input_time;
+    double update_time;   // All fixed updates of the frame
+    double render_time;
+    double sleep_time;    // Pacing
+    int updates;          // Fixed updates run in the frame
+} GameLoopFrameSample;
+
+typedef enum {
+    GAMELOOP_PHASE_INPUT = 0,
+    GAMELOOP_PHASE_UPDATE,
+    GAMELOOP_PHASE_RENDER,
+    GAMELOOP_PHASE_SLEEP,
+    GAMELOOP_PHASE_FRAME,     // Sum of the four phases above
+    GAMELOOP_PHASE_UPDATES    // Updates per frame
+} GameLoopPhase;
+
+// Called with the whole ring each time `capacity` new frames were recorded
+typedef void (*GameLoopProfilerExportHandler)(const GameLoopFrameSample* samples, size_t count, void* user_data);
+
+// Opt-in frame profiler. The caller owns the sample ring buffer; the loop
+// only writes into it, so recording never allocates.
+typedef struct {
+    GameLoopFrameSample* samples;
+    size_t capacity;
+    size_t count;                 // Frames recorded since init or reset
+    GameLoopProfilerExportHandler export_handler;
+    void* export_user_data;
+} GameLoopProfiler;
+
 // GameLoop structure
 typedef struct {
-    bool is_running;
+    GameLoopRunFlag is_running; // Use GameLoop_is_running/GameLoop_stop; safe from any thread
     double last_time;       // Stores time in seconds, obtained from high-resolution timer
     ProcessInputHandler process_input;
     UpdateHandler update;
@@ -34,12 +89,58 @@ typedef struct {
     ProcessInputHandlerWithUserData process_input_user_data_func;
     UpdateHandlerWithUserData update_user_data_func;
     RenderHandlerWithUserData render_user_data_func;
+    UpdateBatchHandlerWithUserData update_batch_user_data_func;
+    FrameHookWithUserData frame_begin_func;
+    FrameHookWithUserData frame_end_func;
+
+    // Spiral-of-death protection. Defaults leave the loop unbounded.
+    int max_updates_per_frame;     // 0 = no limit
+    double max_lag;                // Seconds; 0 = no clamp
+    GameLoopCatchUpMode catch_up_mode;
+    double min_time_scale;         // Lower bound of dilation
+    double time_scale;             // Game seconds per real second
+    double dilation;               // Current catch-up dilation factor, in [min_time_scale, 1]
+    double dropped_time;           // Game seconds discarded by clamping or DROP
+    double dilated_time;           // Game seconds discarded by DILATE
+    unsigned long long capped_frames; // Frames that hit max_updates_per_frame
+
+    // Virtual clock, advanced by every fixed update
+    double sim_time;               // Game seconds simulated so far
+    unsigned long long update_count;
+
+    GameLoopProfiler* profiler;    // NULL = profiling disabled
 } GameLoop;
 
 // Function prototypes
 void GameLoop_init(GameLoop* loop, double fixed_time_step);
 void GameLoop_start(GameLoop* loop);
 void GameLoop_stop(GameLoop* loop);
+// Runs the frame loop of GameLoop_start until is_running is cleared,
+// without setting it first. Call GameLoop_mark_running before handing the
+// loop to another thread, so that a GameLoop_stop issued before the thread
+// gets here is not lost.
+void GameLoop_run(GameLoop* loop);
+// Atomically sets is_running. Returns false if the loop was already running.
+bool GameLoop_mark_running(GameLoop* loop);
+
+// Adds elapsed_time real seconds to the lag and runs the fixed updates it
+// covers, applying the catch-up limits. Returns the number of updates run.
+int GameLoop_advance(GameLoop* loop, double elapsed_time);
+
+// Headless stepping: run fixed updates back to back, without the wall clock.
+// Each update is preceded by process_input and, if render is true, followed
+// by render(0.0). Both stop early if a handler calls GameLoop_stop and
+// return the number of updates run.
+int GameLoop_step(GameLoop* loop, int n_updates, bool render);
+// Advances the virtual clock by sim_seconds, carrying partial steps over,
+// and the steps not run if a handler stopped the loop.
+int GameLoop_run_for(GameLoop* loop, double sim_seconds, bool render);
+
+// Catch-up limits
+void GameLoop_set_max_updates_per_frame(GameLoop* loop, int max_updates);
+void GameLoop_set_max_lag(GameLoop* loop, double max_lag);
+void GameLoop_set_catch_up_mode(GameLoop* loop, GameLoopCatchUpMode mode, double min_time_scale);
+void GameLoop_set_time_scale(GameLoop* loop, double time_scale);
 
 void GameLoop_set_process_input_handler(GameLoop* loop, ProcessInputHandler handler);
 void GameLoop_set_update_handler(GameLoop* loop, UpdateHandler handler);
@@ -50,9 +151,33 @@ void GameLoop_set_process_input_handler_with_user_data(GameLoop* loop, ProcessIn
 void GameLoop_set_update_handler_with_user_data(GameLoop* loop, UpdateHandlerWithUserData handler);
 void GameLoop_set_render_handler_with_user_data(GameLoop* loop, RenderHandlerWithUserData handler);
 void GameLoop_set_user_data(GameLoop* loop, void* user_data);
+// Replaces the update handler with one that receives all fixed updates due
+// in a frame at once. Clears the per-step update handlers.
+void GameLoop_set_update_batch_handler_with_user_data(GameLoop* loop, UpdateBatchHandlerWithUserData handler);
+// Sets hooks around the input/update/render work of every frame, e.g. to
+// acquire and release a lock once per frame instead of once per callback.
+void GameLoop_set_frame_hooks_with_user_data(GameLoop* loop, FrameHookWithUserData begin, FrameHookWithUserData end);
 
+// GameLoop_is_running and GameLoop_stop may be called from any thread while
+// the loop runs. Everything else, including the handler setters, must be
+// called from the thread running the loop (e.g. from a handler) or while it
+// is stopped.
 bool GameLoop_is_running(const GameLoop* loop);
 
+// Frame profiling
+void GameLoopProfiler_init(GameLoopProfiler* profiler, GameLoopFrameSample* samples, size_t capacity);
+void GameLoopProfiler_set_export_handler(GameLoopProfiler* profiler, GameLoopProfilerExportHandler handler, void* user_data);
+void GameLoopProfiler_record(GameLoopProfiler* profiler, const GameLoopFrameSample* sample);
+void GameLoopProfiler_reset(GameLoopProfiler* profiler);
+size_t GameLoopProfiler_size(const GameLoopProfiler* profiler);   // Frames held in the ring
+double GameLoopProfiler_mean(const GameLoopProfiler* profiler, GameLoopPhase phase);
+double GameLoopProfiler_max(const GameLoopProfiler* profiler, GameLoopPhase phase);
+// Nearest-rank percentile (0-100) over the ring; 0.0 if it is empty.
+// Allocates a scratch copy, so call it outside the frame loop.
+double GameLoopProfiler_percentile(const GameLoopProfiler* profiler, GameLoopPhase phase, double percent);
+// Attaches a profiler to the loop, or detaches it with NULL.
+void GameLoop_set_profiler(GameLoop* loop, GameLoopProfiler* profiler);
+
 // Helper function to get current time in seconds.
 // Implementation is in game_loop.c and handles platform specifics.
 double get_current_time_seconds_os(GameLoop* loop);
@@ -1,5 +1,230 @@
+import asyncio
+import inspect
+import math
 import time
-from typing import Callable
+from array import array
+from typing import Callable, Iterator
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; buffers fall back to Python loops.
+    np = None
+
+
+class StateSnapshot:
+    """
+    Keeps the previous fixed-step value of a numeric state buffer so render
+    can interpolate between the last two simulation steps.
+
+    The buffer (a NumPy array, `array.array`, list or any other writable
+    buffer of numbers) stays owned by the game: the update handler mutates it
+    in place, and the snapshot copies it into `previous` with one bulk slice
+    assignment before every fixed update. With NumPy, `interpolate` is three
+    whole-array operations into a preallocated output buffer.
+
+    The snapshot only reads the buffer while copying it, so buffers that can
+    grow, such as `array.array`, may still be resized; the next capture then
+    reallocates `previous` to the new size.
+    """
+
+    __slots__ = ("current", "previous", "_out")
+
+    def __init__(self, buffer):
+        self.current = buffer
+        self._allocate()
+
+    def _allocate(self) -> None:
+        """Allocates `previous` as a copy of the current state."""
+        buffer = self.current
+        self._out = None
+        if np is not None and not isinstance(buffer, list):
+            # A copy rather than a view: a view would keep the buffer
+            # exported, and resizing e.g. an array.array would then fail.
+            try:
+                self.previous = np.array(buffer, copy=True)
+            except (TypeError, ValueError):
+                pass
+            else:
+                self._out = np.empty_like(
+                    self.previous, dtype=np.result_type(self.previous, 1.0)
+                )
+                return
+        self.previous = (
+            array(buffer.typecode, buffer) if isinstance(buffer, array) else list(buffer)
+        )
+
+    def capture(self) -> None:
+        """Copies the current state into the previous-step buffer."""
+        if len(self.previous) != len(self.current):
+            self._allocate()  # The buffer was resized since the last capture.
+        else:
+            self.previous[:] = self.current
+
+    def interpolate(self, alpha: float):
+        """
+        Returns previous * (1 - alpha) + current * alpha.
+        For NumPy buffers the result is an array owned by the snapshot and
+        overwritten by the next call; copy it if it must outlive the frame.
+        Other buffers are interpolated element by element into a new list.
+        """
+        current, previous, out = self.current, self.previous, self._out
+        if out is None:
+            return [p + (c - p) * alpha for p, c in zip(previous, current)]
+        np.subtract(current, previous, out=out)
+        out *= alpha
+        out += previous
+        return out
+
+
+class FrameProfiler:
+    """
+    Records per-frame phase durations of a game loop into preallocated ring
+    buffers: input, update (all fixed updates of the frame), render and
+    sleep (pacing), in seconds, plus the number of fixed updates run.
+
+    `summary()` reports mean, p50, p95, p99 and max of each phase over the
+    frames in the ring. If an `export_hook` is given, it is called with the
+    samples of every `capacity` frames recorded, as a list of
+    (input, update, render, sleep, updates) tuples, e.g. to stream them to a
+    file or a metrics service.
+    """
+
+    PHASES = ("input", "update", "render", "sleep")
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        export_hook: Callable[[list[tuple]], None] | None = None,
+    ):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.capacity: int = capacity
+        self.export_hook = export_hook
+        self._phases = {phase: array("d", bytes(8 * capacity)) for phase in self.PHASES}
+        self._updates = array("l", bytes(array("l").itemsize * capacity))
+        self._count: int = 0
+
+    def record(
+        self,
+        input_time: float,
+        update_time: float,
+        render_time: float,
+        sleep_time: float,
+        updates: int,
+    ) -> None:
+        """Records one frame."""
+        index = self._count % self.capacity
+        phases = self._phases
+        phases["input"][index] = input_time
+        phases["update"][index] = update_time
+        phases["render"][index] = render_time
+        phases["sleep"][index] = sleep_time
+        self._updates[index] = updates
+        self._count += 1
+        if self.export_hook is not None and self._count % self.capacity == 0:
+            self.export_hook(self.samples())
+
+    def __len__(self) -> int:
+        """The number of frames held in the ring."""
+        return min(self._count, self.capacity)
+
+    @property
+    def total_frames(self) -> int:
+        """The number of frames recorded since creation or reset."""
+        return self._count
+
+    def samples(self) -> list[tuple]:
+        """
+        Returns the frames held in the ring, oldest first, as
+        (input, update, render, sleep, updates) tuples.
+        """
+        count = len(self)
+        start = self._count - count
+        order = [(start + i) % self.capacity for i in range(count)]
+        phases = [self._phases[phase] for phase in self.PHASES]
+        return [tuple(column[i] for column in phases) + (self._updates[i],) for i in order]
+
+    @staticmethod
+    def _distribution(values) -> dict[str, float]:
+        ordered = sorted(values)
+        n = len(ordered)
+
+        def percentile(p: float) -> float:
+            # Nearest-rank percentile.
+            return ordered[max(0, math.ceil(p / 100 * n) - 1)]
+
+        return {
+            "mean": sum(ordered) / n,
+            "p50": percentile(50),
+            "p95": percentile(95),
+            "p99": percentile(99),
+            "max": ordered[-1],
+        }
+
+    def summary(self) -> dict:
+        """
+        Returns {"frames": n, "<phase>": {"mean", "p50", "p95", "p99", "max"},
+        "frame": ..., "updates_per_frame": ...} over the frames in the ring,
+        where "frame" is the sum of the phases.
+        """
+        count = len(self)
+        if count == 0:
+            return {"frames": 0}
+        result: dict = {"frames": count}
+        for phase in self.PHASES:
+            result[phase] = self._distribution(self._phases[phase][:count])
+        result["frame"] = self._distribution(
+            [sum(values) for values in zip(*(self._phases[p][:count] for p in self.PHASES))]
+        )
+        result["updates_per_frame"] = self._distribution(self._updates[:count])
+        return result
+
+    def reset(self) -> None:
+        """Discards the recorded frames."""
+        self._count = 0
+
+
+class ScheduledSystem:
+    """
+    An update handler registered with GameLoop.add_system, run at its own
+    fixed `rate` (steps per game second) from its own accumulator.
+
+    Systems due at the same game time run by descending `priority`, then in
+    registration order. At most `max_steps_per_frame` steps run per frame if
+    set; whole steps beyond that are dropped and counted in `dropped_time`.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[float], None],
+        rate: float,
+        priority: int = 0,
+        name: str | None = None,
+        max_steps_per_frame: int | None = None,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        if max_steps_per_frame is not None and max_steps_per_frame < 1:
+            raise ValueError("max_steps_per_frame must be at least 1.")
+        self.handler = handler
+        self.rate: float = rate
+        self.time_step: float = 1.0 / rate
+        self.priority: int = priority
+        self.name: str = name if name is not None else getattr(handler, "__name__", "system")
+        self.max_steps_per_frame: int | None = max_steps_per_frame
+        self.accumulator: float = 0.0
+        self.update_count: int = 0
+        self.dropped_time: float = 0.0
+        self._frame_steps: int = 0
+        self._carried: float = 0.0  # Accumulator left over from earlier frames
+
+    @property
+    def sim_time(self) -> float:
+        """Game seconds simulated by this system so far."""
+        return self.update_count * self.time_step
+
+    def __repr__(self) -> str:
+        return f"ScheduledSystem({self.name!r}, rate={self.rate}, priority={self.priority})"
 
 
 class GameLoop:
@@ -10,11 +235,66 @@ class GameLoop:
     it processes user input without blocking, updates the game state, and
     renders the game. It tracks the passage of time to control the rate of
     gameplay.
+
+    If updates take longer than the time they simulate, the lag grows every
+    frame and the loop never catches up (the "spiral of death"). Setting
+    `max_updates_per_frame` bounds the updates run per frame; the whole steps
+    left over are then either dropped (`catch_up="drop"`) or absorbed by
+    slowing down the game clock (`catch_up="dilate"`) until the simulation
+    keeps up again. `max_lag` additionally clamps the lag carried over from
+    a long stall, such as a breakpoint or a window drag. Time lost either way
+    is reported by `dropped_time` and `dilated_time`.
+
+    Frames are paced by `pacing`: "sleep" yields with `time.sleep`, whose
+    granularity (often 1ms or more) shows up as frame jitter; "hybrid" sleeps
+    until `spin_threshold` seconds before the deadline and then spin-waits on
+    `time.perf_counter`; "none" never waits. The deadline is the next frame
+    of `target_render_rate` if one is set, otherwise the next fixed update.
+    `frame_time_stats()` summarizes the most recent frame times, and
+    `enable_profiling()` records where each frame's time goes.
+
+    For servers, tests and replays, `step()` and `run_for()` drive the same
+    fixed updates headlessly from a virtual clock, as fast as the CPU allows.
+
+    Subsystems that need a rate other than `fixed_time_step`, such as 10 Hz
+    AI next to 120 Hz physics, are registered with `add_system()`. Each
+    keeps its own accumulator, fed with the same game time as the update
+    handler, and runs after it in each frame in game-time order.
     """
 
+    CATCH_UP_MODES = ("drop", "dilate")
+    PACING_MODES = ("sleep", "hybrid", "none")
+    # Per-frame recovery of the dilation factor once the loop keeps up.
+    DILATION_RECOVERY = 0.05
+
     def __init__(
-        self, fixed_time_step: float = 1 / 60
-    ):  # Default to 60 updates per second
+        self,
+        fixed_time_step: float = 1 / 60,  # Default to 60 updates per second
+        max_updates_per_frame: int | None = None,
+        max_lag: float | None = None,
+        catch_up: str = "drop",
+        min_time_scale: float = 0.1,
+        pacing: str = "sleep",
+        target_render_rate: float | None = None,
+        spin_threshold: float = 0.002,
+        frame_stats_window: int = 240,
+    ):
+        if max_updates_per_frame is not None and max_updates_per_frame < 1:
+            raise ValueError("max_updates_per_frame must be at least 1.")
+        if max_lag is not None and max_lag <= 0:
+            raise ValueError("max_lag must be positive.")
+        if catch_up not in self.CATCH_UP_MODES:
+            raise ValueError(f"catch_up must be one of {self.CATCH_UP_MODES}.")
+        if not 0 < min_time_scale <= 1:
+            raise ValueError("min_time_scale must be in (0, 1].")
+        if pacing not in self.PACING_MODES:
+            raise ValueError(f"pacing must be one of {self.PACING_MODES}.")
+        if target_render_rate is not None and target_render_rate <= 0:
+            raise ValueError("target_render_rate must be positive.")
+        if spin_threshold < 0:
+            raise ValueError("spin_threshold must not be negative.")
+        if frame_stats_window < 1:
+            raise ValueError("frame_stats_window must be at least 1.")
         self._is_running = False
         self._last_time = 0.0
         self.process_input: Callable[[], None] = lambda: None
@@ -22,6 +302,119 @@ class GameLoop:
         self.render: Callable[[float], None] = lambda alpha: None
         self._fixed_time_step: float = fixed_time_step
         self._lag: float = 0.0
+        self._snapshots: dict[str, StateSnapshot] = {}
+        self._sim_time: float = 0.0
+        self._update_count: int = 0
+
+        self.max_updates_per_frame: int | None = max_updates_per_frame
+        self.max_lag: float | None = max_lag
+        self.catch_up: str = catch_up
+        self.min_time_scale: float = min_time_scale
+        self.time_scale: float = 1.0  # Game seconds per real second
+        self._dilation: float = 1.0
+        self.dropped_time: float = 0.0
+        self.dilated_time: float = 0.0
+        self.capped_frames: int = 0
+
+        self.pacing: str = pacing
+        self.target_render_rate: float | None = target_render_rate
+        self.spin_threshold: float = spin_threshold
+        self._next_frame_time: float = 0.0
+        self._frame_times = array("d", bytes(8 * frame_stats_window))
+        self._frame_count: int = 0
+        self._profiler: FrameProfiler | None = None
+        self._systems: list[ScheduledSystem] = []
+
+    def add_system(
+        self,
+        handler: Callable[[float], None],
+        rate: float,
+        priority: int = 0,
+        name: str | None = None,
+        max_steps_per_frame: int | None = None,
+    ) -> ScheduledSystem:
+        """
+        Registers `handler` to run `rate` times per game second, called with
+        its own time step. Returns the ScheduledSystem, e.g. for remove_system.
+        """
+        system = ScheduledSystem(handler, rate, priority, name, max_steps_per_frame)
+        # Stable sort: equal priorities keep their registration order.
+        self._systems.append(system)
+        self._systems.sort(key=lambda s: -s.priority)
+        return system
+
+    def remove_system(self, system: ScheduledSystem) -> None:
+        """Unregisters a system; takes effect before its next step, even mid-frame."""
+        if system in self._systems:
+            self._systems.remove(system)
+
+    @property
+    def systems(self) -> list[ScheduledSystem]:
+        """The registered systems, by descending priority then registration order."""
+        return list(self._systems)
+
+    def _due_systems(self, game_seconds: float) -> Iterator[ScheduledSystem]:
+        """
+        Adds `game_seconds` to every system's accumulator and yields a system
+        for each step that falls due, earliest game time first (ties by
+        priority, then registration order). The caller runs the step.
+        """
+        for system in self._systems:
+            system._carried = system.accumulator
+            system.accumulator += game_seconds
+            system._frame_steps = 0
+        while True:
+            chosen = None
+            chosen_time = 0.0
+            for system in self._systems:
+                # The epsilon absorbs rounding, e.g. 12 steps of 1/120 make 1/10.
+                if system.accumulator + 1e-9 < system.time_step or (
+                    system.max_steps_per_frame is not None
+                    and system._frame_steps >= system.max_steps_per_frame
+                ):
+                    continue
+                # Game time into the frame at which this step falls due; the
+                # tolerance keeps simultaneous steps in priority order.
+                due = (system._frame_steps + 1) * system.time_step - system._carried
+                if chosen is None or due < chosen_time - 1e-9:
+                    chosen, chosen_time = system, due
+            if chosen is None:
+                break
+            yield chosen
+            chosen.accumulator -= chosen.time_step
+            chosen.update_count += 1
+            chosen._frame_steps += 1
+        for system in self._systems:
+            if system.accumulator + 1e-9 >= system.time_step:
+                # Capped: give up the whole steps this system could not run.
+                backlog = int(system.accumulator / system.time_step + 1e-9) * system.time_step
+                system.accumulator -= backlog
+                system.dropped_time += backlog
+
+    def _run_systems(self, game_seconds: float) -> None:
+        for system in self._due_systems(game_seconds):
+            system.handler(system.time_step)
+
+    def enable_profiling(
+        self,
+        capacity: int = 1024,
+        export_hook: Callable[[list[tuple]], None] | None = None,
+    ) -> FrameProfiler:
+        """
+        Starts recording per-phase frame timings into a new FrameProfiler.
+        Returns the profiler.
+        """
+        self._profiler = FrameProfiler(capacity, export_hook)
+        return self._profiler
+
+    def disable_profiling(self) -> None:
+        """Stops recording frame timings. Disabled profiling costs one check per frame phase."""
+        self._profiler = None
+
+    @property
+    def profiler(self) -> FrameProfiler | None:
+        """The active FrameProfiler, or None if profiling is disabled."""
+        return self._profiler
 
     def start(self) -> None:
         """Starts the game loop with a fixed time step for updates."""
@@ -31,30 +424,40 @@ class GameLoop:
         self._is_running = True
         self._last_time = time.perf_counter()
         self._lag = 0.0  # Reset lag when starting
+        self._next_frame_time = self._last_time
+        first_frame = True
 
         while self._is_running:
             current_time = time.perf_counter()
             elapsed_time = current_time - self._last_time
             self._last_time = current_time
-            self._lag += elapsed_time
+            if first_frame:
+                first_frame = False
+            else:
+                self._record_frame_time(elapsed_time)
+
+            profiler = self._profiler
 
             self.process_input()
+            if profiler is not None:
+                input_done = time.perf_counter()
 
             # Update game logic in fixed time steps
-            while self._lag >= self._fixed_time_step:
-                self.update(self._fixed_time_step)
-                self._lag -= self._fixed_time_step
+            updates = self._advance(elapsed_time)
+            if profiler is not None:
+                update_done = time.perf_counter()
 
             self.render(
                 self._lag / self._fixed_time_step
             )  # Useful for interpolating rendering
+            if profiler is not None:
+                render_done = time.perf_counter()
 
-            # Optional: Add a small sleep to prevent hogging CPU if updates are too fast
-            # and to yield time to other processes.
-            # This can be more sophisticated, e.g., sleeping for the remaining time
-            # until the next expected frame if VSync or a target FPS is desired.
-            # For now, a minimal sleep if no updates happened can be useful.
-            if (
+            if self.pacing != "sleep" or self.target_render_rate is not None:
+                self._pace(current_time)
+            # Default pacing: add a small sleep to prevent hogging CPU if
+            # updates are too fast and to yield time to other processes.
+            elif (
                 elapsed_time < self._fixed_time_step
             ):  # Heuristic: if we are running faster than updates
                 sleep_time = (
@@ -65,6 +468,266 @@ class GameLoop:
                 if sleep_time > 0:
                     time.sleep(sleep_time)
 
+            if profiler is not None:
+                profiler.record(
+                    input_done - current_time,
+                    update_done - input_done,
+                    render_done - update_done,
+                    time.perf_counter() - render_done,
+                    updates,
+                )
+
+    def _frame_deadline(self, frame_start: float) -> float | None:
+        """
+        Returns when the frame that began at `frame_start` should end: at the
+        next frame of the target render rate, or else at the next fixed
+        update. Returns None if the game clock is paused.
+        """
+        if self.target_render_rate is not None:
+            period = 1.0 / self.target_render_rate
+            # Schedule from the previous deadline so that the rate does not
+            # drift, but do not try to make up for frames that ran long.
+            deadline = max(self._next_frame_time + period, frame_start)
+            self._next_frame_time = deadline
+            return deadline
+        clock_rate = self.time_scale * self._dilation
+        if clock_rate <= 0:
+            return None
+        return frame_start + (self._fixed_time_step - self._lag) / clock_rate
+
+    def _pace(self, frame_start: float) -> None:
+        """Waits until the deadline of the frame that began at `frame_start`."""
+        if self.pacing == "none":
+            return
+        deadline = self._frame_deadline(frame_start)
+        if deadline is None:
+            return
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return
+        if self.pacing == "sleep":
+            time.sleep(remaining)
+            return
+        if remaining > self.spin_threshold:
+            time.sleep(remaining - self.spin_threshold)
+        while time.perf_counter() < deadline:
+            pass
+
+    def _record_frame_time(self, frame_time: float) -> None:
+        frame_times = self._frame_times
+        frame_times[self._frame_count % len(frame_times)] = frame_time
+        self._frame_count += 1
+
+    def frame_time_stats(self) -> dict[str, float | int]:
+        """
+        Summarizes the most recent frame times (the interval between the
+        starts of consecutive frames), in seconds: mean, min, max, jitter
+        (standard deviation) and, with a target render rate, the mean
+        absolute error from the target frame time.
+        """
+        count = min(self._frame_count, len(self._frame_times))
+        if count == 0:
+            return {"frames": 0}
+        samples = self._frame_times[:count]
+        mean = sum(samples) / count
+        stats = {
+            "frames": count,
+            "mean": mean,
+            "min": min(samples),
+            "max": max(samples),
+            "jitter": math.sqrt(sum((t - mean) ** 2 for t in samples) / count),
+        }
+        if self.target_render_rate is not None:
+            target = 1.0 / self.target_render_rate
+            stats["target"] = target
+            stats["mean_error"] = sum(abs(t - target) for t in samples) / count
+        return stats
+
+    def reset_frame_time_stats(self) -> None:
+        """Discards the recorded frame times."""
+        self._frame_count = 0
+
+    def _advance(self, elapsed_time: float) -> int:
+        """
+        Adds `elapsed_time` real seconds to the lag and runs the fixed updates
+        it covers, applying the catch-up limits.
+        Returns the number of updates run.
+        """
+        lag_before = self._lag
+        self._accumulate(elapsed_time)
+        updates = 0
+        while self._update_due(updates):
+            self._fixed_update()
+            self._lag -= self._fixed_time_step
+            updates += 1
+        self._settle(updates)
+        if self._systems:
+            self._run_systems(self._frame_game_time(lag_before, updates))
+        return updates
+
+    def _frame_game_time(self, lag_before: float, updates: int) -> float:
+        """
+        Game time that passed in a frame that ran `updates` fixed updates,
+        after clamping and catch-up: what scheduled systems are fed.
+        """
+        return max(0.0, updates * self._fixed_time_step + self._lag - lag_before)
+
+    def _accumulate(self, elapsed_time: float) -> None:
+        """Adds `elapsed_time` real seconds to the lag, clamped to max_lag."""
+        self._lag += elapsed_time * self.time_scale * self._dilation
+        if self.max_lag is not None and self._lag > self.max_lag:
+            self.dropped_time += self._lag - self.max_lag
+            self._lag = self.max_lag
+
+    def _update_due(self, updates: int) -> bool:
+        """Whether another fixed update runs in a frame that has run `updates`."""
+        if self._lag < self._fixed_time_step:
+            return False
+        return self.max_updates_per_frame is None or updates < self.max_updates_per_frame
+
+    def _settle(self, updates: int) -> None:
+        """Applies the catch-up policy after a frame ran `updates` updates."""
+        step = self._fixed_time_step
+        if self._lag >= step:
+            # Capped: give up the whole steps we could not simulate.
+            backlog = self._lag - self._lag % step
+            self._lag -= backlog
+            self.capped_frames += 1
+            if self.catch_up == "dilate":
+                self.dilated_time += backlog
+                simulated = updates * step
+                self._dilation = max(
+                    self.min_time_scale,
+                    self._dilation * simulated / (simulated + backlog),
+                )
+            else:
+                self.dropped_time += backlog
+        elif self._dilation < 1.0:
+            self._dilation = min(1.0, self._dilation + self.DILATION_RECOVERY)
+
+    @property
+    def dilation(self) -> float:
+        """
+        The factor, in [min_time_scale, 1], by which catch-up dilation is
+        currently slowing down the game clock.
+        """
+        return self._dilation
+
+    def _fixed_update(self) -> None:
+        """Snapshots the registered state, then runs one fixed update."""
+        self._capture_states()
+        self.update(self._fixed_time_step)
+        self._count_update()
+
+    def _capture_states(self) -> None:
+        if self._snapshots:
+            for snapshot in self._snapshots.values():
+                snapshot.capture()
+
+    def _count_update(self) -> None:
+        self._sim_time += self._fixed_time_step
+        self._update_count += 1
+
+    def step(self, n_updates: int = 1, render: bool = False) -> int:
+        """
+        Runs `n_updates` fixed updates without waiting for the wall clock,
+        each preceded by process_input and, if `render` is True, followed by
+        render(0.0). Stops early if a handler calls stop().
+        Returns the number of updates run.
+        """
+        if self._is_running:
+            raise RuntimeError("Cannot step a game loop that is already running.")
+        if n_updates < 0:
+            raise ValueError("n_updates must not be negative.")
+        self._is_running = True
+        updates = 0
+        try:
+            while updates < n_updates and self._is_running:
+                self.process_input()
+                self._fixed_update()
+                if self._systems:
+                    self._run_systems(self._fixed_time_step)
+                updates += 1
+                if render:
+                    self.render(0.0)
+        finally:
+            self._is_running = False
+        return updates
+
+    def run_for(self, sim_seconds: float, render: bool = False) -> int:
+        """
+        Advances the virtual clock by `sim_seconds` of game time, running
+        every fixed update that falls due, as fast as possible (see step).
+        Time short of a whole step is carried over to the next call. If a
+        handler calls stop(), the steps that did not run stay in the
+        accumulator too, so the next call runs them first (`run_for(0.0)`
+        just resumes).
+        Returns the number of updates run.
+        """
+        n_updates = self._updates_due_in(sim_seconds)
+        updates = self.step(n_updates, render)
+        self._carry_unrun_steps(n_updates - updates)
+        return updates
+
+    def _updates_due_in(self, sim_seconds: float) -> int:
+        """
+        Adds `sim_seconds` of game time to the lag and takes out the whole
+        steps it covers. Returns their number.
+        """
+        if self._is_running:
+            raise RuntimeError("Cannot step a game loop that is already running.")
+        if sim_seconds < 0:
+            raise ValueError("sim_seconds must not be negative.")
+        step = self._fixed_time_step
+        total = self._lag + sim_seconds
+        # The epsilon absorbs rounding, e.g. run_for(1.0) at 1/60 runs 60 updates.
+        n_updates = int(total / step + 1e-9)
+        self._lag = max(0.0, total - n_updates * step)
+        return n_updates
+
+    def _carry_unrun_steps(self, n_updates: int) -> None:
+        """Puts the game time of steps a stopped run_for skipped back in the lag."""
+        self._lag += n_updates * self._fixed_time_step
+
+    @property
+    def sim_time(self) -> float:
+        """Game seconds simulated by fixed updates so far."""
+        return self._sim_time
+
+    @property
+    def update_count(self) -> int:
+        """Number of fixed updates run so far."""
+        return self._update_count
+
+    def register_state(self, name: str, buffer) -> StateSnapshot:
+        """
+        Registers a numeric state buffer, mutated in place by the update
+        handler, to be snapshotted before every fixed update.
+        Returns its StateSnapshot.
+        """
+        snapshot = StateSnapshot(buffer)
+        self._snapshots[name] = snapshot
+        return snapshot
+
+    def unregister_state(self, name: str) -> None:
+        """Stops snapshotting a registered state buffer."""
+        self._snapshots.pop(name, None)
+
+    def interpolate(self, name: str, alpha: float | None = None):
+        """
+        Returns the registered state `name` interpolated between the last two
+        fixed updates, by `alpha` or, by default, by the current `alpha`.
+        """
+        return self._snapshots[name].interpolate(self.alpha if alpha is None else alpha)
+
+    @property
+    def alpha(self) -> float:
+        """
+        How far the loop is between the last and the next fixed update, in
+        [0, 1) except after a run_for stopped early.
+        """
+        return self._lag / self._fixed_time_step
+
     def stop(self) -> None:
         """Stops the game loop."""
         self._is_running = False
@@ -87,13 +750,150 @@ class GameLoop:
         return self._is_running
 
 
+async def _call_handler(handler: Callable, *args) -> None:
+    """Calls a handler and awaits its result if it returned an awaitable."""
+    result = handler(*args)
+    if inspect.isawaitable(result):
+        await result
+
+
+class AsyncGameLoop(GameLoop):
+    """
+    A GameLoop that runs as a coroutine on an asyncio event loop, so that a
+    server can keep serving sockets between frames.
+
+    Handlers may be plain functions or coroutine functions. Awaitables they
+    return are awaited before the loop moves on, so fixed updates never
+    overlap and still run in lag-sized batches. The accumulator, catch-up
+    limits, state snapshots and frame statistics behave as in GameLoop.
+
+    Between frames the loop waits with `asyncio.sleep` until the frame
+    deadline, which lets other tasks run. "hybrid" pacing is treated as
+    "sleep", because spinning would starve the event loop; "none" still
+    yields to the event loop once per frame.
+
+    Headless stepping that awaits the handlers is `step_async` and
+    `run_for_async`; the inherited `step` and `run_for` still call the
+    handlers synchronously, as in GameLoop.
+    """
+
+    async def run(self) -> None:
+        """Runs the game loop until stop() is called."""
+        if self._is_running:
+            return
+
+        self._is_running = True
+        self._last_time = time.perf_counter()
+        self._lag = 0.0  # Reset lag when starting
+        self._next_frame_time = self._last_time
+        first_frame = True
+        try:
+            while self._is_running:
+                current_time = time.perf_counter()
+                elapsed_time = current_time - self._last_time
+                self._last_time = current_time
+                if first_frame:
+                    first_frame = False
+                else:
+                    self._record_frame_time(elapsed_time)
+
+                profiler = self._profiler
+                if profiler is None:
+                    await _call_handler(self.process_input)
+                    await self._advance_async(elapsed_time)
+                    await _call_handler(self.render, self._lag / self._fixed_time_step)
+                    await self._pace_async(current_time)
+                    continue
+
+                await _call_handler(self.process_input)
+                input_done = time.perf_counter()
+                updates = await self._advance_async(elapsed_time)
+                update_done = time.perf_counter()
+                await _call_handler(self.render, self._lag / self._fixed_time_step)
+                render_done = time.perf_counter()
+                await self._pace_async(current_time)
+                profiler.record(
+                    input_done - current_time,
+                    update_done - input_done,
+                    render_done - update_done,
+                    time.perf_counter() - render_done,
+                    updates,
+                )
+        finally:
+            self._is_running = False
+
+    def start(self) -> None:
+        """Runs the game loop on a new asyncio event loop until stop() is called."""
+        asyncio.run(self.run())
+
+    async def _advance_async(self, elapsed_time: float) -> int:
+        """The coroutine counterpart of GameLoop._advance."""
+        lag_before = self._lag
+        self._accumulate(elapsed_time)
+        updates = 0
+        while self._update_due(updates):
+            await self._fixed_update_async()
+            self._lag -= self._fixed_time_step
+            updates += 1
+        self._settle(updates)
+        if self._systems:
+            await self._run_systems_async(self._frame_game_time(lag_before, updates))
+        return updates
+
+    async def _run_systems_async(self, game_seconds: float) -> None:
+        for system in self._due_systems(game_seconds):
+            await _call_handler(system.handler, system.time_step)
+
+    async def _fixed_update_async(self) -> None:
+        self._capture_states()
+        await _call_handler(self.update, self._fixed_time_step)
+        self._count_update()
+
+    async def _pace_async(self, frame_start: float) -> None:
+        """Sleeps until the frame deadline, yielding to the event loop at least once."""
+        delay = 0.0
+        if self.pacing != "none":
+            deadline = self._frame_deadline(frame_start)
+            if deadline is not None:
+                delay = max(0.0, deadline - time.perf_counter())
+        await asyncio.sleep(delay)
+
+    async def step_async(self, n_updates: int = 1, render: bool = False) -> int:
+        """The coroutine counterpart of GameLoop.step."""
+        if self._is_running:
+            raise RuntimeError("Cannot step a game loop that is already running.")
+        if n_updates < 0:
+            raise ValueError("n_updates must not be negative.")
+        self._is_running = True
+        updates = 0
+        try:
+            while updates < n_updates and self._is_running:
+                await _call_handler(self.process_input)
+                await self._fixed_update_async()
+                if self._systems:
+                    await self._run_systems_async(self._fixed_time_step)
+                updates += 1
+                if render:
+                    await _call_handler(self.render, 0.0)
+        finally:
+            self._is_running = False
+        return updates
+
+    async def run_for_async(self, sim_seconds: float, render: bool = False) -> int:
+        """The coroutine counterpart of GameLoop.run_for."""
+        n_updates = self._updates_due_in(sim_seconds)
+        updates = await self.step_async(n_updates, render)
+        self._carry_unrun_steps(n_updates - updates)
+        return updates
+
+
 if __name__ == "__main__":
     # Example Usage
     loop = GameLoop(fixed_time_step=1 / 60)  # 60 updates per second
 
     processed_updates = 0  # Counter for example
-    current_position = 0
-    previous_position = 0
+    position = array("d", [0.0])  # Simulation state, mutated in place
+    loop.register_state("position", position)  # Snapshotted before every update
     speed = 10  # units per second
 
     def my_input():
@@ -104,19 +904,16 @@ if __name__ == "__main__":
             loop.stop()
 
     def my_update(dt: float):
-        global processed_updates, current_position, previous_position
-        previous_position = current_position
-        current_position += speed * dt  # Simulate movement
+        global processed_updates
+        position[0] += speed * dt  # Simulate movement
         processed_updates += 1
         print(
-            f"Updating game state with fixed_time_step: {dt:.4f}s (Update #{processed_updates}), Pos: {current_position:.2f}"
+            f"Updating game state with fixed_time_step: {dt:.4f}s (Update #{processed_updates}), Pos: {position[0]:.2f}"
         )
 
     def my_render(alpha: float):
-        # Interpolate position for smoother rendering
-        interpolated_position = (
-            previous_position * (1.0 - alpha) + current_position * alpha
-        )
+        # Interpolate position between the last two updates for smoother rendering
+        interpolated_position = loop.interpolate("position", alpha)[0]
         print(
             f"Rendering game... Alpha: {alpha:.2f}, Interpolated Pos: {interpolated_position:.2f}"
         )
@@ -4,10 +4,22 @@
 #include "structmember.h" // For PyMemberDef
 #include "game_loop.h"    // Your original C game loop header
 
+// Names of the capsules accepted in place of Python handlers. The capsule
+// pointer is the native handler and its context is passed as user_data.
+#define UPDATE_HANDLER_CAPSULE "gameloop_ext.UpdateHandlerWithUserData"
+#define UPDATE_BATCH_HANDLER_CAPSULE "gameloop_ext.UpdateBatchHandlerWithUserData"
+#define RENDER_HANDLER_CAPSULE "gameloop_ext.RenderHandlerWithUserData"
+
 // Forward declaration of C callback adapter functions
 static void process_input_c_adapter(void* user_data);
 static void update_c_adapter(double dt, void* user_data);
 static void render_c_adapter(double alpha, void* user_data);
+static void update_batch_c_adapter(double dt, int n_steps, void* user_data);
+static void frame_begin_c_adapter(void* user_data);
+static void frame_end_c_adapter(void* user_data);
+static void update_native_c_adapter(double dt, void* user_data);
+static void update_batch_native_c_adapter(double dt, int n_steps, void* user_data);
+static void render_native_c_adapter(double alpha, void* user_data);
 
 // Define the Python GameLoop object structure
 typedef struct {
@@ -16,16 +28,46 @@ typedef struct {
     PyObject *process_input_cb; // Python callback for process_input
     PyObject *update_cb;        // Python callback for update
     PyObject *render_cb;        // Python callback for render
+    GameLoopProfiler profiler;  // Frame profiler, attached by enable_profiling
+    PyObject *export_hook;      // Python callback receiving profiler samples
+    PyObject *dt_obj;           // Cached float of fixed_time_step passed to update
+    int batch_updates;          // Call update(dt, n_steps) once per frame
+    int hold_gil;               // Hold the GIL across each frame's callbacks
+    int gil_held;               // Set while a frame holds the GIL
+    PyThreadState *saved_tstate; // Thread state saved while the loop runs
+    // Native handlers unpacked from capsules set as update_cb / render_cb
+    UpdateHandlerWithUserData native_update;
+    UpdateBatchHandlerWithUserData native_update_batch;
+    void *native_update_data;
+    RenderHandlerWithUserData native_render;
+    void *native_render_data;
+    // start_in_thread() state
+    PyThread_type_lock thread_done; // Held while a loop thread has not been joined
+    int thread_started;             // A loop thread was started and not joined yet
+    unsigned long thread_ident;     // Identifier of the thread running the loop
+    int capture_errors;             // Store the first callback exception and stop
+    PyObject *thread_error;         // First exception raised by a callback
+    PyObject *retired_handlers;     // Handlers replaced while the loop runs
 } PyGameLoopObject;
 
+static void free_profiler(PyGameLoopObject *self);
+static void report_callback_error(PyGameLoopObject *self, PyObject *result);
+
 // Deallocator for PyGameLoopObject
 static void PyGameLoop_dealloc(PyGameLoopObject *self) {
     Py_XDECREF(self->process_input_cb);
     Py_XDECREF(self->update_cb);
     Py_XDECREF(self->render_cb);
+    Py_XDECREF(self->dt_obj);
+    Py_XDECREF(self->thread_error);
+    Py_XDECREF(self->retired_handlers);
+    if (self->thread_done) {
+        PyThread_free_lock(self->thread_done);
+    }
+    free_profiler(self);
     // If GameLoop_init allocated any resources that GameLoop_stop doesn't clean,
     // clean them here. For now, assuming GameLoop_stop is sufficient or no extra allocs.
-    if (self->loop_instance.is_running) {
+    if (GameLoop_is_running(&self->loop_instance)) {
         GameLoop_stop(&self->loop_instance);
     }
     Py_TYPE(self)->tp_free((PyObject *) self);
@@ -39,6 +81,24 @@ static PyObject *PyGameLoop_new(PyTypeObject *type, PyObject *args, PyObject *kw
         self->process_input_cb = Py_None; Py_INCREF(Py_None);
         self->update_cb = Py_None; Py_INCREF(Py_None);
         self->render_cb = Py_None; Py_INCREF(Py_None);
+        self->export_hook = NULL;
+        self->dt_obj = NULL;
+        self->batch_updates = 0;
+        self->hold_gil = 0;
+        self->gil_held = 0;
+        self->saved_tstate = NULL;
+        self->native_update = NULL;
+        self->native_update_batch = NULL;
+        self->native_update_data = NULL;
+        self->native_render = NULL;
+        self->native_render_data = NULL;
+        self->thread_done = NULL;
+        self->thread_started = 0;
+        self->thread_ident = 0;
+        self->capture_errors = 0;
+        self->thread_error = NULL;
+        self->retired_handlers = NULL;
+        GameLoopProfiler_init(&self->profiler, NULL, 0);
         // Initialize loop_instance with default values or leave to __init__
     }
     return (PyObject *) self;
@@ -47,95 +107,536 @@ static PyObject *PyGameLoop_new(PyTypeObject *type, PyObject *args, PyObject *kw
 // __init__ method for PyGameLoopObject
 static int PyGameLoop_init(PyGameLoopObject *self, PyObject *args, PyObject *kwds) {
     double fixed_time_step = 1.0 / 60.0;
-    static char *kwlist[] = {"fixed_time_step", NULL};
+    PyObject *max_updates_obj = Py_None;
+    PyObject *max_lag_obj = Py_None;
+    const char *catch_up = "drop";
+    double min_time_scale = 0.1;
+    int hold_gil = 0;
+    int max_updates = 0;
+    double max_lag = 0.0;
+    GameLoopCatchUpMode mode;
+    static char *kwlist[] = {"fixed_time_step", "max_updates_per_frame", "max_lag",
+                             "catch_up", "min_time_scale", "hold_gil", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|dOOsdp", kwlist, &fixed_time_step,
+                                     &max_updates_obj, &max_lag_obj, &catch_up,
+                                     &min_time_scale, &hold_gil)) {
+        return -1;
+    }
+    // None leaves a limit disabled, matching the Python GameLoop.
+    if (max_updates_obj != Py_None) {
+        max_updates = PyLong_AsLong(max_updates_obj);
+        if (max_updates == -1 && PyErr_Occurred()) return -1;
+        if (max_updates < 1) {
+            PyErr_SetString(PyExc_ValueError, "max_updates_per_frame must be at least 1.");
+            return -1;
+        }
+    }
+    if (max_lag_obj != Py_None) {
+        max_lag = PyFloat_AsDouble(max_lag_obj);
+        if (max_lag == -1.0 && PyErr_Occurred()) return -1;
+        if (max_lag <= 0.0) {
+            PyErr_SetString(PyExc_ValueError, "max_lag must be positive.");
+            return -1;
+        }
+    }
+    if (strcmp(catch_up, "drop") == 0) {
+        mode = GAMELOOP_CATCH_UP_DROP;
+    } else if (strcmp(catch_up, "dilate") == 0) {
+        mode = GAMELOOP_CATCH_UP_DILATE;
+    } else {
+        PyErr_SetString(PyExc_ValueError, "catch_up must be 'drop' or 'dilate'.");
+        return -1;
+    }
+    if (!(min_time_scale > 0.0 && min_time_scale <= 1.0)) {
+        PyErr_SetString(PyExc_ValueError, "min_time_scale must be in (0, 1].");
+        return -1;
+    }
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|d", kwlist, &fixed_time_step)) {
+    Py_XSETREF(self->dt_obj, PyFloat_FromDouble(fixed_time_step));
+    if (self->dt_obj == NULL) {
         return -1;
     }
+    self->hold_gil = hold_gil;
 
     GameLoop_init(&self->loop_instance, fixed_time_step);
+    GameLoop_set_max_updates_per_frame(&self->loop_instance, max_updates);
+    GameLoop_set_max_lag(&self->loop_instance, max_lag);
+    GameLoop_set_catch_up_mode(&self->loop_instance, mode, min_time_scale);
     // Pass 'self' as user_data to C callbacks so they can find the Python object
     GameLoop_set_user_data(&self->loop_instance, self); 
     return 0;
 }
 
+// While the loop runs, its handlers and profiler are used without locks, so
+// they may only be changed from the loop's own thread, i.e. from a callback.
+static int check_loop_thread(PyGameLoopObject *self, const char *action) {
+    if (GameLoop_is_running(&self->loop_instance)
+        && self->thread_ident != PyThread_get_thread_ident()) {
+        PyErr_Format(PyExc_RuntimeError,
+                     "Cannot %s while the loop is running on another thread.", action);
+        return -1;
+    }
+    return 0;
+}
+
+// Drops the handlers replaced during a run, once the loop no longer uses them
+static void release_retired_handlers(PyGameLoopObject *self) {
+    Py_CLEAR(self->retired_handlers);
+}
+
+// Ensure C callbacks are set if Python callbacks or native capsules exist.
+// Native handlers are called directly and never touch the GIL.
+static void bind_c_adapters(PyGameLoopObject *self) {
+    if (self->process_input_cb != Py_None && PyCallable_Check(self->process_input_cb)) {
+        GameLoop_set_process_input_handler_with_user_data(&self->loop_instance, process_input_c_adapter);
+    } else {
+        GameLoop_set_process_input_handler_with_user_data(&self->loop_instance, NULL);
+    }
+
+    self->native_update = NULL;
+    self->native_update_batch = NULL;
+    if (PyCapsule_CheckExact(self->update_cb)) {
+        self->native_update_data = PyCapsule_GetContext(self->update_cb);
+        if (self->batch_updates) {
+            self->native_update_batch = (UpdateBatchHandlerWithUserData)
+                PyCapsule_GetPointer(self->update_cb, UPDATE_BATCH_HANDLER_CAPSULE);
+            GameLoop_set_update_batch_handler_with_user_data(&self->loop_instance, update_batch_native_c_adapter);
+        } else {
+            self->native_update = (UpdateHandlerWithUserData)
+                PyCapsule_GetPointer(self->update_cb, UPDATE_HANDLER_CAPSULE);
+            GameLoop_set_update_handler_with_user_data(&self->loop_instance, update_native_c_adapter);
+        }
+    } else if (self->update_cb != Py_None && PyCallable_Check(self->update_cb) && self->batch_updates) {
+        GameLoop_set_update_batch_handler_with_user_data(&self->loop_instance, update_batch_c_adapter);
+    } else if (self->update_cb != Py_None && PyCallable_Check(self->update_cb)) {
+        GameLoop_set_update_handler_with_user_data(&self->loop_instance, update_c_adapter);
+    } else {
+        GameLoop_set_update_handler_with_user_data(&self->loop_instance, NULL);
+    }
+
+    self->native_render = NULL;
+    if (PyCapsule_CheckExact(self->render_cb)) {
+        self->native_render_data = PyCapsule_GetContext(self->render_cb);
+        self->native_render = (RenderHandlerWithUserData)
+            PyCapsule_GetPointer(self->render_cb, RENDER_HANDLER_CAPSULE);
+        GameLoop_set_render_handler_with_user_data(&self->loop_instance, render_native_c_adapter);
+    } else if (self->render_cb != Py_None && PyCallable_Check(self->render_cb)) {
+        GameLoop_set_render_handler_with_user_data(&self->loop_instance, render_c_adapter);
+    } else {
+        GameLoop_set_render_handler_with_user_data(&self->loop_instance, NULL);
+    }
+}
+
+// True if any handler is a Python callable, i.e. a frame may need the GIL
+static int has_python_handlers(PyGameLoopObject *self) {
+    return (self->process_input_cb != Py_None)
+        || (self->update_cb != Py_None && !PyCapsule_CheckExact(self->update_cb))
+        || (self->render_cb != Py_None && !PyCapsule_CheckExact(self->render_cb));
+}
+
+// Binds the handlers and, in hold_gil mode, the per-frame GIL hooks
+static void prepare_start(PyGameLoopObject *self) {
+    bind_c_adapters(self);
+    if (self->hold_gil && has_python_handlers(self)) {
+        GameLoop_set_frame_hooks_with_user_data(&self->loop_instance, frame_begin_c_adapter, frame_end_c_adapter);
+    } else {
+        GameLoop_set_frame_hooks_with_user_data(&self->loop_instance, NULL, NULL);
+    }
+}
+
 // Method to start the game loop
 static PyObject *PyGameLoop_start(PyGameLoopObject *self, PyObject *Py_UNUSED(ignored)) {
-    if (!self->loop_instance.is_running) {
-        // Before starting the loop, ensure C callbacks are set if Python callbacks exist
-        if (self->process_input_cb != Py_None && PyCallable_Check(self->process_input_cb)) {
-            GameLoop_set_process_input_handler_with_user_data(&self->loop_instance, process_input_c_adapter);
-        } else {
-            GameLoop_set_process_input_handler_with_user_data(&self->loop_instance, NULL);
+    if (self->thread_started) {
+        PyErr_SetString(PyExc_RuntimeError, "The loop thread has not been joined yet.");
+        return NULL;
+    }
+    if (!GameLoop_is_running(&self->loop_instance)) {
+        prepare_start(self);
+        self->thread_ident = PyThread_get_thread_ident();
+
+        // Release the GIL while the C game loop runs (in hold_gil mode the
+        // frame hooks take it back for the callbacks of each frame)
+        self->saved_tstate = PyEval_SaveThread();
+        GameLoop_start(&self->loop_instance);
+        PyEval_RestoreThread(self->saved_tstate);
+        self->saved_tstate = NULL;
+        release_retired_handlers(self);
+    }
+    Py_RETURN_NONE;
+}
+
+// Body of the native thread started by start_in_thread()
+static void loop_thread_main(void *arg) {
+    PyGameLoopObject *self = (PyGameLoopObject*)arg;
+    // Create this thread's Python thread state once, so that callbacks
+    // reuse it instead of creating one per call.
+    PyGILState_STATE gstate = PyGILState_Ensure();
+    self->thread_ident = PyThread_get_thread_ident();
+    self->saved_tstate = PyEval_SaveThread();
+    GameLoop_run(&self->loop_instance);
+    PyEval_RestoreThread(self->saved_tstate);
+    self->saved_tstate = NULL;
+    self->capture_errors = 0;
+    release_retired_handlers(self);
+    PyThread_release_lock(self->thread_done);
+    Py_DECREF(self);
+    PyGILState_Release(gstate);
+}
+
+// Method to run the game loop on a native thread
+static PyObject *PyGameLoop_start_in_thread(PyGameLoopObject *self, PyObject *Py_UNUSED(ignored)) {
+    if (GameLoop_is_running(&self->loop_instance) || self->thread_started) {
+        PyErr_SetString(PyExc_RuntimeError, self->thread_started
+                        ? "The loop thread has not been joined yet."
+                        : "The loop is already running.");
+        return NULL;
+    }
+    if (self->thread_done == NULL) {
+        self->thread_done = PyThread_allocate_lock();
+        if (self->thread_done == NULL) {
+            PyErr_SetString(PyExc_RuntimeError, "Cannot allocate the loop thread lock.");
+            return NULL;
         }
-        if (self->update_cb != Py_None && PyCallable_Check(self->update_cb)) {
-            GameLoop_set_update_handler_with_user_data(&self->loop_instance, update_c_adapter);
-        } else {
-            GameLoop_set_update_handler_with_user_data(&self->loop_instance, NULL);
+    }
+    prepare_start(self);
+    Py_CLEAR(self->thread_error);
+    self->capture_errors = 1;
+    self->thread_ident = 0; // Set by the loop thread itself
+    // Set before the thread starts so that an early stop() is not lost
+    GameLoop_mark_running(&self->loop_instance);
+    PyThread_acquire_lock(self->thread_done, WAIT_LOCK);
+    Py_INCREF(self); // Owned by the thread
+    if (PyThread_start_new_thread(loop_thread_main, self) == PYTHREAD_INVALID_THREAD_ID) {
+        Py_DECREF(self);
+        PyThread_release_lock(self->thread_done);
+        GameLoop_stop(&self->loop_instance);
+        self->capture_errors = 0;
+        PyErr_SetString(PyExc_RuntimeError, "Cannot start the loop thread.");
+        return NULL;
+    }
+    self->thread_started = 1;
+    Py_RETURN_NONE;
+}
+
+// Method to wait for the loop thread; re-raises the first callback exception
+static PyObject *PyGameLoop_join(PyGameLoopObject *self, PyObject *args, PyObject *kwds) {
+    PyObject *timeout_obj = Py_None;
+    double timeout = -1.0;
+    double deadline = 0.0;
+    static char *kwlist[] = {"timeout", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|O", kwlist, &timeout_obj)) {
+        return NULL;
+    }
+    if (timeout_obj != Py_None) {
+        timeout = PyFloat_AsDouble(timeout_obj);
+        if (timeout == -1.0 && PyErr_Occurred()) return NULL;
+        if (timeout < 0.0) timeout = 0.0;
+        deadline = get_current_time_seconds_os(&self->loop_instance) + timeout;
+    }
+    if (self->thread_started && self->thread_ident == PyThread_get_thread_ident()) {
+        PyErr_SetString(PyExc_RuntimeError, "Cannot join the loop from its own thread.");
+        return NULL;
+    }
+
+    while (self->thread_started) {
+        // Wait in short slices so that Ctrl+C still interrupts join()
+        double slice = 0.05;
+        PyLockStatus status;
+        if (timeout >= 0.0) {
+            double remaining = deadline - get_current_time_seconds_os(&self->loop_instance);
+            if (remaining < slice) slice = remaining > 0.0 ? remaining : 0.0;
         }
-        if (self->render_cb != Py_None && PyCallable_Check(self->render_cb)) {
-            GameLoop_set_render_handler_with_user_data(&self->loop_instance, render_c_adapter);
-        } else {
-            GameLoop_set_render_handler_with_user_data(&self->loop_instance, NULL);
+        Py_BEGIN_ALLOW_THREADS
+        status = PyThread_acquire_lock_timed(self->thread_done, (PY_TIMEOUT_T)(slice * 1e6), 0);
+        Py_END_ALLOW_THREADS
+        if (status == PY_LOCK_ACQUIRED) {
+            PyThread_release_lock(self->thread_done);
+            self->thread_started = 0;
+            break;
+        }
+        if (PyErr_CheckSignals() < 0) return NULL;
+        if (timeout >= 0.0 && get_current_time_seconds_os(&self->loop_instance) >= deadline) {
+            Py_RETURN_FALSE;
         }
+    }
+
+    if (self->thread_error) {
+        PyObject *error = self->thread_error;
+        self->thread_error = NULL;
+        PyErr_SetObject((PyObject *)Py_TYPE(error), error);
+        Py_DECREF(error);
+        return NULL;
+    }
+    Py_RETURN_TRUE;
+}
 
-        // Release the GIL while the C game loop runs
+// Method to run fixed updates headlessly on the virtual clock
+static PyObject *PyGameLoop_step(PyGameLoopObject *self, PyObject *args, PyObject *kwds) {
+    int n_updates = 1;
+    int render = 0;
+    int updates;
+    static char *kwlist[] = {"n_updates", "render", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|ip", kwlist, &n_updates, &render)) {
+        return NULL;
+    }
+    if (n_updates < 0) {
+        PyErr_SetString(PyExc_ValueError, "n_updates must not be negative.");
+        return NULL;
+    }
+    if (GameLoop_is_running(&self->loop_instance)) {
+        PyErr_SetString(PyExc_RuntimeError, "Cannot step a game loop that is already running.");
+        return NULL;
+    }
+    bind_c_adapters(self);
+    self->thread_ident = PyThread_get_thread_ident();
+    if (self->hold_gil) {
+        self->gil_held = 1;
+        updates = GameLoop_step(&self->loop_instance, n_updates, render);
+        self->gil_held = 0;
+    } else {
         Py_BEGIN_ALLOW_THREADS
-        GameLoop_start(&self->loop_instance);
+        updates = GameLoop_step(&self->loop_instance, n_updates, render);
+        Py_END_ALLOW_THREADS
+    }
+    release_retired_handlers(self);
+    return PyLong_FromLong(updates);
+}
+
+// Method to advance the virtual clock by a span of game time
+static PyObject *PyGameLoop_run_for(PyGameLoopObject *self, PyObject *args, PyObject *kwds) {
+    double sim_seconds;
+    int render = 0;
+    int updates;
+    static char *kwlist[] = {"sim_seconds", "render", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "d|p", kwlist, &sim_seconds, &render)) {
+        return NULL;
+    }
+    if (sim_seconds < 0.0) {
+        PyErr_SetString(PyExc_ValueError, "sim_seconds must not be negative.");
+        return NULL;
+    }
+    if (GameLoop_is_running(&self->loop_instance)) {
+        PyErr_SetString(PyExc_RuntimeError, "Cannot step a game loop that is already running.");
+        return NULL;
+    }
+    bind_c_adapters(self);
+    self->thread_ident = PyThread_get_thread_ident();
+    if (self->hold_gil) {
+        self->gil_held = 1;
+        updates = GameLoop_run_for(&self->loop_instance, sim_seconds, render);
+        self->gil_held = 0;
+    } else {
+        Py_BEGIN_ALLOW_THREADS
+        updates = GameLoop_run_for(&self->loop_instance, sim_seconds, render);
         Py_END_ALLOW_THREADS
     }
+    release_retired_handlers(self);
+    return PyLong_FromLong(updates);
+}
+
+// Detaches the profiler and frees its sample buffer
+static void free_profiler(PyGameLoopObject *self) {
+    GameLoopFrameSample *samples = self->profiler.samples;
+    GameLoop_set_profiler(&self->loop_instance, NULL);
+    // A frame in progress may still hold the profiler; capacity 0 makes it a no-op.
+    GameLoopProfiler_init(&self->profiler, NULL, 0);
+    PyMem_Free(samples);
+    Py_CLEAR(self->export_hook);
+}
+
+static PyObject *sample_to_tuple(const GameLoopFrameSample *sample) {
+    return Py_BuildValue("(ddddi)", sample->input_time, sample->update_time,
+                         sample->render_time, sample->sleep_time, sample->updates);
+}
+
+// Builds the list of samples in the ring, oldest first
+static PyObject *profiler_samples_list(const GameLoopProfiler *profiler) {
+    size_t n = GameLoopProfiler_size(profiler);
+    size_t start = profiler->count - n;
+    PyObject *list = PyList_New((Py_ssize_t)n);
+    if (list == NULL) return NULL;
+    for (size_t i = 0; i < n; i++) {
+        PyObject *item = sample_to_tuple(&profiler->samples[(start + i) % profiler->capacity]);
+        if (item == NULL) {
+            Py_DECREF(list);
+            return NULL;
+        }
+        PyList_SET_ITEM(list, (Py_ssize_t)i, item);
+    }
+    return list;
+}
+
+// C adapter for the profiler export handler
+static void profiler_export_c_adapter(const GameLoopFrameSample *samples, size_t count, void *user_data) {
+    PyGameLoopObject *self = (PyGameLoopObject*)user_data;
+    if (self && self->export_hook) {
+        PyGILState_STATE gstate = PyGILState_Ensure();
+        PyObject *list = profiler_samples_list(&self->profiler);
+        report_callback_error(self, list ? PyObject_CallOneArg(self->export_hook, list) : NULL);
+        Py_XDECREF(list);
+        PyGILState_Release(gstate);
+    }
+}
+
+// Method to start recording per-phase frame timings
+static PyObject *PyGameLoop_enable_profiling(PyGameLoopObject *self, PyObject *args, PyObject *kwds) {
+    Py_ssize_t capacity = 1024;
+    PyObject *export_hook = Py_None;
+    GameLoopFrameSample *samples;
+    static char *kwlist[] = {"capacity", "export_hook", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|nO", kwlist, &capacity, &export_hook)) {
+        return NULL;
+    }
+    if (check_loop_thread(self, "change profiling") < 0) {
+        return NULL;
+    }
+    if (capacity < 1) {
+        PyErr_SetString(PyExc_ValueError, "capacity must be at least 1.");
+        return NULL;
+    }
+    if (export_hook != Py_None && !PyCallable_Check(export_hook)) {
+        PyErr_SetString(PyExc_TypeError, "export_hook must be callable or None");
+        return NULL;
+    }
+    samples = PyMem_New(GameLoopFrameSample, capacity);
+    if (samples == NULL) {
+        return PyErr_NoMemory();
+    }
+    free_profiler(self);
+    GameLoopProfiler_init(&self->profiler, samples, (size_t)capacity);
+    if (export_hook != Py_None) {
+        Py_INCREF(export_hook);
+        self->export_hook = export_hook;
+        GameLoopProfiler_set_export_handler(&self->profiler, profiler_export_c_adapter, self);
+    }
+    GameLoop_set_profiler(&self->loop_instance, &self->profiler);
+    Py_RETURN_NONE;
+}
+
+// Method to stop recording frame timings
+static PyObject *PyGameLoop_disable_profiling(PyGameLoopObject *self, PyObject *Py_UNUSED(ignored)) {
+    if (check_loop_thread(self, "change profiling") < 0) {
+        return NULL;
+    }
+    free_profiler(self);
     Py_RETURN_NONE;
 }
 
+// Method returning the recorded samples as tuples
+static PyObject *PyGameLoop_profile_samples(PyGameLoopObject *self, PyObject *Py_UNUSED(ignored)) {
+    return profiler_samples_list(&self->profiler);
+}
+
+// Builds {"mean", "p50", "p95", "p99", "max"} for one phase
+static PyObject *phase_distribution(const GameLoopProfiler *profiler, GameLoopPhase phase) {
+    return Py_BuildValue("{sdsdsdsdsd}",
+        "mean", GameLoopProfiler_mean(profiler, phase),
+        "p50", GameLoopProfiler_percentile(profiler, phase, 50.0),
+        "p95", GameLoopProfiler_percentile(profiler, phase, 95.0),
+        "p99", GameLoopProfiler_percentile(profiler, phase, 99.0),
+        "max", GameLoopProfiler_max(profiler, phase));
+}
+
+// Method returning percentile summaries, like FrameProfiler.summary()
+static PyObject *PyGameLoop_profile_summary(PyGameLoopObject *self, PyObject *Py_UNUSED(ignored)) {
+    static const struct { const char *name; GameLoopPhase phase; } phases[] = {
+        {"input", GAMELOOP_PHASE_INPUT},
+        {"update", GAMELOOP_PHASE_UPDATE},
+        {"render", GAMELOOP_PHASE_RENDER},
+        {"sleep", GAMELOOP_PHASE_SLEEP},
+        {"frame", GAMELOOP_PHASE_FRAME},
+        {"updates_per_frame", GAMELOOP_PHASE_UPDATES},
+    };
+    size_t n = GameLoopProfiler_size(&self->profiler);
+    PyObject *summary = Py_BuildValue("{sn}", "frames", (Py_ssize_t)n);
+    if (summary == NULL || n == 0) return summary;
+    for (size_t i = 0; i < sizeof(phases) / sizeof(phases[0]); i++) {
+        PyObject *distribution = phase_distribution(&self->profiler, phases[i].phase);
+        if (distribution == NULL || PyDict_SetItemString(summary, phases[i].name, distribution) < 0) {
+            Py_XDECREF(distribution);
+            Py_DECREF(summary);
+            return NULL;
+        }
+        Py_DECREF(distribution);
+    }
+    return summary;
+}
+
 // Method to stop the game loop
 static PyObject *PyGameLoop_stop(PyGameLoopObject *self, PyObject *Py_UNUSED(ignored)) {
     GameLoop_stop(&self->loop_instance);
     Py_RETURN_NONE;
 }
 
-// Helper to set callback
-static PyObject *set_callback(PyGameLoopObject *self, PyObject *arg, PyObject **target_cb_ptr) {
-    PyObject *tmp;
-    if (arg == Py_None) { // Allow unsetting with None
-        tmp = *target_cb_ptr;
-        Py_INCREF(Py_None);
-        *target_cb_ptr = Py_None;
-        Py_XDECREF(tmp);
-        Py_RETURN_NONE;
-    }
-    if (!PyCallable_Check(arg)) {
-        PyErr_SetString(PyExc_TypeError, "Parameter must be a callable");
-        return NULL;
+// Stores a new handler. While the loop runs, the old one may be the
+// callback being executed, so it is kept until the loop returns.
+static PyObject *replace_callback(PyGameLoopObject *self, PyObject *arg, PyObject **target_cb_ptr) {
+    PyObject *old = *target_cb_ptr;
+    if (old != Py_None && GameLoop_is_running(&self->loop_instance)) {
+        if (self->retired_handlers == NULL) {
+            self->retired_handlers = PyList_New(0);
+            if (self->retired_handlers == NULL) return NULL;
+        }
+        if (PyList_Append(self->retired_handlers, old) < 0) return NULL;
     }
-    tmp = *target_cb_ptr;
     Py_INCREF(arg);
     *target_cb_ptr = arg;
-    Py_XDECREF(tmp);
+    Py_XDECREF(old);
     Py_RETURN_NONE;
 }
 
+// Helper to set callback
+// Stores a handler: None, a callable or, if capsule_name is not NULL, a
+// capsule of that name wrapping a native handler.
+static PyObject *set_callback(PyGameLoopObject *self, PyObject *arg, PyObject **target_cb_ptr,
+                              const char *capsule_name) {
+    if (check_loop_thread(self, "change handlers") < 0) {
+        return NULL;
+    }
+    if (arg == Py_None) { // Allow unsetting with None
+        return replace_callback(self, Py_None, target_cb_ptr);
+    }
+    if (capsule_name != NULL && PyCapsule_CheckExact(arg)) {
+        if (!PyCapsule_IsValid(arg, capsule_name)) {
+            PyErr_Format(PyExc_ValueError, "Expected a capsule named '%s'", capsule_name);
+            return NULL;
+        }
+    } else if (!PyCallable_Check(arg)) {
+        PyErr_SetString(PyExc_TypeError, capsule_name != NULL
+                        ? "Parameter must be a callable or a native handler capsule"
+                        : "Parameter must be a callable");
+        return NULL;
+    }
+    return replace_callback(self, arg, target_cb_ptr);
+}
+
 // Method to set the process_input handler
 static PyObject *PyGameLoop_set_process_input_handler(PyGameLoopObject *self, PyObject *args) {
     PyObject *callback = NULL;
     if (!PyArg_ParseTuple(args, "O", &callback)) return NULL;
-    PyObject* result = set_callback(self, callback, &self->process_input_cb);
-    if (result != NULL && self->process_input_cb != Py_None) {
-         GameLoop_set_process_input_handler_with_user_data(&self->loop_instance, process_input_c_adapter);
-    } else if (result != NULL) {
-         GameLoop_set_process_input_handler_with_user_data(&self->loop_instance, NULL);
+    PyObject* result = set_callback(self, callback, &self->process_input_cb, NULL);
+    if (result != NULL) {
+        bind_c_adapters(self);
     }
     return result;
 }
 
 // Method to set the update handler
-static PyObject *PyGameLoop_set_update_handler(PyGameLoopObject *self, PyObject *args) {
+static PyObject *PyGameLoop_set_update_handler(PyGameLoopObject *self, PyObject *args, PyObject *kwds) {
     PyObject *callback = NULL;
-    if (!PyArg_ParseTuple(args, "O", &callback)) return NULL;
-    PyObject* result = set_callback(self, callback, &self->update_cb);
-     if (result != NULL && self->update_cb != Py_None) {
-         GameLoop_set_update_handler_with_user_data(&self->loop_instance, update_c_adapter);
-    } else if (result != NULL) {
-         GameLoop_set_update_handler_with_user_data(&self->loop_instance, NULL);
+    int batch = 0;
+    static char *kwlist[] = {"handler", "batch", NULL};
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|p", kwlist, &callback, &batch)) return NULL;
+    PyObject* result = set_callback(self, callback, &self->update_cb,
+                                    batch ? UPDATE_BATCH_HANDLER_CAPSULE : UPDATE_HANDLER_CAPSULE);
+    if (result != NULL) {
+        self->batch_updates = batch;
+        bind_c_adapters(self);
     }
     return result;
 }
@@ -144,15 +645,34 @@ static PyObject *PyGameLoop_set_update_handler(PyGameLoopObject *self, PyObject
 static PyObject *PyGameLoop_set_render_handler(PyGameLoopObject *self, PyObject *args) {
     PyObject *callback = NULL;
     if (!PyArg_ParseTuple(args, "O", &callback)) return NULL;
-    PyObject* result = set_callback(self, callback, &self->render_cb);
-    if (result != NULL && self->render_cb != Py_None) {
-         GameLoop_set_render_handler_with_user_data(&self->loop_instance, render_c_adapter);
-    } else if (result != NULL) {
-         GameLoop_set_render_handler_with_user_data(&self->loop_instance, NULL);
+    PyObject* result = set_callback(self, callback, &self->render_cb, RENDER_HANDLER_CAPSULE);
+    if (result != NULL) {
+        bind_c_adapters(self);
     }
     return result;
 }
 
+// Getter and setter for hold_gil property
+static PyObject *PyGameLoop_get_hold_gil(PyGameLoopObject *self, void *closure) {
+    return PyBool_FromLong(self->hold_gil);
+}
+
+static int PyGameLoop_set_hold_gil(PyGameLoopObject *self, PyObject *value, void *closure) {
+    int hold_gil;
+    if (value == NULL) {
+        PyErr_SetString(PyExc_AttributeError, "Cannot delete hold_gil");
+        return -1;
+    }
+    if (GameLoop_is_running(&self->loop_instance)) {
+        PyErr_SetString(PyExc_RuntimeError, "Cannot change hold_gil while the loop is running.");
+        return -1;
+    }
+    hold_gil = PyObject_IsTrue(value);
+    if (hold_gil < 0) return -1;
+    self->hold_gil = hold_gil;
+    return 0;
+}
+
 // Getter for is_running property
 static PyObject *PyGameLoop_get_is_running(PyGameLoopObject *self, void *closure) {
     if (GameLoop_is_running(&self->loop_instance)) {
@@ -161,58 +681,172 @@ static PyObject *PyGameLoop_get_is_running(PyGameLoopObject *self, void *closure
     Py_RETURN_FALSE;
 }
 
+// Getters for the virtual clock
+static PyObject *PyGameLoop_get_sim_time(PyGameLoopObject *self, void *closure) {
+    return PyFloat_FromDouble(self->loop_instance.sim_time);
+}
+
+static PyObject *PyGameLoop_get_update_count(PyGameLoopObject *self, void *closure) {
+    return PyLong_FromUnsignedLongLong(self->loop_instance.update_count);
+}
+
+// Getters for the catch-up counters
+static PyObject *PyGameLoop_get_dropped_time(PyGameLoopObject *self, void *closure) {
+    return PyFloat_FromDouble(self->loop_instance.dropped_time);
+}
+
+static PyObject *PyGameLoop_get_dilated_time(PyGameLoopObject *self, void *closure) {
+    return PyFloat_FromDouble(self->loop_instance.dilated_time);
+}
+
+static PyObject *PyGameLoop_get_capped_frames(PyGameLoopObject *self, void *closure) {
+    return PyLong_FromUnsignedLongLong(self->loop_instance.capped_frames);
+}
+
+static PyObject *PyGameLoop_get_dilation(PyGameLoopObject *self, void *closure) {
+    return PyFloat_FromDouble(self->loop_instance.dilation);
+}
+
+// Getter and setter for time_scale property
+static PyObject *PyGameLoop_get_time_scale(PyGameLoopObject *self, void *closure) {
+    return PyFloat_FromDouble(self->loop_instance.time_scale);
+}
+
+static int PyGameLoop_set_time_scale(PyGameLoopObject *self, PyObject *value, void *closure) {
+    if (value == NULL) {
+        PyErr_SetString(PyExc_AttributeError, "Cannot delete time_scale");
+        return -1;
+    }
+    if (check_loop_thread(self, "change time_scale") < 0) {
+        return -1;
+    }
+    double time_scale = PyFloat_AsDouble(value);
+    if (time_scale == -1.0 && PyErr_Occurred()) return -1;
+    GameLoop_set_time_scale(&self->loop_instance, time_scale);
+    return 0;
+}
+
+// Acquires the GIL for a callback, unless the frame already holds it
+static inline PyGILState_STATE enter_python(PyGameLoopObject *self) {
+    return self->gil_held ? PyGILState_LOCKED : PyGILState_Ensure();
+}
+
+static inline void leave_python(PyGameLoopObject *self, PyGILState_STATE gstate) {
+    if (!self->gil_held) {
+        PyGILState_Release(gstate);
+    }
+}
+
+// Handles the result of a Python callback. On a loop thread the first
+// exception is kept for join() and stops the loop, and the adapters skip
+// the callbacks still due in that frame; otherwise exceptions are printed
+// and the loop keeps running.
+static void report_callback_error(PyGameLoopObject *self, PyObject *result) {
+    if (result != NULL) {
+        Py_DECREF(result);
+        return;
+    }
+    if (self->capture_errors && self->thread_error == NULL) {
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        PyErr_NormalizeException(&type, &value, &traceback);
+        if (traceback != NULL) {
+            PyException_SetTraceback(value, traceback);
+        }
+        Py_XDECREF(type);
+        Py_XDECREF(traceback);
+        self->thread_error = value;
+        GameLoop_stop(&self->loop_instance);
+    } else {
+        PyErr_Print();
+    }
+}
+
+// Frame hooks of hold_gil mode: take the GIL once for all callbacks of a frame
+static void frame_begin_c_adapter(void* user_data) {
+    PyGameLoopObject *self = (PyGameLoopObject*)user_data;
+    PyEval_RestoreThread(self->saved_tstate);
+    self->gil_held = 1;
+}
+
+static void frame_end_c_adapter(void* user_data) {
+    PyGameLoopObject *self = (PyGameLoopObject*)user_data;
+    self->gil_held = 0;
+    self->saved_tstate = PyEval_SaveThread();
+}
+
 // C adapter for process_input callback
 static void process_input_c_adapter(void* user_data) {
     PyGameLoopObject *self = (PyGameLoopObject*)user_data;
-    if (self && self->process_input_cb != Py_None && PyCallable_Check(self->process_input_cb)) {
-        PyGILState_STATE gstate = PyGILState_Ensure();
-        PyObject *result = PyObject_CallObject(self->process_input_cb, NULL);
-        if (result == NULL) {
-            // An exception occurred in the Python callback.
-            // You might want to stop the loop or handle it.
-            // For now, just print it.
-            PyErr_Print();
-            // Optionally stop the loop:
-            // GameLoop_stop(&self->loop_instance);
-        }
-        Py_XDECREF(result);
-        PyGILState_Release(gstate);
+    if (self && self->process_input_cb != Py_None && self->thread_error == NULL) {
+        PyGILState_STATE gstate = enter_python(self);
+        report_callback_error(self, PyObject_CallNoArgs(self->process_input_cb));
+        leave_python(self, gstate);
     }
 }
 
-// C adapter for update callback
+// C adapter for update callback; dt is always fixed_time_step, so its
+// float object is created once and reused.
 static void update_c_adapter(double dt, void* user_data) {
     PyGameLoopObject *self = (PyGameLoopObject*)user_data;
-    if (self && self->update_cb != Py_None && PyCallable_Check(self->update_cb)) {
-        PyGILState_STATE gstate = PyGILState_Ensure();
-        PyObject *arg = PyFloat_FromDouble(dt);
-        PyObject *result = PyObject_CallFunctionObjArgs(self->update_cb, arg, NULL);
-        Py_XDECREF(arg);
-        if (result == NULL) {
-            PyErr_Print();
-            // Optionally stop the loop:
-            // GameLoop_stop(&self->loop_instance);
+    if (self && self->update_cb != Py_None && self->thread_error == NULL) {
+        PyGILState_STATE gstate = enter_python(self);
+        PyObject *args[2] = {NULL, self->dt_obj};
+        report_callback_error(self, PyObject_Vectorcall(
+            self->update_cb, args + 1, 1 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL));
+        leave_python(self, gstate);
+    }
+}
+
+// C adapter for batched update callback: update(dt, n_steps)
+static void update_batch_c_adapter(double dt, int n_steps, void* user_data) {
+    PyGameLoopObject *self = (PyGameLoopObject*)user_data;
+    if (self && self->update_cb != Py_None && self->thread_error == NULL) {
+        PyGILState_STATE gstate = enter_python(self);
+        PyObject *steps = PyLong_FromLong(n_steps);
+        if (steps == NULL) {
+            report_callback_error(self, NULL);
+        } else {
+            PyObject *args[3] = {NULL, self->dt_obj, steps};
+            report_callback_error(self, PyObject_Vectorcall(
+                self->update_cb, args + 1, 2 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL));
+            Py_DECREF(steps);
         }
-        Py_XDECREF(result);
-        PyGILState_Release(gstate);
+        leave_python(self, gstate);
     }
 }
 
+// Adapters for native handlers set through capsules: no GIL, no Python
+static void update_native_c_adapter(double dt, void* user_data) {
+    PyGameLoopObject *self = (PyGameLoopObject*)user_data;
+    self->native_update(dt, self->native_update_data);
+}
+
+static void update_batch_native_c_adapter(double dt, int n_steps, void* user_data) {
+    PyGameLoopObject *self = (PyGameLoopObject*)user_data;
+    self->native_update_batch(dt, n_steps, self->native_update_data);
+}
+
+static void render_native_c_adapter(double alpha, void* user_data) {
+    PyGameLoopObject *self = (PyGameLoopObject*)user_data;
+    self->native_render(alpha, self->native_render_data);
+}
+
 // C adapter for render callback
 static void render_c_adapter(double alpha, void* user_data) {
     PyGameLoopObject *self = (PyGameLoopObject*)user_data;
-    if (self && self->render_cb != Py_None && PyCallable_Check(self->render_cb)) {
-        PyGILState_STATE gstate = PyGILState_Ensure();
+    if (self && self->render_cb != Py_None && self->thread_error == NULL) {
+        PyGILState_STATE gstate = enter_python(self);
         PyObject *arg = PyFloat_FromDouble(alpha);
-        PyObject *result = PyObject_CallFunctionObjArgs(self->render_cb, arg, NULL);
-        Py_XDECREF(arg);
-        if (result == NULL) {
-            PyErr_Print();
-            // Optionally stop the loop:
-            // GameLoop_stop(&self->loop_instance);
+        if (arg == NULL) {
+            report_callback_error(self, NULL);
+        } else {
+            PyObject *args[2] = {NULL, arg};
+            report_callback_error(self, PyObject_Vectorcall(
+                self->render_cb, args + 1, 1 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL));
+            Py_DECREF(arg);
         }
-        Py_XDECREF(result);
-        PyGILState_Release(gstate);
+        leave_python(self, gstate);
     }
 }
 
@@ -220,16 +854,32 @@ static void render_c_adapter(double alpha, void* user_data) {
 // Method definition table for PyGameLoopObject
 static PyMethodDef PyGameLoop_methods[] = {
     {"start", (PyCFunction) PyGameLoop_start, METH_NOARGS, "Starts the game loop."},
-    {"stop", (PyCFunction) PyGameLoop_stop, METH_NOARGS, "Stops the game loop."},
+    {"stop", (PyCFunction) PyGameLoop_stop, METH_NOARGS, "Stops the game loop. Safe to call from any thread."},
+    {"start_in_thread", (PyCFunction) PyGameLoop_start_in_thread, METH_NOARGS, "Starts the game loop on a native thread and returns immediately. The first exception raised by a handler stops the loop and is re-raised by join(). While it runs, other threads may call stop(), join() and read is_running; handlers, profiling and time_scale can only be changed from the loop's own callbacks."},
+    {"join", (PyCFunction)(void(*)(void)) PyGameLoop_join, METH_VARARGS | METH_KEYWORDS, "join(timeout=None)\n--\n\nWaits for the loop thread to finish. Returns False if timeout expired first, else True, re-raising the first exception raised by a handler on the loop thread."},
+    {"step", (PyCFunction)(void(*)(void)) PyGameLoop_step, METH_VARARGS | METH_KEYWORDS, "step(n_updates=1, render=False)\n--\n\nRuns n_updates fixed updates without waiting for the wall clock. Returns the number run."},
+    {"run_for", (PyCFunction)(void(*)(void)) PyGameLoop_run_for, METH_VARARGS | METH_KEYWORDS, "run_for(sim_seconds, render=False)\n--\n\nAdvances the virtual clock by sim_seconds of game time. Returns the number of updates run."},
+    {"enable_profiling", (PyCFunction)(void(*)(void)) PyGameLoop_enable_profiling, METH_VARARGS | METH_KEYWORDS, "enable_profiling(capacity=1024, export_hook=None)\n--\n\nStarts recording per-phase frame timings into a preallocated ring buffer."},
+    {"disable_profiling", (PyCFunction) PyGameLoop_disable_profiling, METH_NOARGS, "Stops recording frame timings and frees the ring buffer."},
+    {"profile_samples", (PyCFunction) PyGameLoop_profile_samples, METH_NOARGS, "Returns the recorded frames, oldest first, as (input, update, render, sleep, updates) tuples."},
+    {"profile_summary", (PyCFunction) PyGameLoop_profile_summary, METH_NOARGS, "Returns mean/p50/p95/p99/max of each frame phase over the recorded frames."},
     {"set_process_input_handler", (PyCFunction) PyGameLoop_set_process_input_handler, METH_VARARGS, "Sets the handler for processing input."},
-    {"set_update_handler", (PyCFunction) PyGameLoop_set_update_handler, METH_VARARGS, "Sets the handler for updating game state."},
-    {"set_render_handler", (PyCFunction) PyGameLoop_set_render_handler, METH_VARARGS, "Sets the handler for rendering the game."},
+    {"set_update_handler", (PyCFunction)(void(*)(void)) PyGameLoop_set_update_handler, METH_VARARGS | METH_KEYWORDS, "set_update_handler(handler, batch=False)\n--\n\nSets the handler for updating game state. With batch=True it is called once per frame as handler(dt, n_steps) for all fixed updates due. A capsule named UPDATE_HANDLER_CAPSULE (UPDATE_BATCH_HANDLER_CAPSULE with batch=True) wrapping a native handler is called directly, without the GIL, with the capsule context as user_data."},
+    {"set_render_handler", (PyCFunction) PyGameLoop_set_render_handler, METH_VARARGS, "Sets the handler for rendering the game. Also accepts a RENDER_HANDLER_CAPSULE capsule wrapping a native handler."},
     {NULL}  /* Sentinel */
 };
 
 // Property definition for is_running
 static PyGetSetDef PyGameLoop_getsetters[] = {
     {"is_running", (getter) PyGameLoop_get_is_running, NULL, "True if the game loop is running", NULL},
+    {"sim_time", (getter) PyGameLoop_get_sim_time, NULL, "Game seconds simulated by fixed updates so far", NULL},
+    {"update_count", (getter) PyGameLoop_get_update_count, NULL, "Number of fixed updates run so far", NULL},
+    {"dropped_time", (getter) PyGameLoop_get_dropped_time, NULL, "Game seconds discarded by max_lag or the 'drop' catch-up mode", NULL},
+    {"dilated_time", (getter) PyGameLoop_get_dilated_time, NULL, "Game seconds absorbed by the 'dilate' catch-up mode", NULL},
+    {"capped_frames", (getter) PyGameLoop_get_capped_frames, NULL, "Number of frames that hit max_updates_per_frame", NULL},
+    {"dilation", (getter) PyGameLoop_get_dilation, NULL, "Current catch-up dilation factor of the game clock", NULL},
+    {"hold_gil", (getter) PyGameLoop_get_hold_gil, (setter) PyGameLoop_set_hold_gil, "Hold the GIL for all callbacks of a frame instead of acquiring it per callback", NULL},
+    {"time_scale", (getter) PyGameLoop_get_time_scale, (setter) PyGameLoop_set_time_scale, "Game seconds per real second", NULL},
     {NULL}  /* Sentinel */
 };
 
@@ -273,5 +923,12 @@ PyMODINIT_FUNC PyInit_gameloop_ext(void) {
         return NULL;
     }
 
+    if (PyModule_AddStringConstant(m, "UPDATE_HANDLER_CAPSULE", UPDATE_HANDLER_CAPSULE) < 0
+        || PyModule_AddStringConstant(m, "UPDATE_BATCH_HANDLER_CAPSULE", UPDATE_BATCH_HANDLER_CAPSULE) < 0
+        || PyModule_AddStringConstant(m, "RENDER_HANDLER_CAPSULE", RENDER_HANDLER_CAPSULE) < 0) {
+        Py_DECREF(m);
+        return NULL;
+    }
+
     return m;
 }
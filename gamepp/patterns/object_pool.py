@@ -4,21 +4,45 @@ Object Pool Pattern
 Defines a pool class that maintains a collection of reusable objects.
 Each object supports an “in use” query to tell if it is currently “alive”.
 When the pool is initialized, it creates the entire collection of objects up front
-and initializes them all to the “not in use” state.
+(or, in lazy mode, on first demand) and initializes them all to the “not in use” state.
 When a new object is needed, the pool is asked for one. It finds an available
 object, marks it as “in use”, and returns it. When the object is no longer
 needed, it is set back to the “not in use” state by resetting it.
 This way, objects can be acquired and released without needing to allocate
 memory or other resources repeatedly.
+
+`ConcurrentObjectPool` is a thread-safe variant that keeps a small cache of
+free objects per thread (a "magazine") in front of a shared, lock-guarded
+depot, so most acquires and releases never touch the lock.
+
+`ArrayObjectPool` pools plain-data records as slots in typed arrays (one array
+per field) instead of as Python objects, handing out lightweight views.
 """
 
-from typing import TypeVar, Generic, Type, List, Optional, Dict, Any
+import inspect
+import sys
+import threading
+import time
+import weakref
+from array import array
+from typing import TypeVar, Generic, Type, List, Optional, Dict, Any, Tuple
+
+from gamepp.common.typecodes import check_typecode
 
 # Define a TypeVar for the PooledObject subclass.
 # 'bound=PooledObject' ensures that T_PooledObject is a subclass of PooledObject.
 # However, to define PooledObject first, we use a forward reference string.
 T_PooledObject = TypeVar("T_PooledObject", bound="PooledObject")
 
+# Acquire latencies are bucketed by bit length, i.e. bucket n counts acquires
+# that took less than 2**n nanoseconds. The last bucket collects everything slower.
+_LATENCY_BUCKETS = 32
+
+# Layout of the per-thread counters of ConcurrentObjectPool: acquires,
+# releases and failed acquires, followed by the acquire latency buckets.
+_ACQUIRES, _RELEASES, _EXHAUSTIONS = range(3)
+_LATENCY_OFFSET = 3
+
 
 class PooledObject:
     """
@@ -37,6 +61,8 @@ class PooledObject:
         base class does not use them directly.
         """
         self._in_use: bool = False
+        # The pool counting this object's usage, set by the pool that owns it.
+        self._owner: Optional["ObjectPool[Any]"] = None
         # Subclasses can initialize other attributes here
 
     def is_in_use(self) -> bool:
@@ -47,8 +73,12 @@ class PooledObject:
         """
         Internal method to set the in_use status.
         This is typically called by the ObjectPool when acquiring an object,
-        or by the object's own reset method.
+        or by the object's own reset method. The owning pool is told about
+        every change, so its usage count stays right even when an object
+        resets itself.
         """
+        if status != self._in_use and self._owner is not None:
+            self._owner._on_in_use_changed(self, status)
         self._in_use = status
 
     def reset(self) -> None:
@@ -65,48 +95,155 @@ class PooledObject:
         # self.position = (0,0)
 
 
+def _describe_call_site(caller: Any) -> str:
+    """Formats a frame as "file:line in function" for leak reports."""
+    return f"{caller.f_code.co_filename}:{caller.f_lineno} in {caller.f_code.co_name}"
+
+
+def _declares_parameter(cls: Any, name: str) -> bool:
+    """Whether the constructor of `cls` declares a keyword parameter `name`."""
+    try:
+        parameters = inspect.signature(cls).parameters
+    except (TypeError, ValueError):
+        return False
+    parameter = parameters.get(name)
+    return parameter is not None and parameter.kind in (
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        inspect.Parameter.KEYWORD_ONLY,
+    )
+
+
 class ObjectPool(Generic[T_PooledObject]):
     """
     Manages a collection of reusable PooledObject instances.
 
-    This class creates a fixed number of objects upfront and allows them
-    to be acquired and released, aiming to reduce the overhead of
+    By default this class creates a fixed number of objects upfront and allows
+    them to be acquired and released, aiming to reduce the overhead of
     creating and destroying objects frequently.
+
+    Two optional modes trade that simplicity for lower costs elsewhere:
+
+    - lazy: objects are constructed on first demand instead of upfront, so
+      large pools of heavy objects don't slow down startup.
+    - deferred_reset: released objects are not reset immediately; they are
+      queued and reset in one batch when `end_frame()` is called at a safe
+      point, keeping `reset()` off the release hot path. Queued objects are
+      not available for reuse until then.
+
+    The pool keeps O(1) usage counters (see `get_pool_stats()`) and offers
+    opt-in instrumentation for sizing and debugging: an acquire latency
+    histogram (`enable_latency_tracking()`) and leak detection that records
+    where long-held objects were acquired (`enable_leak_detection()`).
     """
 
+    # Whether pooled objects report status changes to this pool.
+    _tracks_usage = True
+
     def __init__(
         self,
         object_class_to_pool: Type[T_PooledObject],
         pool_size: int,
         *object_init_args: Any,
+        lazy: Optional[bool] = None,
+        deferred_reset: Optional[bool] = None,
         **object_init_kwargs: Any,
     ) -> None:
         """
         Initializes the object pool.
 
+        `lazy` and `deferred_reset` are pool options. If the pooled class's
+        constructor declares a parameter of the same name, passing the option
+        is ambiguous and raises ValueError; pass such constructor arguments
+        positionally instead.
+
         Args:
             object_class_to_pool: The class of the objects to pool.
                                   Must be a subclass of PooledObject.
             pool_size: The number of objects to create and manage in the pool.
             *object_init_args: Positional arguments to pass to the constructor
                                of each pooled object.
+            lazy: If True, objects are constructed on first demand rather than
+                  when the pool is created. Defaults to False.
+            deferred_reset: If True, released objects are reset in a batch by
+                            `end_frame()` rather than in `release_object()`.
+                            Defaults to False.
             **object_init_kwargs: Keyword arguments to pass to the constructor
                                   of each pooled object.
+
+        Raises:
+            ValueError: If pool_size is not a positive integer, or if a pool
+                        option given is also a constructor parameter of the
+                        pooled class.
         """
         if not isinstance(pool_size, int) or pool_size <= 0:
             raise ValueError("Pool size must be a positive integer.")
+        if isinstance(object_class_to_pool, type) and not issubclass(
+            object_class_to_pool, PooledObject
+        ):
+            raise TypeError(
+                f"Class {object_class_to_pool.__name__} must inherit from PooledObject."
+            )
+        for option, value in (("lazy", lazy), ("deferred_reset", deferred_reset)):
+            if value is not None and _declares_parameter(object_class_to_pool, option):
+                raise ValueError(
+                    f"'{option}' is both an ObjectPool option and a parameter of "
+                    f"{object_class_to_pool.__name__}; pass the constructor argument "
+                    "positionally."
+                )
+
+        self._object_class = object_class_to_pool
+        self._object_init_args = object_init_args
+        self._object_init_kwargs = object_init_kwargs
+        self._pool_size: int = pool_size
+        self._deferred_reset: bool = bool(deferred_reset)
+        # Released objects awaiting end_frame(), by id, in release order.
+        self._pending_reset: Dict[int, T_PooledObject] = {}
+
+        # Usage counters. The used count follows the objects' in-use status.
+        self._used_count: int = 0
+        self._peak_used_count: int = 0
+        self._acquire_count: int = 0
+        self._release_count: int = 0
+        self._exhaustion_count: int = 0
+
+        # Opt-in instrumentation.
+        self._latency_histogram: Optional[List[int]] = None
+        self._max_held_frames: Optional[int] = None
+        self._acquire_sites: Dict[int, Tuple[T_PooledObject, int, str]] = {}
+        self._frame: int = 0
 
         self._pool: List[T_PooledObject] = []
-        for _ in range(pool_size):
-            # Create a new instance of the object
-            obj = object_class_to_pool(*object_init_args, **object_init_kwargs)
-            if not isinstance(obj, PooledObject):
-                raise TypeError(
-                    f"Class {object_class_to_pool.__name__} must inherit from PooledObject."
-                )
-            # Ensure it's in the "not in use" state and properly reset initially
-            obj.reset()
-            self._pool.append(obj)
+        if not lazy:
+            for _ in range(pool_size):
+                self._pool.append(self._create_object())
+
+    def _create_object(self) -> T_PooledObject:
+        """Constructs a new pooled object in the "not in use" state."""
+        obj = self._object_class(*self._object_init_args, **self._object_init_kwargs)
+        if not isinstance(obj, PooledObject):
+            raise TypeError(
+                f"Class {self._object_class.__name__} must inherit from PooledObject."
+            )
+        # Ensure it's in the "not in use" state and properly reset initially
+        obj.reset()
+        if self._tracks_usage:
+            obj._owner = self
+        return obj
+
+    def _on_in_use_changed(self, obj: T_PooledObject, in_use: bool) -> None:
+        """Updates the usage counters when an owned object changes status."""
+        if in_use:
+            self._used_count += 1
+            if self._used_count > self._peak_used_count:
+                self._peak_used_count = self._used_count
+        else:
+            self._used_count -= 1
+            if self._acquire_sites:
+                self._acquire_sites.pop(id(obj), None)
+            if self._pending_reset:
+                # Reset before end_frame(), e.g. by the object itself: it is
+                # available again and must not be reset under a new owner.
+                self._pending_reset.pop(id(obj), None)
 
     def acquire_object(self) -> Optional[T_PooledObject]:
         """
@@ -114,16 +251,43 @@ class ObjectPool(Generic[T_PooledObject]):
 
         The acquired object is marked as "in use". If the object has specific
         state that needs to be configured after acquisition, the caller is
-        responsible for that.
+        responsible for that. In lazy mode a new object is constructed when
+        all existing ones are in use and the pool has not reached its size.
 
         Returns:
             A PooledObject instance from the pool, or None if no objects are
             currently available.
         """
+        if self._latency_histogram is not None:
+            start = time.perf_counter_ns()
+            obj = self._take_available_object()
+            elapsed = time.perf_counter_ns() - start
+            bucket = min(elapsed.bit_length(), _LATENCY_BUCKETS - 1)
+            self._latency_histogram[bucket] += 1
+        else:
+            obj = self._take_available_object()
+
+        if obj is None:
+            self._exhaustion_count += 1
+            return None
+
+        self._acquire_count += 1
+        if self._max_held_frames is not None:
+            call_site = _describe_call_site(sys._getframe(1))
+            self._acquire_sites[id(obj)] = (obj, self._frame, call_site)
+        return obj
+
+    def _take_available_object(self) -> Optional[T_PooledObject]:
+        """Finds (or, in lazy mode, constructs) a free object and marks it in use."""
         for obj in self._pool:
             if not obj.is_in_use():
                 obj._set_in_use_status(True)  # Mark as "in use"
                 return obj
+        if len(self._pool) < self._pool_size:
+            obj = self._create_object()
+            obj._set_in_use_status(True)
+            self._pool.append(obj)
+            return obj
         return None  # Pool is exhausted
 
     def release_object(self, obj: T_PooledObject) -> None:
@@ -131,7 +295,8 @@ class ObjectPool(Generic[T_PooledObject]):
         Returns an object to the pool.
 
         The object is marked as "not in use" by calling its `reset()` method,
-        which should also revert its state to be ready for reuse.
+        which should also revert its state to be ready for reuse. In
+        deferred_reset mode the call is postponed until `end_frame()`.
 
         Args:
             obj: The PooledObject instance to release back to the pool.
@@ -147,26 +312,609 @@ class ObjectPool(Generic[T_PooledObject]):
         # This check is by identity.
         if obj in self._pool:
             if not obj.is_in_use():
-                # Optionally, handle or log releasing an already available object
-                # print(f"Warning: Object {obj} was already available in the pool.")
-                pass  # Or raise an error if this is an invalid state
+                # Releasing an already available object just resets it again.
+                obj.reset()
+                return
+            if id(obj) in self._pending_reset:
+                return  # Already released, waiting for end_frame()
+
+            self._release_count += 1
+            if self._acquire_sites:
+                self._acquire_sites.pop(id(obj), None)
+            if self._deferred_reset:
+                self._pending_reset[id(obj)] = obj
+                return
             obj.reset()  # Reset state and mark as not in use
         else:
             raise ValueError("Object being released does not belong to this pool.")
 
+    def end_frame(self) -> int:
+        """
+        Marks a safe point (e.g. the end of a frame) for the pool.
+
+        In deferred_reset mode this resets every object released since the
+        previous call, making them available again. Objects that were reset
+        since their release, and may already be in use by a new owner, are
+        skipped. It also advances the frame counter used by leak detection.
+
+        Returns:
+            The number of objects that were reset.
+        """
+        self._frame += 1
+        pending = self._pending_reset
+        if not pending:
+            return 0
+        count = 0
+        for key in list(pending):
+            # Popped one at a time, so an object that leaves the pending
+            # state while the batch runs is skipped too.
+            obj = pending.pop(key, None)
+            if obj is None:
+                continue
+            obj.reset()
+            count += 1
+        return count
+
     def get_pool_info(self) -> Dict[str, int]:
         """
         Provides information about the current state of the object pool.
 
+        Returns:
+            A dictionary containing the total number of objects,
+            the number of used objects, and the number of available objects.
+        """
+        total_objects = self._pool_size
+        used_objects = self._used_count
+        available_objects = total_objects - used_objects
+        return {
+            "total_objects": total_objects,
+            "used_objects": used_objects,
+            "available_objects": available_objects,
+        }
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Provides usage history for sizing the pool.
+
+        Returns:
+            A dictionary with the current and peak number of used objects,
+            the number of acquires, releases and failed (exhausted) acquires,
+            and, if latency tracking is enabled, an acquire latency histogram
+            mapping bucket upper bounds in nanoseconds to acquire counts.
+        """
+        stats: Dict[str, Any] = {
+            "used_objects": self._used_count,
+            "peak_used_objects": self._peak_used_count,
+            "acquire_count": self._acquire_count,
+            "release_count": self._release_count,
+            "exhaustion_count": self._exhaustion_count,
+        }
+        if self._latency_histogram is not None:
+            stats["acquire_latency_ns"] = {
+                1 << bucket: count
+                for bucket, count in enumerate(self._latency_histogram)
+                if count
+            }
+        return stats
+
+    def enable_latency_tracking(self) -> None:
+        """
+        Starts recording how long each acquire takes into a histogram of
+        power-of-two nanosecond buckets.
+        """
+        if self._latency_histogram is None:
+            self._latency_histogram = [0] * _LATENCY_BUCKETS
+
+    def enable_leak_detection(self, max_held_frames: int) -> None:
+        """
+        Starts recording the call site of every acquire so that objects held
+        for longer than `max_held_frames` calls to `end_frame()` can be
+        reported by `find_leaks()`. Intended for debug builds.
+
+        Raises:
+            ValueError: If max_held_frames is not a positive integer.
+        """
+        if not isinstance(max_held_frames, int) or max_held_frames <= 0:
+            raise ValueError("max_held_frames must be a positive integer.")
+        self._max_held_frames = max_held_frames
+
+    def find_leaks(self) -> List[Tuple[T_PooledObject, int, str]]:
+        """
+        Lists objects held longer than the leak detection threshold.
+
+        Returns:
+            A list of (object, frames held, acquiring call site) tuples, oldest
+            first. Empty if leak detection is not enabled.
+        """
+        if self._max_held_frames is None:
+            return []
+        leaks = []
+        for obj, acquired_frame, call_site in list(self._acquire_sites.values()):
+            frames_held = self._frame - acquired_frame
+            if frames_held > self._max_held_frames:
+                leaks.append((obj, frames_held, call_site))
+        leaks.sort(key=lambda leak: -leak[1])
+        return leaks
+
+
+class _Magazine:
+    """
+    Per-thread cache of free objects used by ConcurrentObjectPool.
+    Kept as its own object so it can be finalized when its thread exits.
+    """
+
+    __slots__ = ("objects", "counts", "__weakref__")
+
+    def __init__(self) -> None:
+        self.objects: List[PooledObject] = []
+        # This thread's usage counters, laid out as described at _ACQUIRES.
+        self.counts: List[int] = [0] * (_LATENCY_OFFSET + _LATENCY_BUCKETS)
+
+
+def _return_magazine_to_depot(
+    lock: threading.Lock,
+    depot: List[PooledObject],
+    objects: List[PooledObject],
+    live_counts: List[List[int]],
+    retired_counts: List[int],
+    counts: List[int],
+) -> None:
+    """
+    Moves a dead thread's cached objects back into the shared depot and
+    folds its counters into those of the threads that exited before it.
+    """
+    with lock:
+        depot.extend(objects)
+        for index, count in enumerate(counts):
+            retired_counts[index] += count
+        # By identity: another thread's counters may be equal to these.
+        for index, other in enumerate(live_counts):
+            if other is counts:
+                del live_counts[index]
+                break
+    objects.clear()
+
+
+class ConcurrentObjectPool(ObjectPool[T_PooledObject]):
+    """
+    A thread-safe ObjectPool using per-thread magazines backed by a shared depot.
+
+    Each thread caches up to `2 * magazine_size` free objects locally. Acquiring
+    pops from the local magazine and only locks the depot to refill it with a
+    batch of `magazine_size` objects; releasing pushes onto the local magazine
+    and only locks the depot to hand back a batch when the magazine overflows.
+    A thread's magazine is returned to the depot automatically when the thread
+    exits, or explicitly with `flush_local_cache()`.
+
+    Note that objects cached by other threads are not visible to a thread whose
+    magazine and the depot are both empty, so `acquire_object` can return None
+    while `get_pool_info` still reports available objects.
+
+    Usage statistics and instrumentation work as in ObjectPool, with the
+    counters kept per thread and summed by `get_pool_stats()`; objects that
+    reset themselves instead of being released stay counted as used.
+    """
+
+    # Objects don't report to the pool, since shared usage counters would
+    # reintroduce contention; usage is counted per thread instead.
+    _tracks_usage = False
+
+    def __init__(
+        self,
+        object_class_to_pool: Type[T_PooledObject],
+        pool_size: int,
+        *object_init_args: Any,
+        magazine_size: int = 16,
+        lazy: Optional[bool] = None,
+        deferred_reset: Optional[bool] = None,
+        **object_init_kwargs: Any,
+    ) -> None:
+        """
+        Initializes the concurrent object pool.
+
+        Args:
+            object_class_to_pool: The class of the objects to pool.
+                                  Must be a subclass of PooledObject.
+            pool_size: The number of objects to create and manage in the pool.
+            *object_init_args: Positional arguments to pass to the constructor
+                               of each pooled object.
+            magazine_size: The number of objects moved between a thread's
+                           magazine and the depot at a time.
+            lazy, deferred_reset: Not supported; objects are created upfront
+                                  and reset on release.
+            **object_init_kwargs: Keyword arguments to pass to the constructor
+                                  of each pooled object.
+
+        Raises:
+            ValueError: If magazine_size is not a positive integer, or if
+                        lazy or deferred_reset is given.
+        """
+        if not isinstance(magazine_size, int) or magazine_size <= 0:
+            raise ValueError("Magazine size must be a positive integer.")
+        if lazy is not None or deferred_reset is not None:
+            raise ValueError(
+                "ConcurrentObjectPool does not support the lazy and deferred_reset options."
+            )
+        super().__init__(
+            object_class_to_pool,
+            pool_size,
+            *object_init_args,
+            **object_init_kwargs,
+        )
+        self._magazine_size: int = magazine_size
+        # Reversed so that pop() hands objects out in pool order.
+        self._depot: List[T_PooledObject] = list(reversed(self._pool))
+        self._depot_lock = threading.Lock()
+        self._members = {id(obj) for obj in self._pool}
+        # Objects currently acquired, by id. Popping from it is the atomic
+        # "test and clear" that lets exactly one release of an object win.
+        self._held: Dict[int, T_PooledObject] = {}
+        self._local = threading.local()
+        # Counters of the live threads, and the sums of exited ones.
+        self._live_counts: List[List[int]] = []
+        self._retired_counts: List[int] = [0] * (_LATENCY_OFFSET + _LATENCY_BUCKETS)
+
+    def _get_magazine(self) -> _Magazine:
+        """Returns the calling thread's magazine, creating it on first use."""
+        try:
+            return self._local.magazine
+        except AttributeError:
+            magazine = _Magazine()
+            with self._depot_lock:
+                self._live_counts.append(magazine.counts)
+            weakref.finalize(
+                magazine,
+                _return_magazine_to_depot,
+                self._depot_lock,
+                self._depot,
+                magazine.objects,
+                self._live_counts,
+                self._retired_counts,
+                magazine.counts,
+            )
+            self._local.magazine = magazine
+            return magazine
+
+    def acquire_object(self) -> Optional[T_PooledObject]:
+        """
+        Acquires an available object from the calling thread's magazine,
+        refilling it from the shared depot if it is empty.
+
+        Returns:
+            A PooledObject instance from the pool, or None if neither the
+            magazine nor the depot has an available object.
+        """
+        magazine = self._get_magazine()
+        counts = magazine.counts
+        if self._latency_histogram is not None:
+            start = time.perf_counter_ns()
+            obj = self._take_from_magazine(magazine.objects)
+            elapsed = time.perf_counter_ns() - start
+            bucket = min(elapsed.bit_length(), _LATENCY_BUCKETS - 1)
+            counts[_LATENCY_OFFSET + bucket] += 1
+        else:
+            obj = self._take_from_magazine(magazine.objects)
+
+        if obj is None:
+            counts[_EXHAUSTIONS] += 1
+            return None
+
+        counts[_ACQUIRES] += 1
+        held = self._held
+        held[id(obj)] = obj
+        # Unlocked, so the peak may miss a concurrent acquire.
+        used = len(held)
+        if used > self._peak_used_count:
+            self._peak_used_count = used
+        if self._max_held_frames is not None:
+            call_site = _describe_call_site(sys._getframe(1))
+            self._acquire_sites[id(obj)] = (obj, self._frame, call_site)
+        return obj
+
+    def _take_from_magazine(
+        self, magazine: List[T_PooledObject]
+    ) -> Optional[T_PooledObject]:
+        """Pops a free object, refilling the magazine from the depot if needed."""
+        if not magazine:
+            with self._depot_lock:
+                depot = self._depot
+                if depot:
+                    take = min(self._magazine_size, len(depot))
+                    magazine.extend(depot[-take:])
+                    del depot[-take:]
+            if not magazine:
+                return None  # Pool is exhausted (for this thread)
+        obj = magazine.pop()
+        obj._set_in_use_status(True)
+        return obj
+
+    def release_object(self, obj: T_PooledObject) -> None:
+        """
+        Returns an object to the calling thread's magazine after resetting it.
+
+        Only the first release of an acquired object takes effect, even if
+        several threads release it at once; it is never cached twice. Later
+        releases are ignored rather than resetting the object again, since
+        another thread may have acquired it in the meantime.
+
+        Args:
+            obj: The PooledObject instance to release back to the pool.
+
+        Raises:
+            ValueError: If the object being released does not belong to this pool
+                        or is not a PooledObject instance.
+        """
+        if not isinstance(obj, PooledObject):
+            raise ValueError("Object being released is not a PooledObject instance.")
+        if id(obj) not in self._members:
+            raise ValueError("Object being released does not belong to this pool.")
+
+        if self._held.pop(id(obj), None) is None:
+            return  # Not acquired, or another release already won
+        if self._acquire_sites:
+            self._acquire_sites.pop(id(obj), None)
+        obj.reset()
+
+        magazine = self._get_magazine()
+        magazine.counts[_RELEASES] += 1
+        objects = magazine.objects
+        objects.append(obj)
+        if len(objects) > 2 * self._magazine_size:
+            batch = objects[: self._magazine_size]
+            del objects[: self._magazine_size]
+            with self._depot_lock:
+                self._depot.extend(batch)
+
+    def get_pool_info(self) -> Dict[str, int]:
+        """
+        Provides information about the current state of the object pool.
+
+        The usage counters of ObjectPool are not maintained here, since
+        updating shared counters would reintroduce contention; the used count
+        is computed with a scan instead and is only a snapshot while other
+        threads are running.
+
         Returns:
             A dictionary containing the total number of objects,
             the number of used objects, and the number of available objects.
         """
         total_objects = len(self._pool)
         used_objects = sum(1 for obj in self._pool if obj.is_in_use())
-        available_objects = total_objects - used_objects
         return {
             "total_objects": total_objects,
             "used_objects": used_objects,
+            "available_objects": total_objects - used_objects,
+        }
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Provides usage history for sizing the pool, as ObjectPool does.
+
+        The per-thread counters are summed under the depot lock. While other
+        threads are running the result is a snapshot, and the peak may miss
+        acquires that raced with each other.
+
+        Returns:
+            A dictionary with the current and peak number of used objects,
+            the number of acquires, releases and failed (exhausted) acquires,
+            and, if latency tracking is enabled, an acquire latency histogram
+            mapping bucket upper bounds in nanoseconds to acquire counts.
+        """
+        with self._depot_lock:
+            totals = list(self._retired_counts)
+            for counts in self._live_counts:
+                for index, count in enumerate(counts):
+                    totals[index] += count
+        stats: Dict[str, Any] = {
+            "used_objects": len(self._held),
+            "peak_used_objects": self._peak_used_count,
+            "acquire_count": totals[_ACQUIRES],
+            "release_count": totals[_RELEASES],
+            "exhaustion_count": totals[_EXHAUSTIONS],
+        }
+        if self._latency_histogram is not None:
+            stats["acquire_latency_ns"] = {
+                1 << bucket: count
+                for bucket, count in enumerate(totals[_LATENCY_OFFSET:])
+                if count
+            }
+        return stats
+
+    def flush_local_cache(self) -> None:
+        """
+        Returns every object cached by the calling thread to the shared depot,
+        making them available to other threads.
+        """
+        magazine = self._get_magazine().objects
+        if magazine:
+            with self._depot_lock:
+                self._depot.extend(magazine)
+            magazine.clear()
+
+
+class PooledSlotView:
+    """
+    Lightweight handle to one slot of an ArrayObjectPool.
+
+    Field values are read and written straight from the pool's arrays via
+    properties generated for each field. A view becomes stale once its slot
+    is released; `is_valid()` reports whether it still refers to a live slot,
+    and reading or writing a field through a stale view raises ValueError
+    instead of touching the slot's next occupant.
+    """
+
+    __slots__ = ("_pool", "slot", "_generation")
+
+    def __init__(self, pool: "ArrayObjectPool", slot: int, generation: int) -> None:
+        self._pool = pool
+        self.slot = slot
+        self._generation = generation
+
+    def is_valid(self) -> bool:
+        """Checks if the slot is still held through this view."""
+        return self._pool._generations[self.slot] == self._generation
+
+    def __repr__(self) -> str:
+        if not self.is_valid():
+            return f"{type(self).__name__}(slot={self.slot}, stale)"
+        fields = ", ".join(
+            f"{name}={column[self.slot]!r}"
+            for name, column in self._pool._columns.items()
+        )
+        return f"{type(self).__name__}(slot={self.slot}, {fields})"
+
+
+def _make_field_property(column: array, generations: array) -> property:
+    def getter(view: PooledSlotView) -> Any:
+        slot = view.slot
+        if generations[slot] != view._generation:
+            raise ValueError("Slot view is stale: its slot has been released.")
+        return column[slot]
+
+    def setter(view: PooledSlotView, value: Any) -> None:
+        slot = view.slot
+        if generations[slot] != view._generation:
+            raise ValueError("Slot view is stale: its slot has been released.")
+        column[slot] = value
+
+    return property(getter, setter)
+
+
+class ArrayObjectPool:
+    """
+    An object pool for plain-data records stored as a Structure of Arrays.
+
+    Each field is a typed `array.array` column of `pool_size` elements and a
+    pooled "object" is just an index (slot) into those columns, so 100k
+    records cost a handful of contiguous buffers instead of 100k Python
+    objects. Slots can be used directly (`acquire_slot`/`release_slot` plus
+    `column()`) or through a `PooledSlotView` with one attribute per field.
+    Released slots have all their fields reset to zero.
+    """
+
+    def __init__(self, fields: Dict[str, str], pool_size: int) -> None:
+        """
+        Initializes the array-backed pool.
+
+        Args:
+            fields: Mapping of field name to `array` typecode, e.g.
+                    {"x": "d", "y": "d", "ttl": "i"}.
+            pool_size: The number of slots in the pool.
+        """
+        if not isinstance(pool_size, int) or pool_size <= 0:
+            raise ValueError("Pool size must be a positive integer.")
+        if not fields:
+            raise ValueError("At least one field must be declared.")
+
+        self._pool_size: int = pool_size
+        self._columns: Dict[str, array] = {}
+        for name, typecode in fields.items():
+            check_typecode(typecode, name)
+            if not name.isidentifier() or name.startswith("_") or name == "slot":
+                raise ValueError(f"Invalid field name {name!r}.")
+            column = array(typecode)
+            column.frombytes(bytes(column.itemsize * pool_size))
+            self._columns[name] = column
+
+        self._in_use = bytearray(pool_size)
+        self._generations = array("I", bytes(4 * pool_size))
+        # Free slots as a stack; reversed so that slot 0 is handed out first.
+        self._free_slots = array("i", range(pool_size - 1, -1, -1))
+        self._view_class = type(
+            "PooledSlotView",
+            (PooledSlotView,),
+            {
+                "__slots__": (),
+                **{
+                    name: _make_field_property(column, self._generations)
+                    for name, column in self._columns.items()
+                },
+            },
+        )
+
+    def acquire_slot(self) -> Optional[int]:
+        """
+        Acquires a free slot.
+
+        Returns:
+            The slot index, or None if the pool is exhausted.
+        """
+        if not self._free_slots:
+            return None
+        slot = self._free_slots.pop()
+        self._in_use[slot] = 1
+        return slot
+
+    def release_slot(self, slot: int) -> None:
+        """
+        Returns a slot to the pool, zeroing its fields.
+        Releasing a slot that is already free does nothing.
+
+        Raises:
+            ValueError: If the slot does not belong to this pool.
+        """
+        if not isinstance(slot, int) or not 0 <= slot < self._pool_size:
+            raise ValueError("Slot being released does not belong to this pool.")
+        if not self._in_use[slot]:
+            return
+        for column in self._columns.values():
+            column[slot] = 0
+        self._in_use[slot] = 0
+        self._generations[slot] = (self._generations[slot] + 1) & 0xFFFFFFFF
+        self._free_slots.append(slot)
+
+    def acquire(self) -> Optional[PooledSlotView]:
+        """
+        Acquires a free slot and returns a view of it.
+
+        Returns:
+            A PooledSlotView for the slot, or None if the pool is exhausted.
+        """
+        slot = self.acquire_slot()
+        if slot is None:
+            return None
+        return self._view_class(self, slot, self._generations[slot])
+
+    def release(self, view: PooledSlotView) -> None:
+        """
+        Returns the slot behind a view to the pool.
+        Releasing a stale view (whose slot was already released) does nothing.
+
+        Raises:
+            ValueError: If the view does not belong to this pool.
+        """
+        if not isinstance(view, PooledSlotView) or view._pool is not self:
+            raise ValueError("View being released does not belong to this pool.")
+        if view.is_valid():
+            self.release_slot(view.slot)
+
+    def is_in_use(self, slot: int) -> bool:
+        """Checks if the given slot is currently acquired."""
+        return bool(self._in_use[slot])
+
+    def column(self, name: str) -> array:
+        """
+        Returns the backing array for a field, for bulk processing.
+        Values at free slots are zero.
+        """
+        return self._columns[name]
+
+    @property
+    def field_names(self) -> List[str]:
+        """The declared field names, in declaration order."""
+        return list(self._columns)
+
+    def get_pool_info(self) -> Dict[str, int]:
+        """
+        Provides information about the current state of the pool.
+
+        Returns:
+            A dictionary containing the total number of slots,
+            the number of used slots, and the number of available slots.
+        """
+        available_objects = len(self._free_slots)
+        return {
+            "total_objects": self._pool_size,
+            "used_objects": self._pool_size - available_objects,
             "available_objects": available_objects,
         }
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Any
+from typing import Any, Callable, Dict, List, Tuple
 
 
 class ObserverMixin(ABC):
@@ -45,13 +45,18 @@ class ObserverMixin(ABC):
 
 class ObserverNode:
     """
-    A node in a singly linked list to manage observers.
+    A node in a doubly linked list to manage observers. LinkedSubject.attach
+    returns it as a handle to the observer's place in the list.
     """
 
-    def __init__(self, observer: ObserverMixin):
+    __slots__ = ("observer", "next", "prev", "active", "seq")
+
+    def __init__(self, observer: ObserverMixin, seq: int = 0):
         self.observer = observer
+        self.seq = seq  # Attach order, so notify() can skip later nodes
         self.next: "ObserverNode" = None  # Type hint for the next node
         self.prev: "ObserverNode" = None
+        self.active: bool = True  # False once detached
 
 
 class Subject:
@@ -94,17 +99,33 @@ class LinkedSubject(Subject):
     more efficient insertion and deletion of observers.
 
     This is particularly useful if observers are frequently
-    added and removed.
+    added and removed. Each observer's node is also kept in a dict keyed by
+    identity, so attaching is idempotent and detaching is O(1).
     """
 
     def __init__(self):
         super().__init__()
         self._head: ObserverNode = None
         self._tail: ObserverNode = None
+        self._nodes: Dict[int, ObserverNode] = {}
+        self._attach_seq = 0
 
-    def attach(self, observer: ObserverMixin) -> None:
-        """Attach an observer to the subject."""
-        new_node = ObserverNode(observer)
+    def __contains__(self, observer: ObserverMixin) -> bool:
+        return id(observer) in self._nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def attach(self, observer: ObserverMixin) -> ObserverNode:
+        """
+        Attach an observer to the subject. Returns its node; attaching an
+        observer again returns its existing node.
+        """
+        node = self._nodes.get(id(observer))
+        if node is not None:
+            return node
+        self._attach_seq += 1
+        new_node = ObserverNode(observer, self._attach_seq)
         if not self._head:
             self._head = new_node
             self._tail = new_node
@@ -112,32 +133,94 @@ class LinkedSubject(Subject):
             self._tail.next = new_node
             new_node.prev = self._tail
             self._tail = new_node
+        self._nodes[id(observer)] = new_node
         observer.attached(self)
+        return new_node
 
     def detach(self, observer: ObserverMixin) -> None:
         """Detach an observer from the subject."""
-        current = self._head
-        while current:
-            if current.observer == observer:
-                if current.prev:
-                    current.prev.next = current.next
-                else:
-                    self._head = current.next
-                if current.next:
-                    current.next.prev = current.prev
-                else:
-                    self._tail = current.prev
-                observer.detached(self)
-                return
-            current = current.next
+        node = self._nodes.pop(id(observer), None)
+        if node is None:
+            return
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self._head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self._tail = node.prev
+        # Keep node.next, so that a notify() standing on this node can
+        # still move on to the rest of the list.
+        node.prev = None
+        node.active = False
+        observer.detached(self)
 
     def notify(self, event_data: Any = None) -> None:
         """
         Notify all attached observers about an event.
-        Iterates over a copy of the observer list in case
-        observers detach themselves during notification.
+        Observers may detach themselves or others during notification:
+        detached observers are skipped, and observers attached during
+        notification are first notified by the next notify().
         """
+        # Nodes are appended in attach order, so the first node attached
+        # after this call started marks the end of the observers to notify.
+        start_seq = self._attach_seq
         current = self._head
-        while current:
-            current.observer.on_notify(self, event_data)
+        while current and current.seq <= start_seq:
+            if current.active:
+                current.observer.on_notify(self, event_data)
             current = current.next
+
+
+class CopyOnWriteSubject(Subject):
+    """
+    A subject tuned for many notifications and few attach/detach calls.
+
+    Observers are kept in an insertion-ordered dict keyed by identity, so
+    attach, detach and membership checks are O(1). notify() iterates an
+    immutable snapshot of the observers' bound on_notify methods, which is
+    rebuilt only after attach or detach rather than copied on every call.
+    Observers may attach or detach during notification: the current
+    notification still goes to the observers of the snapshot it started
+    with, as with Subject.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._by_id: Dict[int, ObserverMixin] = {}
+        self._snapshot: Tuple[Callable[[Any, Any], None], ...] | None = ()
+
+    def __contains__(self, observer: ObserverMixin) -> bool:
+        return id(observer) in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    @property
+    def observers(self) -> List[ObserverMixin]:
+        """Returns the attached observers, in attach order."""
+        return list(self._by_id.values())
+
+    def attach(self, observer: ObserverMixin) -> None:
+        """Attach an observer to the subject."""
+        if id(observer) not in self._by_id:
+            self._by_id[id(observer)] = observer
+            self._snapshot = None
+            observer.attached(self)
+
+    def detach(self, observer: ObserverMixin) -> None:
+        """Detach an observer from the subject."""
+        if self._by_id.pop(id(observer), None) is not None:
+            self._snapshot = None
+            observer.detached(self)
+
+    def notify(self, event_data: Any = None) -> None:
+        """Notify all attached observers about an event."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = tuple(
+                observer.on_notify for observer in self._by_id.values()
+            )
+        for on_notify in snapshot:
+            on_notify(self, event_data)
@@ -1,4 +1,6 @@
-from typing import List, Protocol
+import functools
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Hashable, Iterable, List, Protocol
 
 
 class Entity(Protocol):
@@ -51,3 +53,221 @@ class UpdateMethodManager:
     def entities(self) -> List[Entity]:
         """Returns a copy of the list of managed entities."""
         return list(self._entities)
+
+
+class System:
+    """
+    An update step with declared data access, run by SystemScheduler.
+
+    `reads` and `writes` name the component types (any hashable, usually
+    classes) the update reads and modifies. Two systems conflict if one
+    writes what the other reads or writes; an `exclusive` system conflicts
+    with every other. If `apply` is given, it is called on the scheduler's
+    thread with the return value of `update`. This lets a system run in a
+    process pool, where `update` computes a result from its inputs and
+    `apply` writes it back into the game state. A `local` system runs on
+    the scheduler's thread instead of the executor, e.g. because it uses
+    state a process pool cannot see or an API bound to the main thread.
+    """
+
+    def __init__(
+        self,
+        update: Callable[[float], Any],
+        reads: Iterable[Hashable] = (),
+        writes: Iterable[Hashable] = (),
+        name: str | None = None,
+        apply: Callable[[Any], None] | None = None,
+        exclusive: bool = False,
+        local: bool = False,
+    ):
+        self.update = update
+        self.reads: frozenset = frozenset(reads)
+        self.writes: frozenset = frozenset(writes)
+        self.name: str = name if name is not None else getattr(update, "__name__", "system")
+        self.apply = apply
+        self.exclusive: bool = exclusive
+        self.local: bool = local
+        self.source: Any = None  # The entity an exclusive system was made for
+
+    def conflicts_with(self, other: "System") -> bool:
+        """Whether this system and `other` must not run at the same time."""
+        if self.exclusive or other.exclusive:
+            return True
+        return bool(self.writes & (other.reads | other.writes) or other.writes & self.reads)
+
+    def __repr__(self) -> str:
+        return f"System({self.name!r}, reads={set(self.reads)}, writes={set(self.writes)})"
+
+
+class SystemScheduler(UpdateMethodManager):
+    """
+    Runs systems that declare the components they read and write, executing
+    independent systems concurrently on an executor.
+
+    Systems are ordered by registration. Each conflicting pair keeps that
+    order, which gives a dependency DAG. Systems whose dependencies are done
+    are submitted to the executor, so every system sees the same data as in
+    a serial run in registration order, provided it only touches what it
+    declares. The DAG is rebuilt only when the set of systems changes.
+
+    The default executor is a ThreadPoolExecutor of `max_workers` threads,
+    which pays off for systems that release the GIL (NumPy, I/O, C
+    extensions). For pure-Python CPU-bound systems, pass a
+    ProcessPoolExecutor and give the systems picklable `update` functions
+    and an `apply` callback. Entities added with add_entity() run as
+    exclusive systems. Use as the update handler of a GameLoop:
+
+        loop.set_update_handler(scheduler.update_all)
+    """
+
+    def __init__(self, executor: Executor | None = None, max_workers: int | None = None):
+        super().__init__()
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+        self._systems: List[System] = []
+        self._executor: Executor | None = executor
+        self._owns_executor: bool = executor is None
+        self._max_workers: int | None = max_workers
+        self._graph: tuple[tuple[System, ...], list[list[int]], list[int]] | None = None
+
+    def add_system(
+        self,
+        update: Callable[[float], Any],
+        reads: Iterable[Hashable] = (),
+        writes: Iterable[Hashable] = (),
+        name: str | None = None,
+        apply: Callable[[Any], None] | None = None,
+        local: bool = False,
+    ) -> System:
+        """Registers a system after all current ones. Returns it, e.g. for remove_system."""
+        return self._add(System(update, reads, writes, name, apply, local=local))
+
+    def _add(self, system: System) -> System:
+        self._systems.append(system)
+        self._graph = None
+        return system
+
+    def remove_system(self, system: System) -> None:
+        """Unregisters a system."""
+        if system in self._systems:
+            self._systems.remove(system)
+            self._graph = None
+
+    def add_entity(self, entity: Entity) -> None:
+        """Adds an entity, run as an exclusive system since its access is unknown."""
+        if entity not in self._entities:
+            super().add_entity(entity)
+            system = System(entity.update, name=type(entity).__name__, exclusive=True)
+            system.source = entity
+            self._add(system)
+
+    def remove_entity(self, entity: Entity) -> None:
+        """Removes an entity and its system."""
+        super().remove_entity(entity)
+        for system in self._systems:
+            if system.source is entity:
+                self.remove_system(system)
+                break
+
+    @property
+    def systems(self) -> List[System]:
+        """Returns a copy of the list of systems, in registration order."""
+        return list(self._systems)
+
+    def _dependency_graph(self) -> tuple[tuple[System, ...], list[list[int]], list[int]]:
+        """
+        Returns a snapshot of the systems with the dependents of each one and
+        its number of dependencies, indexed like the snapshot.
+        """
+        if self._graph is None:
+            systems = tuple(self._systems)
+            dependents: list[list[int]] = [[] for _ in systems]
+            dependencies = [0] * len(systems)
+            for j, later in enumerate(systems):
+                for i in range(j):
+                    if systems[i].conflicts_with(later):
+                        dependents[i].append(j)
+                        dependencies[j] += 1
+            self._graph = (systems, dependents, dependencies)
+        return self._graph
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="system"
+            )
+        return self._executor
+
+    def update_all(self, dt: float) -> None:
+        """
+        Runs every system once, independent ones concurrently. If systems
+        raise, the systems already running are waited for, no others are
+        started, and the exception of the earliest registered one is raised.
+
+        Args:
+            dt: The time elapsed since the last frame, in seconds.
+        """
+        systems = self._systems
+        if len(systems) == 1 or (self._max_workers == 1 and self._owns_executor):
+            for system in list(systems):
+                result = system.update(dt)
+                if system.apply is not None:
+                    system.apply(result)
+            return
+        if not systems:
+            return
+
+        # The graph and the systems it indexes come from the same snapshot,
+        # so systems added or removed meanwhile take effect next frame.
+        systems, dependents, dependencies = self._dependency_graph()
+        remaining = list(dependencies)
+        ready = [i for i, count in enumerate(remaining) if count == 0]
+        executor = self._get_executor()
+        pending: dict[Future, int] = {}
+        errors: dict[int, BaseException] = {}
+
+        def finish(i: int, run: Callable[[], Any]) -> None:
+            """Gets the result of system i, applies it and releases its dependents."""
+            try:
+                result = run()
+                if systems[i].apply is not None:
+                    systems[i].apply(result)
+            except Exception as exc:
+                errors[i] = exc
+                return
+            for j in dependents[i]:
+                remaining[j] -= 1
+                if remaining[j] == 0:
+                    ready.append(j)
+
+        while ready or pending:
+            if ready:
+                batch = sorted(ready)
+                ready.clear()
+                if not errors:
+                    for i in batch:
+                        if not systems[i].local:
+                            pending[executor.submit(systems[i].update, dt)] = i
+                    for i in batch:
+                        if systems[i].local:
+                            finish(i, functools.partial(systems[i].update, dt))
+                if ready:
+                    continue
+            if pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=pending.__getitem__):
+                    finish(pending.pop(future), future.result)
+        if errors:
+            raise errors[min(errors)]
+
+    def close(self) -> None:
+        """Shuts down the executor if the scheduler created it."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "SystemScheduler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
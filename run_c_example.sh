@@ -2,7 +2,7 @@
 
 # Compile the C game loop example
 echo "Compiling game_loop_example.c and game_loop.c..."
-gcc -Wall -I./gamepp/patterns -o ./gamepp/patterns/game_loop_example ./gamepp/patterns/game_loop_example.c ./gamepp/patterns/game_loop.c
+gcc -Wall -I./gamepp/patterns -o ./gamepp/patterns/game_loop_example ./gamepp/patterns/game_loop_example.c ./gamepp/patterns/game_loop.c -lm
 
 # Check if compilation was successful
 if [ $? -ne 0 ]; then
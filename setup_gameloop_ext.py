@@ -1,3 +1,5 @@
+import sys
+
 from setuptools import setup, Extension
 
 setup(
@@ -14,6 +16,7 @@ setup(
             # depending on what your game loop or its handlers might do.
             # For POSIX, libraries like 'm' (for math.h functions if not auto-linked) or 'rt' (for clock_gettime).
             # libraries=['m'] # Example for POSIX if math functions are used and not auto-linked
+            libraries=[] if sys.platform == "win32" else ["m"],  # fmod in game_loop.c
         )
     ],
 )
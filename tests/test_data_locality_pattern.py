@@ -1,6 +1,21 @@
 # filepath: c:\\Users\\willi\\GameProgrammingPatterns\\tests\\test_data_locality_pattern.py
+import math
 import unittest
-from gamepp.patterns.data_locality import ParticleSystem
+from unittest import mock
+from gamepp.patterns.data_locality import (
+    AttractorForce,
+    BoundsConstraint,
+    DragForce,
+    GravityForce,
+    ParallelParticleSystem,
+    ParticleEmitter,
+    ParticlePipeline,
+    ParticleSystem,
+    SoAStore,
+    VectorizedParticleSystem,
+    _SHARED_COLUMNS,
+    np,
+)
 
 
 class TestDataLocalityPattern(unittest.TestCase):
@@ -135,6 +150,14 @@ class TestDataLocalityPattern(unittest.TestCase):
         self.assertIsNotNone(data_p1)
         self.assertEqual(data_p1["pos_x"], 2)
 
+    def test_sparse_mode_reuses_lowest_free_slot(self):
+        ps = ParticleSystem(max_particles=4)
+        ids = [ps.add_particle(i, 0, 0, 0) for i in range(4)]
+        ps.remove_particle(ids[1])
+        ps.remove_particle(ids[3])
+        ps.remove_particle(ids[0])
+        self.assertEqual([ps.add_particle(9, 0, 0, 0) for _ in range(3)], [0, 1, 3])
+
     def test_update_with_inactive_particles(self):
         ps = ParticleSystem(max_particles=3)
         p0 = ps.add_particle(1, 1, 1, 1)  # vel_x = 1
@@ -180,5 +203,545 @@ class TestDataLocalityPattern(unittest.TestCase):
         self.assertFalse(any(d["id"] == p0_id for d in active_data_after_remove))
 
 
+class TestDenseParticleSystem(unittest.TestCase):
+    def test_swap_remove_keeps_particles_packed(self):
+        ps = ParticleSystem(max_particles=4, dense=True)
+        ids = [ps.add_particle(i, i * 10, 1, 1) for i in range(3)]
+        self.assertEqual(ids, [0, 1, 2])
+
+        ps.remove_particle(ids[0])
+        self.assertEqual(ps.num_active_particles, 2)
+        self.assertEqual(list(ps.active), [True, True, False, False])
+        # The last particle was moved into the hole at index 0.
+        self.assertEqual(ps.positions_x[0], 2)
+        self.assertIsNone(ps.get_particle_data(ids[0]))
+        self.assertEqual(ps.get_particle_data(ids[2])["pos_y"], 20)
+        self.assertEqual(ps.get_particle_data(ids[1])["pos_y"], 10)
+
+        ps.remove_particle(ids[0])  # Already removed
+        ps.remove_particle(99)
+        self.assertEqual(ps.num_active_particles, 2)
+
+    def test_ids_are_stable_across_updates_and_reuse(self):
+        ps = ParticleSystem(max_particles=3, dense=True)
+        a = ps.add_particle(0, 0, 1, 0)
+        b = ps.add_particle(0, 0, 2, 0)
+        c = ps.add_particle(0, 0, 3, 0)
+        self.assertIsNone(ps.add_particle(0, 0, 0, 0))
+
+        ps.remove_particle(b)
+        d = ps.add_particle(100, 0, 4, 0)
+        self.assertEqual(d, b, "Freed IDs are reused")
+        ps.update(1.0)
+
+        self.assertEqual(ps.get_particle_data(a)["pos_x"], 1)
+        self.assertEqual(ps.get_particle_data(c)["pos_x"], 3)
+        self.assertEqual(ps.get_particle_data(d)["pos_x"], 104)
+        self.assertEqual(
+            sorted(p["id"] for p in ps.get_active_particles_data()), sorted([a, c, d])
+        )
+
+
+class TestParticleLifetimes(unittest.TestCase):
+    def test_particles_expire_after_lifetime(self):
+        for dense in (False, True):
+            with self.subTest(dense=dense):
+                ps = ParticleSystem(max_particles=4, dense=dense)
+                short = ps.add_particle(0, 0, 1, 0, lifetime=1.0)
+                immortal = ps.add_particle(0, 0, 1, 0)
+                ps.update(0.6)
+                self.assertIsNotNone(ps.get_particle_data(short))
+                ps.update(0.6)
+                self.assertIsNone(ps.get_particle_data(short))
+                self.assertEqual(ps.num_active_particles, 1)
+                self.assertAlmostEqual(ps.get_particle_data(immortal)["pos_x"], 1.2)
+
+    def test_add_particles_in_bulk(self):
+        ps = ParticleSystem(max_particles=3)
+        added = ps.add_particles([1, 2, 3, 4], [0] * 4, [0] * 4, [0] * 4)
+        self.assertEqual(added, 3)
+        self.assertEqual(ps.num_active_particles, 3)
+        self.assertEqual(
+            [d["pos_x"] for d in ps.get_active_particles_data()], [1, 2, 3]
+        )
+
+    def test_emitter_spawns_at_rate(self):
+        ps = ParticleSystem(max_particles=100)
+        emitter = ParticleEmitter(
+            rate=10, pos_x=5, pos_y=5, vel_x=1, lifetime=0.5, seed=1
+        )
+        ps.add_emitter(emitter)
+        ps.add_emitter(emitter)
+        ps.update(0.25)  # 2.5 due: spawns 2, carries 0.5
+        self.assertEqual(ps.num_active_particles, 2)
+        ps.update(0.05)  # 3.0 due in total
+        self.assertEqual(ps.num_active_particles, 3)
+        for _ in range(20):
+            ps.update(0.1)
+        # Steady state: about rate * lifetime particles alive.
+        self.assertIn(ps.num_active_particles, (4, 5))
+
+        ps.remove_emitter(emitter)
+        ps.update(1.0)
+        self.assertEqual(ps.num_active_particles, 0)
+        with self.assertRaises(ValueError):
+            ParticleEmitter(rate=-1, pos_x=0, pos_y=0)
+
+
+class TestParticlePipeline(unittest.TestCase):
+    def test_gravity_drag_and_bounds(self):
+        ps = ParticleSystem(max_particles=2)
+        falling = ps.add_particle(0.0, 1.0, 2.0, 0.0)
+        ps.set_pipeline(
+            ParticlePipeline(
+                [
+                    BoundsConstraint(-10, 0, 10, 10, restitution=0.5),
+                    GravityForce(0.0, -5.0),
+                    GravityForce(0.0, -5.0),
+                    DragForce(0.0),
+                ]
+            )
+        )
+        ps.update(1.0)
+        data = ps.get_particle_data(falling)
+        self.assertAlmostEqual(data["pos_x"], 2.0)
+        # Fell to -9, was clamped to the floor and bounced at half speed.
+        self.assertAlmostEqual(data["pos_y"], 0.0)
+        self.assertAlmostEqual(data["vel_y"], 5.0)
+
+        ps.set_pipeline(ParticlePipeline([DragForce(math.log(2))]))
+        ps.update(1.0)
+        self.assertAlmostEqual(ps.get_particle_data(falling)["vel_x"], 1.0)
+
+        ps.set_pipeline(None)
+        ps.update(1.0)
+        self.assertAlmostEqual(ps.get_particle_data(falling)["pos_x"], 4.0)
+
+    def test_attractor_pulls_towards_point(self):
+        ps = ParticleSystem(max_particles=1)
+        p = ps.add_particle(10.0, 0.0, 0.0, 0.0)
+        ps.set_pipeline(ParticlePipeline([AttractorForce(0.0, 0.0, strength=100.0)]))
+        ps.update(0.1)
+        self.assertLess(ps.get_particle_data(p)["vel_x"], 0.0)
+        self.assertAlmostEqual(ps.get_particle_data(p)["vel_y"], 0.0)
+
+    def test_invalid_stages(self):
+        with self.assertRaises(TypeError):
+            ParticlePipeline([object()])
+        with self.assertRaises(ValueError):
+            BoundsConstraint(1, 0, 0, 1)
+        with self.assertRaises(ValueError):
+            DragForce(-1.0)
+        with self.assertRaises(ValueError):
+            AttractorForce(0, 0, 1.0, softening=0.0)
+
+
+class VectorizedParticleSystemTests:
+    """Backend-independent tests, run once per storage backend."""
+
+    use_numpy = False
+
+    def make_system(self, max_particles, dense=False):
+        return VectorizedParticleSystem(
+            max_particles, use_numpy=self.use_numpy, dense=dense
+        )
+
+    def test_initialization(self):
+        ps = self.make_system(100)
+        self.assertEqual(ps.use_numpy, self.use_numpy)
+        self.assertEqual(len(ps.positions_x), 100)
+        self.assertFalse(any(ps.active))
+        with self.assertRaises(ValueError):
+            self.make_system(0)
+
+    def test_add_update_and_get(self):
+        ps = self.make_system(2)
+        p0 = ps.add_particle(1.0, 10.0, 1.0, 0.5)
+        p1 = ps.add_particle(5.0, 20.0, -0.5, 1.0)
+        self.assertEqual((p0, p1), (0, 1))
+        self.assertIsNone(ps.add_particle(0, 0, 0, 0))
+
+        ps.update(2.0)
+        self.assertEqual(
+            ps.get_particle_data(p0),
+            {"pos_x": 3.0, "pos_y": 11.0, "vel_x": 1.0, "vel_y": 0.5},
+        )
+        data1 = ps.get_particle_data(p1)
+        self.assertAlmostEqual(data1["pos_x"], 4.0)
+        self.assertAlmostEqual(data1["pos_y"], 22.0)
+        self.assertIsInstance(data1["pos_x"], float)
+
+    def test_removed_particles_are_not_updated(self):
+        ps = self.make_system(3)
+        p0 = ps.add_particle(1, 1, 1, 1)
+        p1 = ps.add_particle(2, 2, 1, 1)
+        ps.remove_particle(p1)
+        ps.remove_particle(p1)
+        ps.remove_particle(99)
+        self.assertEqual(ps.num_active_particles, 1)
+
+        ps.update(dt=1.0)
+        self.assertEqual(ps.get_particle_data(p0)["pos_x"], 2)
+        self.assertIsNone(ps.get_particle_data(p1))
+        self.assertEqual(ps.positions_x[p1], 2)
+
+        self.assertEqual(ps.add_particle(3, 3, 3, 3), p1)
+        self.assertEqual(
+            [d["id"] for d in ps.get_active_particles_data()], [p0, p1]
+        )
+
+    def test_bulk_add_and_expiry(self):
+        for dense in (False, True):
+            with self.subTest(dense=dense):
+                ps = self.make_system(6, dense=dense)
+                first = ps.add_particle(0, 0, 0, 0, lifetime=10.0)
+                added = ps.add_particles(
+                    [1.0, 2.0, 3.0, 4.0],
+                    [0.0] * 4,
+                    [1.0] * 4,
+                    [0.0] * 4,
+                    lifetime=[0.5, 2.0, 0.5, 2.0],
+                )
+                self.assertEqual(added, 4)
+                self.assertEqual(ps.num_active_particles, 5)
+
+                ps.update(1.0)
+                self.assertEqual(ps.num_active_particles, 3)
+                survivors = {d["id"]: d["pos_x"] for d in ps.get_active_particles_data()}
+                self.assertEqual(survivors, {first: 0.0, 2: 3.0, 4: 5.0})
+                for id_ in survivors:
+                    self.assertIs(type(id_), int)
+
+                # Freed IDs are handed out again.
+                self.assertEqual(ps.add_particles([9.0] * 3, [0.0] * 3, [0.0] * 3, [0.0] * 3), 3)
+                self.assertEqual(ps.num_active_particles, 6)
+                self.assertEqual(
+                    sorted(d["id"] for d in ps.get_active_particles_data()),
+                    list(range(6)),
+                )
+                ps.update(1.5)
+                self.assertEqual(
+                    sorted(d["id"] for d in ps.get_active_particles_data()),
+                    [0, 1, 3, 5],
+                )
+
+    def test_sparse_mode_reuses_lowest_free_slots(self):
+        ps = self.make_system(6)
+        ps.add_particles([0.0] * 6, [0.0] * 6, [0.0] * 6, [0.0] * 6, lifetime=[9, 1, 9, 1, 9, 9])
+        ps.remove_particle(4)
+        ps.update(1.0)  # Expires 1 and 3
+        self.assertEqual(ps.add_particle(0, 0, 0, 0), 1)
+        self.assertEqual(ps.add_particles([0.0] * 2, [0.0] * 2, [0.0] * 2, [0.0] * 2), 2)
+        self.assertEqual(
+            sorted(d["id"] for d in ps.get_active_particles_data()), list(range(6))
+        )
+        ps.remove_particle(5)
+        ps.remove_particle(2)
+        self.assertEqual(ps.add_particle(0, 0, 0, 0), 2)
+
+    def test_emitter_churn(self):
+        ps = self.make_system(2000, dense=True)
+        ps.add_emitter(
+            ParticleEmitter(rate=1000, pos_x=0, pos_y=0, velocity_spread=1.0, lifetime=0.5)
+        )
+        for _ in range(60):
+            ps.update(1 / 60)
+        self.assertAlmostEqual(ps.num_active_particles, 500, delta=20)
+
+    def test_buffer_views_alias_particle_state(self):
+        ps = self.make_system(4, dense=True)
+        a = ps.add_particle(1.0, 2.0, 1.0, 0.0)
+        b = ps.add_particle(3.0, 4.0, 1.0, 0.0)
+        ps.remove_particle(a)
+
+        views = ps.get_buffer_views()
+        self.assertEqual(len(views["pos_x"]), 1)
+        self.assertEqual(views["pos_x"].format, "d")
+        self.assertEqual(views["id"].tolist(), [b])
+        self.assertEqual(views["pos_y"].tolist(), [4.0])
+        self.assertTrue(all(views["active"].tolist()))
+
+        ps.update(1.0)
+        self.assertEqual(views["pos_x"].tolist(), [4.0], "Views see updates")
+
+        sparse = self.make_system(3)
+        sparse.add_particle(1.0, 0.0, 0.0, 0.0)
+        sparse_views = sparse.get_buffer_views()
+        self.assertNotIn("id", sparse_views)
+        self.assertEqual(len(sparse_views["pos_x"]), 3)
+        self.assertEqual([bool(v) for v in sparse_views["active"].tolist()], [True, False, False])
+
+    def test_pipeline_matches_loop_implementation(self):
+        pipeline = ParticlePipeline(
+            [
+                GravityForce(0.5, -9.81),
+                DragForce(0.3),
+                AttractorForce(5.0, 5.0, strength=50.0),
+                BoundsConstraint(-20, -20, 20, 20, restitution=0.8),
+            ]
+        )
+        for dense in (False, True):
+            with self.subTest(dense=dense):
+                reference = ParticleSystem(40, dense=dense)
+                ps = self.make_system(40, dense=dense)
+                for system in (reference, ps):
+                    for i in range(40):
+                        system.add_particle(i - 20.0, 19.0 - i, (i % 5) - 2.0, 3.0)
+                    for i in range(0, 40, 4):
+                        system.remove_particle(i)
+                    system.set_pipeline(pipeline)
+                    for _ in range(30):
+                        system.update(1 / 30)
+
+                expected = reference.get_active_particles_data()
+                actual = ps.get_active_particles_data()
+                self.assertEqual([d["id"] for d in actual], [d["id"] for d in expected])
+                for exp, act in zip(expected, actual):
+                    for key in ("pos_x", "pos_y", "vel_x", "vel_y"):
+                        self.assertAlmostEqual(exp[key], act[key])
+                if not dense:
+                    self.assertEqual(ps.velocities_y[0], 0.0)
+
+    def test_matches_loop_implementation(self):
+        for dense in (False, True):
+            with self.subTest(dense=dense):
+                self._check_matches_loop_implementation(dense)
+
+    def _check_matches_loop_implementation(self, dense):
+        reference = ParticleSystem(50)
+        ps = self.make_system(50, dense=dense)
+        for i in range(50):
+            args = (i * 0.5, -i * 0.25, (i % 7) - 3.0, (i % 5) * 0.1)
+            reference.add_particle(*args)
+            ps.add_particle(*args)
+        for i in range(0, 50, 3):
+            reference.remove_particle(i)
+            ps.remove_particle(i)
+        for _ in range(10):
+            reference.update(1 / 60)
+            ps.update(1 / 60)
+
+        expected = reference.get_active_particles_data()
+        actual = sorted(ps.get_active_particles_data(), key=lambda d: d["id"])
+        self.assertEqual(len(actual), len(expected))
+        for exp, act in zip(expected, actual):
+            self.assertEqual(exp["id"], act["id"])
+            self.assertAlmostEqual(exp["pos_x"], act["pos_x"])
+            self.assertAlmostEqual(exp["pos_y"], act["pos_y"])
+
+
+class TestVectorizedParticleSystemArray(
+    VectorizedParticleSystemTests, unittest.TestCase
+):
+    use_numpy = False
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestVectorizedParticleSystemNumpy(
+    VectorizedParticleSystemTests, unittest.TestCase
+):
+    use_numpy = True
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestParallelParticleSystem(unittest.TestCase):
+    def test_matches_vectorized_update(self):
+        for dense in (False, True):
+            with self.subTest(dense=dense):
+                reference = VectorizedParticleSystem(101, dense=dense)
+                with ParallelParticleSystem(
+                    101, num_workers=3, dense=dense, min_parallel_particles=0
+                ) as ps:
+                    for system in (reference, ps):
+                        system.add_particles(
+                            [float(i) for i in range(101)],
+                            [0.0] * 101,
+                            [i * 0.5 for i in range(101)],
+                            [1.0] * 101,
+                            lifetime=[1.0 + (i % 3) for i in range(101)],
+                        )
+                        system.remove_particle(7)
+                        for _ in range(5):
+                            system.update(0.25)
+                    self.assertEqual(
+                        ps.get_active_particles_data(),
+                        reference.get_active_particles_data(),
+                    )
+
+    def test_workers_run_the_pipeline(self):
+        for dense in (False, True):
+            with self.subTest(dense=dense):
+                reference = VectorizedParticleSystem(50, dense=dense)
+                with ParallelParticleSystem(
+                    50, num_workers=2, dense=dense, min_parallel_particles=0
+                ) as ps:
+                    attractors = []
+                    for system in (reference, ps):
+                        attractor = AttractorForce(5.0, 5.0, strength=20.0)
+                        attractors.append(attractor)
+                        system.set_pipeline(
+                            ParticlePipeline(
+                                [
+                                    GravityForce(0.0, -9.81),
+                                    DragForce(0.1),
+                                    attractor,
+                                    BoundsConstraint(0, 0, 10, 10, restitution=0.5),
+                                ]
+                            )
+                        )
+                        system.add_particles(
+                            [i * 0.2 for i in range(40)],
+                            [10.0 - i * 0.2 for i in range(40)],
+                            [1.0] * 40,
+                            [0.0] * 40,
+                        )
+                        system.remove_particle(3)
+                    for step in range(10):
+                        for attractor in attractors:
+                            attractor.x = step  # Stage changes take effect
+                        reference.update(0.1)
+                        # The pipeline must run in the workers, not here.
+                        with mock.patch.object(
+                            ParticlePipeline, "_apply_numpy", side_effect=AssertionError
+                        ):
+                            ps.update(0.1)
+                    expected = reference.get_active_particles_data()
+                    actual = ps.get_active_particles_data()
+                    self.assertEqual(len(actual), len(expected))
+                    for got, want in zip(actual, expected):
+                        self.assertEqual(got["id"], want["id"])
+                        for key in ("pos_x", "pos_y", "vel_x", "vel_y"):
+                            self.assertAlmostEqual(got[key], want[key])
+                    if not dense:
+                        self.assertEqual(ps.get_particle_data(3), None)
+                        self.assertEqual(ps.velocities_y[3], 0.0)
+
+    def test_columns_map_to_shared_rows_by_name(self):
+        with ParallelParticleSystem(4, num_workers=1) as ps:
+            for row, name in enumerate(_SHARED_COLUMNS):
+                self.assertTrue(np.shares_memory(getattr(ps, name), ps._shared[row]))
+
+    def test_close(self):
+        ps = ParallelParticleSystem(10, num_workers=1, min_parallel_particles=0)
+        ps.add_particle(0, 0, 1, 1)
+        ps.close()
+        ps.close()
+        with self.assertRaises(RuntimeError):
+            ps.update(1.0)
+        with self.assertRaises(ValueError):
+            ParallelParticleSystem(10, num_workers=0)
+
+
+class SoAStoreTests:
+    """Backend-independent SoAStore tests, run once per storage backend."""
+
+    use_numpy = False
+
+    def make_store(self, capacity=8):
+        return SoAStore(
+            {"x": "d", "y": "d", "hp": "i"}, capacity, use_numpy=self.use_numpy
+        )
+
+    def test_invalid_schema(self):
+        with self.assertRaises(ValueError):
+            SoAStore({}, 4, use_numpy=self.use_numpy)
+        for typecode in ("z", "fd", "u", 5):
+            with self.assertRaisesRegex(ValueError, "Unsupported typecode"):
+                SoAStore({"x": typecode}, 4, use_numpy=self.use_numpy)
+        with self.assertRaises(ValueError):
+            SoAStore({"x": "d"}, 0, use_numpy=self.use_numpy)
+
+    def test_add_get_set(self):
+        store = self.make_store()
+        self.assertEqual(store.field_names, ["x", "y", "hp"])
+        a = store.add(x=1.5, hp=10)
+        self.assertEqual(store.get(a), {"x": 1.5, "y": 0.0, "hp": 10})
+        store.set(a, y=2.0, hp=9)
+        self.assertEqual(store.get(a), {"x": 1.5, "y": 2.0, "hp": 9})
+        self.assertIn(a, store)
+        self.assertEqual(len(store), 1)
+        with self.assertRaises(ValueError):
+            store.add(z=1)
+        with self.assertRaises(KeyError):
+            store.set(5, x=1.0)
+        self.assertIsNone(store.get(5))
+
+    def test_add_when_full(self):
+        store = self.make_store(capacity=2)
+        self.assertIsNotNone(store.add())
+        self.assertIsNotNone(store.add())
+        self.assertIsNone(store.add())
+        self.assertEqual(store.add_many(x=[1.0, 2.0]), [])
+
+    def test_remove_swaps_last_record_into_hole(self):
+        store = self.make_store()
+        handles = [store.add(x=float(i), hp=i) for i in range(4)]
+        self.assertTrue(store.remove(handles[1]))
+        self.assertFalse(store.remove(handles[1]))
+        self.assertEqual(len(store), 3)
+        self.assertEqual(list(store.column("x")), [0.0, 3.0, 2.0])
+        self.assertEqual(list(store.ids()), [handles[0], handles[3], handles[2]])
+        self.assertEqual(store.index_of(handles[3]), 1)
+        self.assertEqual(store.get(handles[3])["hp"], 3)
+        self.assertEqual(store.add(x=9.0), handles[1])
+
+    def test_add_many(self):
+        store = self.make_store(capacity=5)
+        store.add(x=-1.0)
+        handles = store.add_many(x=[1.0, 2.0, 3.0, 4.0, 5.0], hp=[1, 2, 3, 4, 5])
+        self.assertEqual(len(handles), 4)
+        self.assertEqual(len(store), 5)
+        self.assertEqual(list(store.column("x")), [-1.0, 1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(list(store.column("y")), [0.0] * 5)
+        self.assertEqual(store.get(handles[2]), {"x": 3.0, "y": 0.0, "hp": 3})
+        with self.assertRaises(ValueError):
+            store.add_many(x=[1.0], y=[1.0, 2.0])
+
+    def test_remove_where_is_stable(self):
+        store = self.make_store()
+        handles = store.add_many(hp=[5, 0, 3, 0, 0, 7])
+        removed = store.remove_where([hp <= 0 for hp in store.column("hp")])
+        self.assertEqual(removed, 3)
+        self.assertEqual(list(store.column("hp")), [5, 3, 7])
+        self.assertEqual(list(store.ids()), [handles[0], handles[2], handles[5]])
+        self.assertNotIn(handles[1], store)
+        self.assertEqual(store.get(handles[5])["hp"], 7)
+        self.assertEqual(store.remove_where([False] * 3), 0)
+        with self.assertRaises(ValueError):
+            store.remove_where([True])
+        self.assertEqual(len(store.add_many(hp=[1] * 5)), 5)
+
+    def test_column_views_write_through(self):
+        store = self.make_store()
+        a = store.add(x=1.0)
+        store.add(x=2.0)
+        view = store.column("x")
+        self.assertEqual(len(view), 2)
+        view[0] = 10.0
+        self.assertEqual(store.get(a)["x"], 10.0)
+
+    def test_chunks(self):
+        store = self.make_store()
+        store.add_many(x=[float(i) for i in range(7)])
+        chunks = list(store.chunks(3))
+        self.assertEqual([len(chunk["x"]) for chunk in chunks], [3, 3, 1])
+        self.assertEqual(set(chunks[0]), {"x", "y", "hp", "id"})
+        for chunk in chunks:
+            for i in range(len(chunk["x"])):
+                chunk["x"][i] *= 2
+        self.assertEqual(list(store.column("x")), [2.0 * i for i in range(7)])
+        with self.assertRaises(ValueError):
+            next(store.chunks(0))
+
+
+class TestSoAStoreArray(SoAStoreTests, unittest.TestCase):
+    use_numpy = False
+
+
+@unittest.skipIf(np is None, "NumPy is not installed.")
+class TestSoAStoreNumpy(SoAStoreTests, unittest.TestCase):
+    use_numpy = True
+
+
 if __name__ == "__main__":
     unittest.main()
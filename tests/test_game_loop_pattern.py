@@ -1,8 +1,18 @@
+import asyncio
 import unittest
 import time
 from unittest.mock import MagicMock
 
-from gamepp.patterns.game_loop import GameLoop
+from array import array
+
+from gamepp.patterns.game_loop import (
+    AsyncGameLoop,
+    FrameProfiler,
+    GameLoop,
+    ScheduledSystem,
+    StateSnapshot,
+    np,
+)
 
 
 class TestGameLoop(unittest.TestCase):
@@ -136,5 +146,541 @@ class TestGameLoop(unittest.TestCase):
         self.assertFalse(local_loop.is_running)
 
 
+class TestStateSnapshot(unittest.TestCase):
+    def test_list_buffer(self):
+        state = [0.0, 10.0]
+        snapshot = StateSnapshot(state)
+        snapshot.capture()
+        state[0], state[1] = 2.0, 20.0
+        self.assertEqual(snapshot.interpolate(0.0), [0.0, 10.0])
+        self.assertEqual(snapshot.interpolate(0.5), [1.0, 15.0])
+        self.assertEqual(snapshot.interpolate(1.0), [2.0, 20.0])
+
+    def test_array_buffer(self):
+        state = array("d", [1.0, 2.0])
+        snapshot = StateSnapshot(state)
+        state[0] = 3.0
+        snapshot.capture()
+        state[0] = 5.0
+        self.assertEqual(list(snapshot.interpolate(0.25)), [3.5, 2.0])
+
+    def test_array_buffer_can_grow(self):
+        state = array("d", [1.0, 2.0])
+        snapshot = StateSnapshot(state)
+        state.append(3.0)  # The snapshot must not hold the buffer exported.
+        snapshot.capture()
+        state[2] = 5.0
+        self.assertEqual(list(snapshot.interpolate(0.5)), [1.0, 2.0, 4.0])
+        state.extend([0.0])  # Nor does interpolating.
+        del state[:1]
+        self.assertEqual(len(state), 3)
+
+    @unittest.skipIf(np is None, "NumPy is not installed.")
+    def test_numpy_buffer_reuses_output(self):
+        state = np.array([0.0, 4.0])
+        snapshot = StateSnapshot(state)
+        state += 4.0
+        first = snapshot.interpolate(0.5)
+        np.testing.assert_allclose(first, [2.0, 6.0])
+        self.assertIs(snapshot.interpolate(0.25), first)
+        np.testing.assert_allclose(first, [1.0, 5.0])
+        np.testing.assert_allclose(state, [4.0, 8.0])
+
+    def test_loop_snapshots_before_each_update(self):
+        loop = GameLoop(fixed_time_step=0.000001)
+        position = [0.0]
+        loop.register_state("position", position)
+        rendered = []
+
+        def update(dt):
+            position[0] += 1.0
+
+        def render(alpha):
+            rendered.append((loop.interpolate("position", alpha)[0], position[0]))
+            if position[0] >= 3:
+                loop.stop()
+
+        loop.set_update_handler(update)
+        loop.set_render_handler(render)
+        loop.start()
+
+        for interpolated, current in rendered:
+            if current > 0:
+                self.assertGreaterEqual(interpolated, current - 1.0)
+                self.assertLessEqual(interpolated, current)
+        self.assertEqual(loop.interpolate("position", 0.0), [position[0] - 1.0])
+        loop.unregister_state("position")
+        with self.assertRaises(KeyError):
+            loop.interpolate("position", 0.5)
+
+
+class TestGameLoopCatchUp(unittest.TestCase):
+    def make_loop(self, **kwargs):
+        loop = GameLoop(fixed_time_step=0.1, **kwargs)
+        self.updates = 0
+
+        def update(dt):
+            self.updates += 1
+
+        loop.set_update_handler(update)
+        return loop
+
+    def test_unbounded_by_default(self):
+        loop = self.make_loop()
+        self.assertEqual(loop._advance(1.05), 10)
+        self.assertEqual(loop.dropped_time, 0.0)
+        self.assertEqual(loop.capped_frames, 0)
+
+    def test_max_updates_per_frame_drops_backlog(self):
+        loop = self.make_loop(max_updates_per_frame=3)
+        self.assertEqual(loop._advance(1.05), 3)
+        self.assertEqual(self.updates, 3)
+        self.assertEqual(loop.capped_frames, 1)
+        self.assertLess(loop._lag, 0.1)
+        self.assertAlmostEqual(loop.dropped_time + loop._lag, 0.75)
+        self.assertEqual(loop.dilation, 1.0)
+
+    def test_max_lag_clamps_stalls(self):
+        loop = self.make_loop(max_lag=0.25)
+        self.assertEqual(loop._advance(5.0), 2)
+        self.assertAlmostEqual(loop.dropped_time, 4.75)
+        self.assertEqual(loop.capped_frames, 0)
+
+    def test_dilate_slows_clock_then_recovers(self):
+        loop = self.make_loop(max_updates_per_frame=2, catch_up="dilate")
+        loop._advance(1.0)
+        self.assertEqual(self.updates, 2)
+        self.assertEqual(loop.dropped_time, 0.0)
+        self.assertAlmostEqual(loop.dilated_time, 0.8)
+        self.assertAlmostEqual(loop.dilation, 0.2)
+        # The next second of real time only advances the game by 0.2s.
+        self.assertEqual(loop._advance(1.0), 2)
+        self.assertEqual(loop.capped_frames, 1)
+        self.assertAlmostEqual(loop.dilation, 0.25)
+
+    def test_dilation_is_bounded(self):
+        loop = self.make_loop(
+            max_updates_per_frame=1, catch_up="dilate", min_time_scale=0.5
+        )
+        loop._advance(10.0)
+        self.assertEqual(loop.dilation, 0.5)
+
+    def test_time_scale(self):
+        loop = self.make_loop()
+        loop.time_scale = 0.5
+        self.assertEqual(loop._advance(1.0), 5)
+
+    def test_invalid_arguments(self):
+        for kwargs in (
+            {"max_updates_per_frame": 0},
+            {"max_lag": 0},
+            {"catch_up": "skip"},
+            {"min_time_scale": 0},
+        ):
+            with self.assertRaises(ValueError):
+                GameLoop(**kwargs)
+
+    def test_slow_updates_do_not_spiral(self):
+        loop = GameLoop(fixed_time_step=0.001, max_updates_per_frame=2)
+        frames = 0
+
+        def slow_update(dt):
+            time.sleep(0.005)
+
+        def render(alpha):
+            nonlocal frames
+            frames += 1
+            if frames >= 5:
+                loop.stop()
+
+        loop.set_update_handler(slow_update)
+        loop.set_render_handler(render)
+        loop.start()
+        self.assertGreater(loop.capped_frames, 0)
+        self.assertGreater(loop.dropped_time, 0.0)
+
+
+class TestGameLoopPacing(unittest.TestCase):
+    def run_frames(self, loop, frames):
+        count = 0
+
+        def render(alpha):
+            nonlocal count
+            count += 1
+            if count >= frames:
+                loop.stop()
+
+        loop.set_render_handler(render)
+        loop.start()
+
+    def test_hybrid_pacing_hits_target_render_rate(self):
+        loop = GameLoop(
+            fixed_time_step=1 / 30, pacing="hybrid", target_render_rate=200
+        )
+        self.run_frames(loop, 21)
+        stats = loop.frame_time_stats()
+        self.assertEqual(stats["frames"], 20)
+        self.assertAlmostEqual(stats["target"], 0.005)
+        self.assertAlmostEqual(stats["mean"], 0.005, delta=0.002)
+        self.assertGreaterEqual(stats["max"], stats["min"])
+        self.assertIn("jitter", stats)
+        self.assertIn("mean_error", stats)
+
+    def test_hybrid_pacing_follows_fixed_updates(self):
+        loop = GameLoop(fixed_time_step=0.005, pacing="hybrid")
+        updates = []
+        loop.set_update_handler(updates.append)
+        self.run_frames(loop, 11)
+        self.assertGreaterEqual(len(updates), 8)
+        self.assertAlmostEqual(loop.frame_time_stats()["mean"], 0.005, delta=0.002)
+
+    def test_no_pacing(self):
+        loop = GameLoop(fixed_time_step=1.0, pacing="none")
+        start = time.perf_counter()
+        self.run_frames(loop, 100)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertNotIn("target", loop.frame_time_stats())
+
+    def test_frame_time_stats_window(self):
+        loop = GameLoop(frame_stats_window=3)
+        self.assertEqual(loop.frame_time_stats(), {"frames": 0})
+        for frame_time in (1.0, 2.0, 3.0, 5.0):
+            loop._record_frame_time(frame_time)
+        stats = loop.frame_time_stats()
+        self.assertEqual(stats["frames"], 3)
+        self.assertAlmostEqual(stats["mean"], 10.0 / 3)
+        self.assertEqual((stats["min"], stats["max"]), (2.0, 5.0))
+        self.assertAlmostEqual(stats["jitter"], (14.0 / 9) ** 0.5)
+        loop.reset_frame_time_stats()
+        self.assertEqual(loop.frame_time_stats()["frames"], 0)
+
+    def test_invalid_pacing_arguments(self):
+        for kwargs in (
+            {"pacing": "vsync"},
+            {"target_render_rate": 0},
+            {"spin_threshold": -1},
+            {"frame_stats_window": 0},
+        ):
+            with self.assertRaises(ValueError):
+                GameLoop(**kwargs)
+
+
+class TestGameLoopHeadless(unittest.TestCase):
+    def setUp(self):
+        self.loop = GameLoop(fixed_time_step=0.1)
+        self.calls = []
+        self.loop.set_process_input_handler(lambda: self.calls.append("input"))
+        self.loop.set_update_handler(lambda dt: self.calls.append(dt))
+        self.loop.set_render_handler(lambda alpha: self.calls.append(("render", alpha)))
+
+    def test_step(self):
+        self.assertEqual(self.loop.step(2), 2)
+        self.assertEqual(self.calls, ["input", 0.1, "input", 0.1])
+        self.assertEqual(self.loop.update_count, 2)
+        self.assertAlmostEqual(self.loop.sim_time, 0.2)
+        self.assertFalse(self.loop.is_running)
+
+    def test_step_with_render(self):
+        self.loop.step(1, render=True)
+        self.assertEqual(self.calls, ["input", 0.1, ("render", 0.0)])
+
+    def test_run_for_carries_partial_steps(self):
+        self.assertEqual(self.loop.run_for(0.25), 2)
+        self.assertEqual(self.loop.run_for(0.05), 1)
+        self.assertEqual(self.loop.run_for(1.0), 10)
+        self.assertEqual(self.loop.update_count, 13)
+        self.assertEqual(GameLoop(fixed_time_step=1 / 60).run_for(1.0), 60)
+
+    def test_runs_faster_than_real_time(self):
+        start = time.perf_counter()
+        self.loop.run_for(3600.0)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(self.loop.update_count, 36000)
+
+    def test_stop_ends_stepping_early(self):
+        def update(dt):
+            if self.loop.update_count == 2:
+                self.loop.stop()
+
+        self.loop.set_update_handler(update)
+        self.assertEqual(self.loop.step(10), 3)
+        self.assertEqual(self.loop.step(1), 1)
+
+    def test_stopped_run_for_keeps_unrun_steps(self):
+        def update(dt):
+            if self.loop.update_count == 2:
+                self.loop.stop()
+
+        self.loop.set_update_handler(update)
+        self.assertEqual(self.loop.run_for(1.05), 3)
+        self.assertAlmostEqual(self.loop.alpha, 7.5)
+        self.loop.set_update_handler(lambda dt: None)
+        self.assertEqual(self.loop.run_for(0.05), 8)
+        self.assertAlmostEqual(self.loop.sim_time, 1.1)
+        self.assertAlmostEqual(self.loop.alpha, 0.0)
+
+    def test_snapshots_are_captured(self):
+        position = [0.0]
+        self.loop.register_state("position", position)
+        self.loop.set_update_handler(lambda dt: position.__setitem__(0, position[0] + 1))
+        self.loop.step(3)
+        self.assertEqual(self.loop.interpolate("position", 0.5), [2.5])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.loop.step(-1)
+        with self.assertRaises(ValueError):
+            self.loop.run_for(-1.0)
+
+        def nested_step():
+            with self.assertRaises(RuntimeError):
+                self.loop.step(1)
+            self.loop.stop()
+
+        self.loop.set_process_input_handler(nested_step)
+        self.loop.start()
+
+
+class TestGameLoopSystems(unittest.TestCase):
+    def setUp(self):
+        self.loop = GameLoop(fixed_time_step=1 / 120)
+        self.log = []
+        self.loop.set_update_handler(lambda dt: self.log.append("physics"))
+
+    def add(self, name, rate, **kwargs):
+        return self.loop.add_system(lambda dt: self.log.append(name), rate, name=name, **kwargs)
+
+    def test_systems_run_at_their_own_rates(self):
+        ai = self.add("ai", 10)
+        net = self.add("net", 20)
+        self.loop.run_for(1.0)
+        self.assertEqual(self.log.count("physics"), 120)
+        self.assertEqual(ai.update_count, 10)
+        self.assertEqual(net.update_count, 20)
+        self.assertAlmostEqual(ai.sim_time, 1.0)
+        self.assertEqual(ai.time_step, 0.1)
+
+    def test_deterministic_order(self):
+        self.add("ai", 10)
+        self.add("net", 20, priority=1)
+        self.add("audio", 20, priority=1)
+        self.loop.run_for(0.1)
+        # Steps due at the same game time run by priority, then registration order.
+        self.assertEqual(self.log[-4:], ["physics", "net", "audio", "ai"])
+        self.assertEqual([s.name for s in self.loop.systems], ["net", "audio", "ai"])
+
+    def test_frames_interleave_systems_by_game_time(self):
+        fast = self.add("fast", 40)
+        self.add("slow", 20, priority=1)
+        self.loop._advance(0.1)  # One real-time frame covering 0.1 game seconds
+        systems = [name for name in self.log if name != "physics"]
+        self.assertEqual(systems, ["fast", "slow", "fast", "fast", "slow", "fast"])
+        self.assertEqual(fast.update_count, 4)
+
+    def test_follows_time_scale_and_carries_partial_steps(self):
+        ai = self.add("ai", 10)
+        self.loop.time_scale = 0.5
+        self.loop._advance(0.15)
+        self.assertEqual(ai.update_count, 0)
+        self.loop._advance(0.05)
+        self.assertEqual(ai.update_count, 1)
+
+    def test_max_steps_per_frame_drops_backlog(self):
+        ai = self.add("ai", 10, max_steps_per_frame=2)
+        self.loop._advance(0.55)
+        self.assertEqual(ai.update_count, 2)
+        self.assertAlmostEqual(ai.dropped_time, 0.3)
+        self.assertAlmostEqual(ai.accumulator, 0.05)
+
+    def test_remove_system_mid_frame(self):
+        ai = self.add("ai", 10)
+        self.loop.add_system(lambda dt: self.loop.remove_system(ai), 40, priority=1)
+        self.loop.run_for(1.0)
+        self.assertEqual(ai.update_count, 0)
+        self.assertNotIn(ai, self.loop.systems)
+        self.loop.remove_system(ai)  # No-op
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.loop.add_system(print, 0)
+        with self.assertRaises(ValueError):
+            ScheduledSystem(print, 10, max_steps_per_frame=0)
+
+
+class TestAsyncGameLoop(unittest.IsolatedAsyncioTestCase):
+    async def test_scheduled_systems(self):
+        loop = AsyncGameLoop(fixed_time_step=0.1)
+        ticks = []
+
+        async def ai(dt):
+            ticks.append(dt)
+
+        loop.add_system(ai, 5)
+        self.assertEqual(await loop.run_for_async(1.0), 10)
+        self.assertEqual(ticks, [0.2] * 5)
+
+    async def test_runs_sync_and_async_handlers(self):
+        loop = AsyncGameLoop(fixed_time_step=0.002)
+        calls = []
+
+        async def update(dt):
+            calls.append("update")
+            await asyncio.sleep(0)
+
+        def render(alpha):
+            calls.append("render")
+            self.assertTrue(0.0 <= alpha < 1.0)
+            if calls.count("update") >= 3:
+                loop.stop()
+
+        loop.set_process_input_handler(lambda: calls.append("input"))
+        loop.set_update_handler(update)
+        loop.set_render_handler(render)
+        await loop.run()
+
+        self.assertFalse(loop.is_running)
+        self.assertGreaterEqual(loop.update_count, 3)
+        self.assertEqual(calls[0], "input")
+        self.assertEqual(calls[-1], "render")
+
+    async def test_other_tasks_run_between_frames(self):
+        loop = AsyncGameLoop(fixed_time_step=0.005, pacing="none")
+        ticks = 0
+
+        async def server():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        def render(alpha):
+            if ticks >= 10:
+                loop.stop()
+
+        loop.set_render_handler(render)
+        task = asyncio.create_task(server())
+        try:
+            await asyncio.wait_for(loop.run(), timeout=5)
+        finally:
+            task.cancel()
+        self.assertGreaterEqual(ticks, 10)
+
+    async def test_catch_up_limits_apply(self):
+        loop = AsyncGameLoop(fixed_time_step=0.001, max_updates_per_frame=1)
+        frames = 0
+
+        async def slow_update(dt):
+            await asyncio.sleep(0.005)
+
+        def render(alpha):
+            nonlocal frames
+            frames += 1
+            if frames >= 5:
+                loop.stop()
+
+        loop.set_update_handler(slow_update)
+        loop.set_render_handler(render)
+        await loop.run()
+        self.assertGreater(loop.capped_frames, 0)
+        self.assertGreater(loop.dropped_time, 0.0)
+
+    async def test_step_async_and_run_for_async(self):
+        loop = AsyncGameLoop(fixed_time_step=0.1)
+        updates = []
+
+        async def update(dt):
+            updates.append(dt)
+
+        loop.set_update_handler(update)
+        self.assertEqual(await loop.step_async(2), 2)
+        self.assertEqual(await loop.run_for_async(0.25), 2)
+        self.assertEqual(await loop.run_for_async(0.05), 1)
+        self.assertEqual(updates, [0.1] * 5)
+        self.assertAlmostEqual(loop.sim_time, 0.5)
+
+        loop.set_process_input_handler(loop.stop)
+        self.assertEqual(await loop.run_for_async(0.3), 1)
+        loop.set_process_input_handler(lambda: None)
+        self.assertEqual(await loop.run_for_async(0.0), 2)
+        self.assertAlmostEqual(loop.sim_time, 0.8)
+
+    def test_step_and_run_for_stay_synchronous(self):
+        loop = AsyncGameLoop(fixed_time_step=0.1)
+        updates = []
+        loop.set_update_handler(updates.append)
+        self.assertEqual(loop.step(2), 2)
+        self.assertEqual(loop.run_for(0.3), 3)
+        self.assertEqual(updates, [0.1] * 5)
+
+    def test_start_runs_its_own_event_loop(self):
+        loop = AsyncGameLoop()
+        loop.set_process_input_handler(loop.stop)
+        loop.start()
+        self.assertFalse(loop.is_running)
+
+
+class TestFrameProfiler(unittest.TestCase):
+    def test_summary_percentiles(self):
+        profiler = FrameProfiler(capacity=100)
+        self.assertEqual(profiler.summary(), {"frames": 0})
+        for i in range(1, 101):
+            profiler.record(0.001, i / 1000, 0.002, 0.0, i % 3)
+        summary = profiler.summary()
+        self.assertEqual(summary["frames"], 100)
+        self.assertAlmostEqual(summary["update"]["p50"], 0.050)
+        self.assertAlmostEqual(summary["update"]["p95"], 0.095)
+        self.assertAlmostEqual(summary["update"]["p99"], 0.099)
+        self.assertAlmostEqual(summary["update"]["max"], 0.100)
+        self.assertAlmostEqual(summary["input"]["mean"], 0.001)
+        self.assertAlmostEqual(summary["frame"]["max"], 0.103)
+        self.assertEqual(summary["updates_per_frame"]["max"], 2)
+
+    def test_ring_keeps_latest_frames_and_exports(self):
+        exported = []
+        profiler = FrameProfiler(capacity=3, export_hook=exported.append)
+        for i in range(7):
+            profiler.record(i, 0.0, 0.0, 0.0, i)
+        self.assertEqual(len(profiler), 3)
+        self.assertEqual(profiler.total_frames, 7)
+        self.assertEqual([sample[4] for sample in profiler.samples()], [4, 5, 6])
+        self.assertEqual(len(exported), 2)
+        self.assertEqual([sample[4] for sample in exported[1]], [3, 4, 5])
+        profiler.reset()
+        self.assertEqual(len(profiler), 0)
+        with self.assertRaises(ValueError):
+            FrameProfiler(capacity=0)
+
+    def test_loop_records_phases(self):
+        loop = GameLoop(fixed_time_step=0.002)
+        self.assertIsNone(loop.profiler)
+        profiler = loop.enable_profiling(capacity=64)
+        frames = 0
+
+        def render(alpha):
+            nonlocal frames
+            frames += 1
+            time.sleep(0.001)
+            if frames >= 10:
+                loop.stop()
+
+        loop.set_render_handler(render)
+        loop.start()
+        summary = profiler.summary()
+        self.assertEqual(summary["frames"], 10)
+        self.assertGreaterEqual(summary["render"]["p50"], 0.001)
+        self.assertGreater(summary["updates_per_frame"]["max"], 0)
+        for phase in ("input", "update", "sleep", "frame"):
+            self.assertGreaterEqual(summary[phase]["p99"], summary[phase]["p50"])
+        loop.disable_profiling()
+        self.assertIsNone(loop.profiler)
+
+    def test_async_loop_records_phases(self):
+        loop = AsyncGameLoop(fixed_time_step=0.002)
+        profiler = loop.enable_profiling()
+        loop.set_render_handler(lambda alpha: loop.stop() if len(profiler) >= 4 else None)
+        loop.start()
+        self.assertEqual(len(profiler), 5)
+
+
 if __name__ == "__main__":
     unittest.main()
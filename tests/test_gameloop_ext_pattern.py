@@ -6,6 +6,8 @@ import unittest
 import time
 import io
 import sys
+import ctypes
+import threading
 
 # Attempt to import the extension; skip tests if not available
 try:
@@ -14,6 +16,22 @@ except ImportError:
     gameloop_ext = None
 
 
+UPDATE_FUNC = ctypes.CFUNCTYPE(None, ctypes.c_double, ctypes.c_void_p)
+UPDATE_BATCH_FUNC = ctypes.CFUNCTYPE(None, ctypes.c_double, ctypes.c_int, ctypes.c_void_p)
+
+
+def make_capsule(func, name, user_data=None):
+    """Wraps a ctypes function pointer in a named capsule, as a C library would."""
+    capsule_new = ctypes.pythonapi.PyCapsule_New
+    capsule_new.restype = ctypes.py_object
+    capsule_new.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
+    set_context = ctypes.pythonapi.PyCapsule_SetContext
+    set_context.argtypes = [ctypes.py_object, ctypes.c_void_p]
+    capsule = capsule_new(ctypes.cast(func, ctypes.c_void_p), name, None)
+    set_context(capsule, user_data)
+    return capsule
+
+
 @unittest.skipIf(
     gameloop_ext is None,
     "gameloop_ext C extension not built or not found in PYTHONPATH.",
@@ -244,6 +262,338 @@ class TestGameLoopExtension(unittest.TestCase):
             loop.is_running, "Loop should be stopped by the update handler."
         )
 
+    def test_catch_up_limits(self):
+        """Slow updates are capped per frame and the backlog is dropped."""
+        loop = gameloop_ext.GameLoop(
+            fixed_time_step=0.001, max_updates_per_frame=2, max_lag=0.5
+        )
+        self.assertEqual(loop.dropped_time, 0.0)
+        self.assertEqual(loop.capped_frames, 0)
+        frames = 0
+
+        def slow_update(dt):
+            time.sleep(0.005)
+
+        def render(alpha):
+            nonlocal frames
+            frames += 1
+            if frames >= 5:
+                loop.stop()
+
+        loop.set_update_handler(slow_update)
+        loop.set_render_handler(render)
+        loop.start()
+        self.assertGreater(loop.capped_frames, 0)
+        self.assertGreater(loop.dropped_time, 0.0)
+        self.assertEqual(loop.dilated_time, 0.0)
+        self.assertEqual(loop.dilation, 1.0)
+
+    def test_catch_up_dilate(self):
+        """In 'dilate' mode the backlog slows down the game clock instead."""
+        loop = gameloop_ext.GameLoop(
+            fixed_time_step=0.001,
+            max_updates_per_frame=1,
+            catch_up="dilate",
+            min_time_scale=0.25,
+        )
+        updates = 0
+
+        def slow_update(dt):
+            nonlocal updates
+            updates += 1
+            time.sleep(0.005)
+            if updates >= 5:
+                loop.stop()
+
+        loop.set_update_handler(slow_update)
+        loop.start()
+        self.assertGreater(loop.dilated_time, 0.0)
+        self.assertEqual(loop.dropped_time, 0.0)
+        self.assertGreaterEqual(loop.dilation, 0.25)
+        self.assertLess(loop.dilation, 1.0)
+
+    def test_catch_up_arguments(self):
+        """Invalid catch-up settings raise ValueError; time_scale is writable."""
+        for kwargs in (
+            {"max_updates_per_frame": 0},
+            {"max_lag": -1.0},
+            {"catch_up": "skip"},
+            {"min_time_scale": 2.0},
+        ):
+            with self.assertRaises(ValueError):
+                gameloop_ext.GameLoop(**kwargs)
+        loop = gameloop_ext.GameLoop()
+        self.assertEqual(loop.time_scale, 1.0)
+        loop.time_scale = 0.5
+        self.assertEqual(loop.time_scale, 0.5)
+
+    def test_headless_step_and_run_for(self):
+        """step/run_for run fixed updates on a virtual clock."""
+        loop = gameloop_ext.GameLoop(fixed_time_step=0.1)
+        calls = []
+        loop.set_process_input_handler(lambda: calls.append("input"))
+        loop.set_update_handler(calls.append)
+        loop.set_render_handler(lambda alpha: calls.append(("render", alpha)))
+
+        self.assertEqual(loop.step(), 1)
+        self.assertEqual(calls, ["input", 0.1])
+        self.assertEqual(loop.step(1, render=True), 1)
+        self.assertEqual(calls[2:], ["input", 0.1, ("render", 0.0)])
+        self.assertEqual(loop.run_for(0.25), 2)
+        self.assertEqual(loop.run_for(0.05), 1)
+        self.assertEqual(loop.update_count, 5)
+        self.assertAlmostEqual(loop.sim_time, 0.5)
+        self.assertFalse(loop.is_running)
+
+        start = time.perf_counter()
+        self.assertEqual(loop.run_for(3600.0), 36000)
+        self.assertLess(time.perf_counter() - start, 2.0)
+
+        with self.assertRaises(ValueError):
+            loop.step(-1)
+        with self.assertRaises(ValueError):
+            loop.run_for(-1.0)
+
+    def test_headless_stop(self):
+        """A handler calling stop() ends stepping early."""
+        loop = gameloop_ext.GameLoop(fixed_time_step=0.1)
+        loop.set_update_handler(lambda dt: loop.stop() if loop.update_count == 1 else None)
+        self.assertEqual(loop.step(10), 2)
+        # Steps run_for did not get to stay in the accumulator.
+        loop.set_update_handler(lambda dt: loop.stop())
+        self.assertEqual(loop.run_for(1.05), 1)
+        loop.set_update_handler(None)
+        self.assertEqual(loop.run_for(0.05), 10)
+        self.assertAlmostEqual(loop.sim_time, 1.3)
+
+    def test_profiling(self):
+        """Per-phase frame timings are recorded into a ring and summarized."""
+        loop = gameloop_ext.GameLoop(fixed_time_step=0.002)
+        self.assertEqual(loop.profile_summary(), {"frames": 0})
+        exported = []
+        loop.enable_profiling(capacity=4, export_hook=exported.append)
+        frames = 0
+
+        def render(alpha):
+            nonlocal frames
+            frames += 1
+            time.sleep(0.001)
+            if frames >= 10:
+                loop.stop()
+
+        loop.set_render_handler(render)
+        loop.start()
+
+        samples = loop.profile_samples()
+        self.assertEqual(len(samples), 4)
+        self.assertEqual(len(samples[0]), 5)
+        self.assertEqual(len(exported), 2)
+        self.assertEqual(len(exported[0]), 4)
+        summary = loop.profile_summary()
+        self.assertEqual(summary["frames"], 4)
+        self.assertGreaterEqual(summary["render"]["p50"], 0.001)
+        self.assertGreaterEqual(summary["frame"]["max"], summary["frame"]["p50"])
+        self.assertIn("updates_per_frame", summary)
+
+        loop.disable_profiling()
+        self.assertEqual(loop.profile_samples(), [])
+        with self.assertRaises(ValueError):
+            loop.enable_profiling(capacity=0)
+        with self.assertRaises(TypeError):
+            loop.enable_profiling(export_hook=1)
+
+
+    def test_hold_gil(self):
+        """hold_gil mode runs the same callbacks with the GIL held per frame."""
+        loop = gameloop_ext.GameLoop(fixed_time_step=0.1, hold_gil=True)
+        self.assertTrue(loop.hold_gil)
+        calls = []
+        loop.set_process_input_handler(lambda: calls.append("input"))
+        loop.set_update_handler(calls.append)
+        self.assertEqual(loop.step(2), 2)
+        self.assertEqual(calls, ["input", 0.1, "input", 0.1])
+
+        frames = 0
+
+        def render(alpha):
+            nonlocal frames
+            frames += 1
+            if frames >= 3:
+                loop.stop()
+
+        loop.set_render_handler(render)
+        loop.start()
+        self.assertEqual(frames, 3)
+        loop.hold_gil = False
+        self.assertFalse(loop.hold_gil)
+        self.assertFalse(gameloop_ext.GameLoop().hold_gil)
+
+    def test_batch_update_handler(self):
+        """A batch update handler gets every due update of a frame in one call."""
+        loop = gameloop_ext.GameLoop(fixed_time_step=0.001, max_updates_per_frame=5, hold_gil=True)
+        batches = []
+        loop.set_update_handler(lambda dt, n_steps: batches.append((dt, n_steps)), batch=True)
+
+        def render(alpha):
+            time.sleep(0.01)
+            if len(batches) >= 3:
+                loop.stop()
+
+        loop.set_render_handler(render)
+        loop.start()
+        self.assertGreaterEqual(len(batches), 3)
+        self.assertTrue(all(dt == 0.001 for dt, _ in batches))
+        self.assertTrue(all(1 <= n_steps <= 5 for _, n_steps in batches))
+        self.assertIn(5, [n_steps for _, n_steps in batches])
+        self.assertEqual(loop.update_count, sum(n for _, n in batches))
+
+        # Headless stepping runs one update per frame, so one step per call.
+        batches.clear()
+        self.assertEqual(loop.step(2), 2)
+        self.assertEqual(batches, [(0.001, 1), (0.001, 1)])
+
+
+    def test_native_capsule_handlers(self):
+        """Capsule-wrapped native handlers get the fixed dt and the capsule context."""
+        # The name must outlive the capsule, as it would for a static C string.
+        update_name = gameloop_ext.UPDATE_HANDLER_CAPSULE.encode()
+        batch_name = gameloop_ext.UPDATE_BATCH_HANDLER_CAPSULE.encode()
+        render_name = gameloop_ext.RENDER_HANDLER_CAPSULE.encode()
+        counter = ctypes.c_double(0.0)
+        calls = []
+
+        @UPDATE_FUNC
+        def native_update(dt, user_data):
+            ctypes.cast(user_data, ctypes.POINTER(ctypes.c_double))[0] += dt
+
+        @UPDATE_FUNC
+        def native_render(alpha, user_data):
+            calls.append(user_data)
+
+        @UPDATE_BATCH_FUNC
+        def native_batch(dt, n_steps, user_data):
+            calls.append((dt, n_steps))
+
+        loop = gameloop_ext.GameLoop(fixed_time_step=0.25)
+        loop.set_update_handler(make_capsule(native_update, update_name, ctypes.addressof(counter)))
+        loop.set_render_handler(make_capsule(native_render, render_name, 42))
+        self.assertEqual(loop.step(4, render=True), 4)
+        self.assertEqual(counter.value, 1.0)
+        self.assertEqual(calls, [42] * 4)
+
+        calls.clear()
+        loop.set_update_handler(make_capsule(native_batch, batch_name), batch=True)
+        loop.set_render_handler(None)
+        self.assertEqual(loop.step(2), 2)
+        self.assertEqual(calls, [(0.25, 1), (0.25, 1)])
+
+        with self.assertRaises(ValueError):
+            loop.set_update_handler(make_capsule(native_update, update_name), batch=True)
+        with self.assertRaises(ValueError):
+            loop.set_render_handler(make_capsule(native_render, update_name))
+        with self.assertRaises(TypeError):
+            loop.set_process_input_handler(make_capsule(native_update, update_name))
+
+
+    def test_start_in_thread(self):
+        """The loop runs on a native thread while the caller keeps going."""
+        for hold_gil in (False, True):
+            with self.subTest(hold_gil=hold_gil):
+                loop = gameloop_ext.GameLoop(fixed_time_step=0.001, hold_gil=hold_gil)
+                updates = []
+                loop.set_update_handler(updates.append)
+                self.assertTrue(loop.join())  # Nothing to join yet
+
+                loop.start_in_thread()
+                self.assertTrue(loop.is_running)
+                with self.assertRaises(RuntimeError):
+                    loop.start_in_thread()
+                self.assertFalse(loop.join(timeout=0.01))
+                deadline = time.perf_counter() + 2.0
+                while not updates and time.perf_counter() < deadline:
+                    time.sleep(0.001)
+                loop.stop()
+                self.assertTrue(loop.join(timeout=2.0))
+                self.assertFalse(loop.is_running)
+                self.assertGreater(len(updates), 0)
+
+                # Stopping before the thread gets going is not lost.
+                loop.start_in_thread()
+                loop.stop()
+                self.assertTrue(loop.join(timeout=2.0))
+
+    def test_change_handlers_while_running_in_thread(self):
+        """Handlers change only from the loop's own callbacks while it runs."""
+        render_name = gameloop_ext.RENDER_HANDLER_CAPSULE.encode()
+        rendered = []
+
+        @UPDATE_FUNC
+        def first_render(alpha, user_data):
+            rendered.append(1)
+
+        @UPDATE_FUNC
+        def second_render(alpha, user_data):
+            rendered.append(2)
+
+        loop = gameloop_ext.GameLoop(fixed_time_step=0.001)
+        swap = threading.Event()
+
+        def update(dt):
+            if swap.is_set():
+                swap.clear()
+                # The loop holds the only reference to the replaced capsule.
+                loop.set_render_handler(make_capsule(second_render, render_name))
+
+        loop.set_update_handler(update)
+        loop.set_render_handler(make_capsule(first_render, render_name))
+        loop.start_in_thread()
+        try:
+            for _ in range(50):
+                with self.assertRaisesRegex(RuntimeError, "another thread"):
+                    loop.set_render_handler(make_capsule(second_render, render_name))
+            with self.assertRaisesRegex(RuntimeError, "another thread"):
+                loop.set_update_handler(None)
+            with self.assertRaisesRegex(RuntimeError, "another thread"):
+                loop.enable_profiling()
+            with self.assertRaisesRegex(RuntimeError, "another thread"):
+                loop.time_scale = 2.0
+            swap.set()
+            deadline = time.perf_counter() + 2.0
+            while 2 not in rendered and time.perf_counter() < deadline:
+                time.sleep(0.001)
+        finally:
+            loop.stop()
+            self.assertTrue(loop.join(timeout=2.0))
+        self.assertIn(1, rendered)
+        self.assertIn(2, rendered)
+        self.assertEqual(rendered[rendered.index(2):], [2] * (len(rendered) - rendered.index(2)))
+        loop.set_render_handler(None)  # Allowed again once the loop has stopped
+
+    def test_start_in_thread_exception(self):
+        """The first handler exception stops the loop and is raised by join()."""
+        loop = gameloop_ext.GameLoop(fixed_time_step=0.001)
+        count = 0
+
+        def update(dt):
+            nonlocal count
+            count += 1
+            if count == 3:
+                raise ValueError("boom")
+
+        loop.set_update_handler(update)
+        loop.start_in_thread()
+        with self.assertRaisesRegex(ValueError, "boom"):
+            loop.join(timeout=2.0)
+        self.assertFalse(loop.is_running)
+        self.assertEqual(count, 3)
+        self.assertTrue(loop.join())  # Raised only once
+
+        # Joining from the loop thread itself is refused.
+        loop.set_update_handler(lambda dt: loop.join())
+        loop.start_in_thread()
+        with self.assertRaisesRegex(RuntimeError, "own thread"):
+            loop.join(timeout=2.0)
+
 
 if __name__ == "__main__":
     # Ensure gameloop_ext can be imported from the project root if tests are run directly
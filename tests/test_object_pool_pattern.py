@@ -2,10 +2,17 @@
 Tests for the Object Pool pattern.
 """
 
+import threading
+import time
 import unittest
 from typing import Optional
 
-from gamepp.patterns.object_pool import PooledObject, ObjectPool
+from gamepp.patterns.object_pool import (
+    PooledObject,
+    ObjectPool,
+    ConcurrentObjectPool,
+    ArrayObjectPool,
+)
 
 
 class MyUniqueResource(PooledObject):
@@ -164,6 +171,372 @@ class TestObjectPool(unittest.TestCase):
         ):
             ObjectPool(NonPooledObject, pool_size=1)  # type: ignore
 
+    def test_lazy_pool_constructs_on_demand(self):
+        pool = ObjectPool(MyUniqueResource, pool_size=3, lazy=True)
+        self.assertEqual(MyUniqueResource._next_id, 0)
+        self.assertEqual(
+            pool.get_pool_info(),
+            {"total_objects": 3, "used_objects": 0, "available_objects": 3},
+        )
+
+        r1 = pool.acquire_object()
+        self.assertEqual(MyUniqueResource._next_id, 1)
+        self.assertTrue(r1.is_in_use())
+        pool.release_object(r1)
+
+        # A released object is reused before a new one is constructed.
+        self.assertIs(pool.acquire_object(), r1)
+        r2 = pool.acquire_object()
+        r3 = pool.acquire_object()
+        self.assertEqual((r2.resource_id, r3.resource_id), (1, 2))
+        self.assertIsNone(pool.acquire_object())
+        self.assertEqual(MyUniqueResource._next_id, 3)
+
+    def test_deferred_reset_until_end_frame(self):
+        pool = ObjectPool(MyUniqueResource, pool_size=1, deferred_reset=True)
+        r1 = pool.acquire_object()
+        r1.set_data("frame data")
+
+        pool.release_object(r1)
+        pool.release_object(r1)  # Releasing twice queues it only once
+        self.assertEqual(r1.get_data(), "frame data")
+        self.assertIsNone(pool.acquire_object())
+
+        self.assertEqual(pool.end_frame(), 1)
+        self.assertFalse(r1.is_in_use())
+        self.assertIsNone(r1.get_data())
+        self.assertIs(pool.acquire_object(), r1)
+        self.assertEqual(pool.end_frame(), 0)
+
+    def test_end_frame_skips_objects_reset_before_it(self):
+        pool = ObjectPool(MyUniqueResource, pool_size=1, deferred_reset=True)
+        r1 = pool.acquire_object()
+        pool.release_object(r1)
+        r1.reset()  # Reset by its owner while waiting for end_frame().
+
+        self.assertIs(pool.acquire_object(), r1)
+        r1.set_data("new owner")
+        self.assertEqual(pool.end_frame(), 0)
+        self.assertTrue(r1.is_in_use())
+        self.assertEqual(r1.get_data(), "new owner")
+        self.assertEqual(pool.get_pool_info()["used_objects"], 1)
+
+        pool.release_object(r1)
+        self.assertEqual(pool.end_frame(), 1)
+        self.assertEqual(pool.get_pool_info()["used_objects"], 0)
+
+    def test_pool_options_do_not_capture_constructor_arguments(self):
+        class Texture(PooledObject):
+            def __init__(self, path="", lazy=False):
+                super().__init__()
+                self.path = path
+                self.lazy = lazy
+
+        # Without the option, the constructor keeps its own default.
+        pool = ObjectPool(Texture, 1, path="a.png")
+        self.assertFalse(pool.acquire_object().lazy)
+        # Given as a keyword, "lazy" would be ambiguous.
+        with self.assertRaisesRegex(ValueError, "'lazy' is both an ObjectPool option"):
+            ObjectPool(Texture, 1, lazy=True)
+        # Positionally it reaches the constructor.
+        pool = ObjectPool(Texture, 1, "b.png", True)
+        self.assertTrue(pool.acquire_object().lazy)
+        # Classes without such a parameter get the pool option.
+        pool = ObjectPool(MyUniqueResource, 1, lazy=True, deferred_reset=True)
+        self.assertEqual(MyUniqueResource._next_id, 0)
+
+    def test_pool_stats(self):
+        pool = ObjectPool(MyUniqueResource, pool_size=2, deferred_reset=True)
+        pool.enable_latency_tracking()
+        r1 = pool.acquire_object()
+        r2 = pool.acquire_object()
+        self.assertIsNone(pool.acquire_object())
+        pool.release_object(r1)
+        pool.release_object(r1)
+        self.assertEqual(pool.get_pool_info()["used_objects"], 2)
+        pool.end_frame()
+        self.assertEqual(pool.get_pool_info()["used_objects"], 1)
+        pool.release_object(r2)
+        pool.end_frame()
+
+        stats = pool.get_pool_stats()
+        self.assertEqual(stats["used_objects"], 0)
+        self.assertEqual(stats["peak_used_objects"], 2)
+        self.assertEqual(stats["acquire_count"], 2)
+        self.assertEqual(stats["release_count"], 2)
+        self.assertEqual(stats["exhaustion_count"], 1)
+        self.assertEqual(sum(stats["acquire_latency_ns"].values()), 3)
+
+    def test_counts_stay_right_when_objects_reset_themselves(self):
+        pool = ObjectPool(MyUniqueResource, pool_size=2)
+        r1 = pool.acquire_object()
+        pool.acquire_object()
+        r1.reset()  # The object returns itself to the pool.
+        self.assertEqual(
+            pool.get_pool_info(),
+            {"total_objects": 2, "used_objects": 1, "available_objects": 1},
+        )
+        self.assertIs(pool.acquire_object(), r1)
+        pool.release_object(r1)
+        info = pool.get_pool_info()
+        self.assertEqual(info["used_objects"], 1)
+        self.assertEqual(info["available_objects"], 1)
+        self.assertEqual(pool.get_pool_stats()["peak_used_objects"], 2)
+
+    def test_leak_detection_reports_call_site(self):
+        pool = ObjectPool(MyUniqueResource, pool_size=2)
+        self.assertEqual(pool.find_leaks(), [])
+        with self.assertRaises(ValueError):
+            pool.enable_leak_detection(0)
+        pool.enable_leak_detection(max_held_frames=2)
+
+        leaked = pool.acquire_object()
+        short_lived = pool.acquire_object()
+        pool.end_frame()
+        pool.release_object(short_lived)
+        pool.end_frame()
+        self.assertEqual(pool.find_leaks(), [])
+
+        pool.end_frame()
+        leaks = pool.find_leaks()
+        self.assertEqual(len(leaks), 1)
+        obj, frames_held, call_site = leaks[0]
+        self.assertIs(obj, leaked)
+        self.assertEqual(frames_held, 3)
+        self.assertIn("test_leak_detection_reports_call_site", call_site)
+        self.assertIn("test_object_pool_pattern.py", call_site)
+
+
+class TestConcurrentObjectPool(unittest.TestCase):
+    def setUp(self) -> None:
+        MyUniqueResource._next_id = 0
+
+    def test_single_thread_workflow(self):
+        pool = ConcurrentObjectPool(MyUniqueResource, pool_size=2, magazine_size=1)
+        r1 = pool.acquire_object()
+        r2 = pool.acquire_object()
+        self.assertIsNotNone(r1)
+        self.assertIsNotNone(r2)
+        self.assertEqual((r1.resource_id, r2.resource_id), (0, 1))
+        self.assertIsNone(pool.acquire_object())
+        self.assertEqual(
+            pool.get_pool_info(),
+            {"total_objects": 2, "used_objects": 2, "available_objects": 0},
+        )
+
+        r1.set_data("payload")
+        pool.release_object(r1)
+        self.assertFalse(r1.is_in_use())
+        self.assertIsNone(r1.get_data())
+        # A double release must not cache the object twice.
+        pool.release_object(r1)
+        self.assertIs(pool.acquire_object(), r1)
+        self.assertIsNone(pool.acquire_object())
+
+    def test_error_cases(self):
+        pool = ConcurrentObjectPool(MyUniqueResource, pool_size=1)
+        with self.assertRaisesRegex(
+            ValueError, "Object being released is not a PooledObject instance."
+        ):
+            pool.release_object(object())  # type: ignore
+        with self.assertRaisesRegex(
+            ValueError, "Object being released does not belong to this pool."
+        ):
+            pool.release_object(MyUniqueResource())
+        with self.assertRaisesRegex(
+            ValueError, "Magazine size must be a positive integer."
+        ):
+            ConcurrentObjectPool(MyUniqueResource, pool_size=1, magazine_size=0)
+        for option in ("lazy", "deferred_reset"):
+            with self.assertRaisesRegex(ValueError, "does not support the lazy"):
+                ConcurrentObjectPool(MyUniqueResource, 2, **{option: True})
+
+    def test_objects_are_never_shared_between_threads(self):
+        pool = ConcurrentObjectPool(MyUniqueResource, pool_size=32, magazine_size=2)
+        held = set()
+        held_lock = threading.Lock()
+        errors = []
+
+        def worker():
+            for _ in range(2000):
+                obj = pool.acquire_object()
+                if obj is None:
+                    continue
+                with held_lock:
+                    if id(obj) in held:
+                        errors.append(obj)
+                    held.add(id(obj))
+                with held_lock:
+                    held.discard(id(obj))
+                pool.release_object(obj)
+            pool.flush_local_cache()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(pool.get_pool_info()["used_objects"], 0)
+        acquired = [pool.acquire_object() for _ in range(32)]
+        self.assertEqual(len({id(obj) for obj in acquired if obj}), 32)
+
+    def test_concurrent_double_release_caches_once(self):
+        class SlowReset(MyUniqueResource):
+            def reset(self):
+                time.sleep(0.001)  # Widens the window between check and push
+                super().reset()
+
+        pool = ConcurrentObjectPool(SlowReset, pool_size=1, magazine_size=1)
+        for _ in range(20):
+            obj = pool.acquire_object()
+            barrier = threading.Barrier(4)
+
+            def release():
+                barrier.wait()
+                pool.release_object(obj)
+                pool.flush_local_cache()
+
+            threads = [threading.Thread(target=release) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertIs(pool.acquire_object(), obj)
+            self.assertIsNone(pool.acquire_object())
+            pool.release_object(obj)
+
+    def test_pool_stats(self):
+        pool = ConcurrentObjectPool(MyUniqueResource, pool_size=2, magazine_size=1)
+        pool.enable_latency_tracking()
+        pool.enable_leak_detection(max_held_frames=1)
+        held = pool.acquire_object()
+
+        results = []
+
+        def churn():
+            obj = pool.acquire_object()
+            results.append(pool.acquire_object())  # Exhausted
+            for _ in range(2):
+                pool.release_object(obj)
+                obj = pool.acquire_object()
+            pool.release_object(obj)
+            pool.flush_local_cache()
+
+        # The worker's counters outlive it.
+        thread = threading.Thread(target=churn)
+        thread.start()
+        thread.join()
+        self.assertEqual(results, [None])
+        other = pool.acquire_object()
+        pool.release_object(other)
+        pool.release_object(other)  # A double release is not counted
+
+        stats = pool.get_pool_stats()
+        self.assertEqual(stats["used_objects"], 1)
+        self.assertEqual(stats["peak_used_objects"], 2)
+        self.assertEqual(stats["acquire_count"], 5)
+        self.assertEqual(stats["release_count"], 4)
+        self.assertEqual(stats["exhaustion_count"], 1)
+        self.assertEqual(sum(stats["acquire_latency_ns"].values()), 6)
+
+        pool.end_frame()
+        pool.end_frame()
+        leaks = pool.find_leaks()
+        self.assertEqual([(obj, frames) for obj, frames, _ in leaks], [(held, 2)])
+        self.assertIn("test_pool_stats", leaks[0][2])
+
+    def test_exited_thread_returns_its_magazine(self):
+        pool = ConcurrentObjectPool(MyUniqueResource, pool_size=4, magazine_size=4)
+
+        def hold_and_release():
+            objs = [pool.acquire_object() for _ in range(4)]
+            for obj in objs:
+                pool.release_object(obj)
+
+        thread = threading.Thread(target=hold_and_release)
+        thread.start()
+        thread.join()
+
+        acquired = [pool.acquire_object() for _ in range(4)]
+        self.assertTrue(all(obj is not None for obj in acquired))
+
+
+class TestArrayObjectPool(unittest.TestCase):
+    def test_slot_views_read_and_write_columns(self):
+        pool = ArrayObjectPool({"x": "d", "y": "d", "ttl": "i"}, pool_size=3)
+        self.assertEqual(pool.field_names, ["x", "y", "ttl"])
+
+        bullet = pool.acquire()
+        self.assertEqual(bullet.slot, 0)
+        bullet.x = 1.5
+        bullet.ttl = 30
+        self.assertEqual(pool.column("x")[0], 1.5)
+        self.assertEqual(pool.column("ttl")[0], 30)
+        self.assertTrue(pool.is_in_use(0))
+        self.assertEqual(
+            pool.get_pool_info(),
+            {"total_objects": 3, "used_objects": 1, "available_objects": 2},
+        )
+        with self.assertRaises(AttributeError):
+            bullet.z = 1.0
+
+        pool.release(bullet)
+        self.assertFalse(bullet.is_valid())
+        self.assertEqual(pool.column("x")[0], 0.0)
+        self.assertEqual(pool.column("ttl")[0], 0)
+
+        # A stale view must not release the slot's new owner.
+        reused = pool.acquire()
+        self.assertEqual(reused.slot, 0)
+        pool.release(bullet)
+        self.assertTrue(reused.is_valid())
+        self.assertTrue(pool.is_in_use(0))
+
+        # Nor read or write its fields.
+        reused.x = 2.5
+        with self.assertRaisesRegex(ValueError, "Slot view is stale"):
+            bullet.x
+        with self.assertRaisesRegex(ValueError, "Slot view is stale"):
+            bullet.x = 9.0
+        self.assertEqual(reused.x, 2.5)
+        self.assertEqual(repr(bullet), "PooledSlotView(slot=0, stale)")
+
+    def test_exhaustion_and_slot_api(self):
+        pool = ArrayObjectPool({"value": "i"}, pool_size=2)
+        self.assertEqual([pool.acquire_slot(), pool.acquire_slot()], [0, 1])
+        self.assertIsNone(pool.acquire_slot())
+        self.assertIsNone(pool.acquire())
+        pool.release_slot(1)
+        pool.release_slot(1)  # Already free, ignored
+        self.assertEqual(pool.acquire_slot(), 1)
+        self.assertIsNone(pool.acquire_slot())
+
+    def test_error_cases(self):
+        with self.assertRaisesRegex(
+            ValueError, "Pool size must be a positive integer."
+        ):
+            ArrayObjectPool({"x": "d"}, pool_size=0)
+        with self.assertRaises(ValueError):
+            ArrayObjectPool({}, pool_size=1)
+        for typecode in ("not a typecode", "fd", "u", 5):
+            with self.assertRaisesRegex(ValueError, "Unsupported typecode"):
+                ArrayObjectPool({"x": typecode}, pool_size=1)
+        with self.assertRaises(ValueError):
+            ArrayObjectPool({"slot": "i"}, pool_size=1)
+
+        pool = ArrayObjectPool({"x": "d"}, pool_size=1)
+        other = ArrayObjectPool({"x": "d"}, pool_size=1)
+        with self.assertRaisesRegex(
+            ValueError, "Slot being released does not belong to this pool."
+        ):
+            pool.release_slot(5)
+        with self.assertRaisesRegex(
+            ValueError, "View being released does not belong to this pool."
+        ):
+            pool.release(other.acquire())
+
 
 if __name__ == "__main__":
     unittest.main()
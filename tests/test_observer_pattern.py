@@ -1,5 +1,10 @@
 import unittest
-from gamepp.patterns.observer import Subject, ObserverMixin, LinkedSubject
+from gamepp.patterns.observer import (
+    CopyOnWriteSubject,
+    LinkedSubject,
+    ObserverMixin,
+    Subject,
+)
 from typing import Any
 
 
@@ -276,16 +281,69 @@ class TestLinkedSubjectObserverPattern(unittest.TestCase):
         self.assertEqual(self.test_observer.received_data.get("details"), event_payload)
 
     def test_attach_same_observer_multiple_times_linked(self):
-        self.event_manager.attach(self.test_observer)
+        node = self.event_manager.attach(self.test_observer)
         self.assertEqual(self.test_observer.attached_to_subject_calls, 1)
         self.assertEqual(len(self.test_observer.subjects), 1)
 
-        self.event_manager.attach(self.test_observer)
-        self.assertEqual(self.test_observer.attached_to_subject_calls, 2)
+        self.assertIs(self.event_manager.attach(self.test_observer), node)
+        self.assertEqual(self.test_observer.attached_to_subject_calls, 1)
         self.assertEqual(len(self.test_observer.subjects), 1)
+        self.assertEqual(len(self.event_manager), 1)
 
         self.event_manager.trigger_event("MULTI_ATTACH_LINKED_TEST")
-        self.assertEqual(self.test_observer.notification_count, 2)
+        self.assertEqual(self.test_observer.notification_count, 1)
+
+    def test_attach_returns_node_handle_linked(self):
+        node = self.event_manager.attach(self.test_observer)
+        self.assertIs(node.observer, self.test_observer)
+        self.assertTrue(node.active)
+        self.assertIn(self.test_observer, self.event_manager)
+        self.assertFalse(hasattr(node, "__dict__"))
+
+        self.event_manager.detach(self.test_observer)
+        self.assertFalse(node.active)
+        self.assertNotIn(self.test_observer, self.event_manager)
+        self.assertIsNone(self.event_manager._head)
+        self.assertIsNone(self.event_manager._tail)
+
+    def test_detach_during_notify_linked(self):
+        subject = LinkedSubject()
+        log = []
+        a = RecordingObserver("a", log)
+        b = RecordingObserver("b", log)
+        c = RecordingObserver("c", log)
+        d = RecordingObserver("d", log)
+        # a detaches itself and b; c detaches itself (the tail) and attaches d.
+        a.action = lambda s: (s.detach(a), s.detach(b))
+        c.action = lambda s: (s.detach(c), s.attach(d))
+        for observer in (a, b, c):
+            subject.attach(observer)
+
+        subject.notify(1)
+        self.assertEqual(log, [("a", 1), ("c", 1)])
+        subject.notify(2)
+        self.assertEqual(log[2:], [("d", 2)])
+        self.assertEqual(len(subject), 1)
+        self.assertIs(subject._head, subject._tail)
+
+    def test_detach_tail_then_attach_during_notify_linked(self):
+        subject = LinkedSubject()
+        log = []
+        a = RecordingObserver("a", log)
+        b = RecordingObserver("b", log)
+        c = RecordingObserver("c", log)
+        # a detaches the tail b and attaches c, which attaches a new
+        # observer whenever it is notified.
+        a.action = lambda s: (s.detach(b), s.attach(c))
+        c.action = lambda s: s.attach(RecordingObserver("new", log))
+        subject.attach(a)
+        subject.attach(b)
+
+        subject.notify(1)
+        self.assertEqual(log, [("a", 1)])
+        subject.notify(2)
+        self.assertEqual(log[1:], [("a", 2), ("c", 2)])
+        self.assertEqual(len(subject), 3)
 
     def test_detach_non_attached_observer_linked(self):
         initial_detached_calls = self.test_observer.detached_from_subject_calls
@@ -308,5 +366,73 @@ class TestLinkedSubjectObserverPattern(unittest.TestCase):
             )
 
 
+class RecordingObserver(ObserverMixin):
+    """Records notifications into a shared log and runs an optional action."""
+
+    def __init__(self, name, log, action=None):
+        super().__init__()
+        self.name = name
+        self.log = log
+        self.action = action
+
+    def on_notify(self, subject: Any, event_data: Any = None) -> None:
+        self.log.append((self.name, event_data))
+        if self.action is not None:
+            self.action(subject)
+
+    def __eq__(self, other):
+        return True  # Membership must go by identity, not equality
+
+    __hash__ = ObserverMixin.__hash__
+
+
+class TestCopyOnWriteSubject(unittest.TestCase):
+    def setUp(self):
+        self.subject = CopyOnWriteSubject()
+        self.log = []
+        self.a = RecordingObserver("a", self.log)
+        self.b = RecordingObserver("b", self.log)
+
+    def test_attach_notify_detach(self):
+        self.subject.attach(self.a)
+        self.subject.attach(self.b)
+        self.subject.attach(self.a)
+        self.assertEqual(len(self.subject), 2)
+        self.assertIn(self.b, self.subject)
+        self.assertEqual(self.a.subjects, [self.subject])
+        self.subject.notify(1)
+        self.assertEqual(self.log, [("a", 1), ("b", 1)])
+
+        self.subject.detach(self.a)
+        self.subject.detach(self.a)
+        self.assertNotIn(self.a, self.subject)
+        self.assertEqual(self.a.subjects, [])
+        self.subject.notify(2)
+        self.assertEqual(self.log[2:], [("b", 2)])
+        self.assertEqual(self.subject.observers, [self.b])
+
+    def test_snapshot_is_rebuilt_only_on_change(self):
+        self.subject.attach(self.a)
+        self.subject.notify()
+        snapshot = self.subject._snapshot
+        self.subject.notify()
+        self.assertIs(self.subject._snapshot, snapshot)
+        self.subject.attach(self.b)
+        self.subject.notify()
+        self.assertIsNot(self.subject._snapshot, snapshot)
+        self.assertEqual(len(self.subject._snapshot), 2)
+
+    def test_attach_and_detach_during_notify(self):
+        c = RecordingObserver("c", self.log)
+        self.a.action = lambda subject: (subject.detach(self.a), subject.attach(c))
+        self.subject.attach(self.a)
+        self.subject.attach(self.b)
+        self.subject.notify(1)
+        # The running notification keeps its snapshot.
+        self.assertEqual(self.log, [("a", 1), ("b", 1)])
+        self.subject.notify(2)
+        self.assertEqual(self.log[2:], [("b", 2), ("c", 2)])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,14 @@
+import threading
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 from unittest.mock import MagicMock
 
-from gamepp.patterns.update_method import UpdateMethodManager, Entity
+from gamepp.patterns.update_method import (
+    Entity,
+    System,
+    SystemScheduler,
+    UpdateMethodManager,
+)
 from gamepp.patterns.game_loop import GameLoop  # For integration example/test
 
 
@@ -20,6 +27,23 @@ class ConcreteEntity:
         return f"ConcreteEntity(name='{self.name}')"
 
 
+class Position:
+    pass
+
+
+class Velocity:
+    pass
+
+
+class Health:
+    pass
+
+
+def integrate(dt: float) -> float:
+    """A picklable system update for process pools."""
+    return sum(i * dt for i in range(1000))
+
+
 class TestUpdateMethod(unittest.TestCase):
     def setUp(self):
         self.manager = UpdateMethodManager()
@@ -159,5 +183,135 @@ class TestUpdateMethod(unittest.TestCase):
         )
 
 
+class TestSystemScheduler(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = SystemScheduler(max_workers=4)
+        self.addCleanup(self.scheduler.close)
+        self.log = []
+
+    def logger(self, name):
+        return lambda dt: self.log.append(name)
+
+    def test_conflicts(self):
+        move = System(print, reads=[Velocity], writes=[Position])
+        self.assertTrue(move.conflicts_with(System(print, reads=[Position])))
+        self.assertTrue(move.conflicts_with(System(print, writes=[Velocity])))
+        self.assertFalse(move.conflicts_with(System(print, reads=[Velocity], writes=[Health])))
+        self.assertFalse(System(print, reads=[Position]).conflicts_with(System(print, reads=[Position])))
+        self.assertTrue(System(print, exclusive=True).conflicts_with(System(print)))
+
+    def test_independent_systems_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+        self.scheduler.add_system(lambda dt: barrier.wait(), writes=[Position])
+        self.scheduler.add_system(lambda dt: barrier.wait(), writes=[Health])
+        self.scheduler.update_all(0.1)  # Would time out if run one after the other
+
+    def test_conflicting_systems_keep_registration_order(self):
+        state = {"position": 0.0, "velocity": 1.0}
+
+        def accelerate(dt):
+            state["velocity"] *= 2
+
+        def move(dt):
+            state["position"] += state["velocity"] * dt
+
+        self.scheduler.add_system(accelerate, writes=[Velocity])
+        self.scheduler.add_system(move, reads=[Velocity], writes=[Position])
+        self.scheduler.add_system(self.logger("heal"), writes=[Health])
+        for _ in range(3):
+            self.scheduler.update_all(1.0)
+        self.assertEqual(state, {"position": 14.0, "velocity": 8.0})
+        self.assertEqual(self.log, ["heal"] * 3)
+        self.assertEqual(self.scheduler._dependency_graph()[1:], ([[1], [], []], [0, 1, 0]))
+
+    def test_apply_runs_on_the_scheduler_thread(self):
+        results = []
+
+        def apply(result):
+            results.append((result, threading.current_thread()))
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            scheduler = SystemScheduler(executor)
+            scheduler.add_system(integrate, writes=[Position], apply=apply)
+            scheduler.add_system(integrate, writes=[Health], apply=apply)
+            scheduler.update_all(0.5)
+            scheduler.close()  # Does not shut down an executor it was given
+        self.assertEqual([r for r, _ in results], [integrate(0.5)] * 2)
+        self.assertTrue(all(t is threading.current_thread() for _, t in results))
+
+    def test_local_systems_run_on_the_calling_thread(self):
+        threads = {}
+        self.scheduler.add_system(
+            lambda dt: threads.__setitem__("worker", threading.current_thread()), writes=[Position]
+        )
+        self.scheduler.add_system(
+            lambda dt: threads.__setitem__("local", threading.current_thread()),
+            reads=[Position],
+            local=True,
+        )
+        self.scheduler.add_system(self.logger("after"), reads=[Position], writes=[Health])
+        self.scheduler.update_all(0.1)
+        self.assertIs(threads["local"], threading.current_thread())
+        self.assertIsNot(threads["worker"], threading.current_thread())
+        self.assertEqual(self.log, ["after"])
+
+    def test_systems_changed_during_a_frame_take_effect_next_frame(self):
+        def reconfigure(dt):
+            self.log.append("reconfigure")
+            if doomed in self.scheduler._systems:
+                self.scheduler.remove_system(doomed)
+                self.scheduler.add_system(self.logger("added"), reads=[Health])
+
+        self.scheduler.add_system(reconfigure, writes=[Position], local=True)
+        doomed = self.scheduler.add_system(self.logger("doomed"), reads=[Position])
+        self.scheduler.add_system(self.logger("heal"), writes=[Health])
+        self.scheduler.update_all(0.1)
+        self.assertEqual(sorted(self.log), ["doomed", "heal", "reconfigure"])
+        self.log.clear()
+        self.scheduler.update_all(0.1)
+        self.assertEqual(self.log, ["reconfigure", "heal", "added"])
+
+    def test_exceptions(self):
+        def fail(message):
+            def update(dt):
+                raise ValueError(message)
+
+            return update
+
+        self.scheduler.add_system(fail("first"), writes=[Position])
+        self.scheduler.add_system(fail("second"), writes=[Health])
+        self.scheduler.add_system(self.logger("after"), reads=[Position])
+        with self.assertRaisesRegex(ValueError, "first"):
+            self.scheduler.update_all(0.1)
+        self.assertEqual(self.log, [])
+
+    def test_entities_run_exclusively(self):
+        entity = ConcreteEntity("E")
+        self.scheduler.add_system(self.logger("physics"), writes=[Position])
+        self.scheduler.add_entity(entity)
+        self.scheduler.add_entity(entity)
+        self.assertEqual(len(self.scheduler.systems), 2)
+        self.scheduler.update_all(0.1)
+        self.assertEqual(entity.updates_called, 1)
+        self.assertEqual(self.scheduler._dependency_graph()[2], [0, 1])
+
+        self.scheduler.remove_entity(entity)
+        self.assertEqual(len(self.scheduler.systems), 1)
+        self.assertEqual(self.scheduler.entities, [])
+
+    def test_serial_and_game_loop_integration(self):
+        with SystemScheduler(max_workers=1) as scheduler:
+            scheduler.add_system(self.logger("a"), writes=[Position])
+            system = scheduler.add_system(self.logger("b"), writes=[Health])
+            loop = GameLoop(fixed_time_step=0.1)
+            loop.set_update_handler(scheduler.update_all)
+            loop.step(2)
+            scheduler.remove_system(system)
+            loop.step(1)
+        self.assertEqual(self.log, ["a", "b", "a", "b", "a"])
+        with self.assertRaises(ValueError):
+            SystemScheduler(max_workers=0)
+
+
 if __name__ == "__main__":
     unittest.main()